@@ -0,0 +1,65 @@
+"""Compare send_custom_response with the previous pydantic APIResponse path.
+
+Run from the repository root:
+
+    python benchmarks/bench_custom_response.py [n_bookings]
+"""
+import os
+import sys
+import timeit
+from datetime import datetime, timezone, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from common.models.bookings import Booking  # noqa: E402
+from common.models.rooms import Category  # noqa: E402
+from common.utils.custom_response import APIResponse, send_custom_response  # noqa: E402
+
+
+def _bookings(n: int) -> list[Booking]:
+    now = datetime.now(timezone.utc)
+    return [
+        Booking(
+            booking_id=f"b{i}",
+            user_id="u1",
+            user_email="guest@example.com",
+            room_id=f"r{i % 50}",
+            category=Category.DELUXE,
+            checkin=now + timedelta(days=i),
+            checkout=now + timedelta(days=i + 2),
+            price_per_night=1500.0,
+        )
+        for i in range(n)
+    ]
+
+
+def _pydantic_response(status_code, message, data=None):
+    return {
+        "statusCode": status_code,
+        "headers": {"Content-Type": "application/json"},
+        "body": APIResponse(
+            status_code=status_code, message=message, data=data
+        ).model_dump_json(exclude_none=True),
+    }
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    data = {"count": n, "bookings": _bookings(n)}
+
+    assert (
+        send_custom_response(200, "ok", data)["body"]
+        == _pydantic_response(200, "ok", data)["body"]
+    ), "serializer output differs from pydantic"
+
+    rounds = 20
+    for label, fn in (
+        ("pydantic APIResponse", _pydantic_response),
+        ("send_custom_response", send_custom_response),
+    ):
+        best = min(timeit.repeat(lambda: fn(200, "ok", data), number=rounds, repeat=5))
+        print(f"{label:<22} {n} bookings: {best / rounds * 1000:.3f} ms/response")
+
+
+if __name__ == "__main__":
+    main()
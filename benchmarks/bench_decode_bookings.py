@@ -0,0 +1,72 @@
+"""Decode booking items with the shared decoder versus the previous inline code.
+
+Run from the repository root:
+
+    python benchmarks/bench_decode_bookings.py [n_items]
+"""
+import os
+import sys
+import timeit
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from common.models.bookings import Booking, BookingStatus  # noqa: E402
+from common.models.rooms import Category  # noqa: E402
+from common.repository.decoders import decode_booking, parse_timestamp  # noqa: E402
+from common.utils.datetime_normaliser import from_iso_string  # noqa: E402
+
+
+def _items(n: int) -> list[dict]:
+    start = datetime(2026, 1, 1, 14, tzinfo=timezone.utc)
+    items = []
+    for i in range(n):
+        checkin = start + timedelta(days=i % 365)
+        items.append({
+            "pk": "USER#u1",
+            "sk": f"BOOKING#{checkin.isoformat()}#b{i}",
+            "booking_id": f"b{i}",
+            "room_id": f"r{i % 50}",
+            "category": ("DELUXE", "SUITE", "STANDARD")[i % 3],
+            "booking_status": ("UPCOMING", "CHECKED_IN", "CHECKED_OUT")[i % 3],
+            "check_in": checkin.isoformat(),
+            "check_out": (checkin + timedelta(days=2)).isoformat(),
+            "price_per_night": Decimal("1500.0"),
+            "booked_at": (start - timedelta(seconds=i)).isoformat(),
+            "user_email": "guest@example.com",
+        })
+    return items
+
+
+def _inline_decode(item: dict, user_id: str) -> Booking:
+    return Booking(
+        booking_id=item["sk"].rsplit("#", 1)[1],
+        user_id=user_id,
+        room_id=item["room_id"],
+        category=Category(item["category"]),
+        status=BookingStatus(item["booking_status"]),
+        checkin=from_iso_string(item["check_in"]),
+        checkout=from_iso_string(item["check_out"]),
+        price_per_night=float(item["price_per_night"]),
+        booked_at=datetime.fromisoformat(item["booked_at"]),
+        user_email=item.get("user_email"),
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    items = _items(n)
+
+    rounds = 5
+    for label, fn in (
+        ("inline Enum()/fromisoformat", lambda: [_inline_decode(i, "u1") for i in items]),
+        ("decode_booking (cold cache)", lambda: (parse_timestamp.cache_clear(), [decode_booking(i, user_id="u1") for i in items])),
+        ("decode_booking (warm cache)", lambda: [decode_booking(i, user_id="u1") for i in items]),
+    ):
+        best = min(timeit.repeat(fn, number=rounds, repeat=5))
+        print(f"{label:<28} {n} items: {best / rounds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,10 @@ class BookingStatus(str, Enum):
     UPCOMING = "UPCOMING"
     CHECKED_IN = "CHECKED_IN"
     CHECKED_OUT = "CHECKED_OUT"
+    CANCELLED = "CANCELLED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Booking:
     booking_id: str
     user_id: str
@@ -29,3 +30,15 @@ class Booking:
     booked_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+
+
+@dataclass(slots=True)
+class Hold:
+    hold_id: str
+    user_id: str
+    room_id: str
+    category: Category
+    checkin: datetime
+    checkout: datetime
+    price_per_night: float
+    expires_at: datetime
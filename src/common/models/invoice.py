@@ -3,7 +3,7 @@ from datetime import datetime
 from common.models.rooms import Category
 
 
-@dataclass
+@dataclass(slots=True)
 class Invoice:
     booking_id: str
     user_email: str
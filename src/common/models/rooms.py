@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from dataclasses import dataclass
+from datetime import date, datetime
 
 
 class Category(str, Enum):
@@ -9,7 +10,7 @@ class Category(str, Enum):
     STANDARD = "STANDARD"
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomType:
     name: Category
     price_per_night: float
@@ -22,9 +23,45 @@ class RoomStatus(str, Enum):
     MAINTENANCE = "MAINTENANCE"
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     room_id: str
     category: Category
     status: RoomStatus = RoomStatus.AVAILABLE
     floor: Optional[int] = None
+
+
+@dataclass(slots=True)
+class HousekeepingTask:
+    room_id: str
+    booking_id: str
+    checked_out_at: datetime
+
+
+@dataclass(slots=True)
+class CategoryAvailability:
+    category: Category
+    price_per_night: Optional[float]
+    room_ids: List[str]
+
+
+@dataclass(slots=True)
+class NightAvailability:
+    night: date
+    free_rooms: int
+
+
+@dataclass(slots=True)
+class StayOption:
+    checkin: date
+    checkout: date
+    free_rooms: int
+
+
+@dataclass(slots=True)
+class FreeRoom:
+    room_id: str
+    # neighbouring stays seen by the availability read; None when there is
+    # no such stay within the range that was read
+    previous_checkout: Optional[datetime] = None
+    next_checkin: Optional[datetime] = None
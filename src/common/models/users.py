@@ -8,7 +8,7 @@ class UserRole(Enum):
     CUSTOMER = "CUSTOMER"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     user_id: str
     email: str
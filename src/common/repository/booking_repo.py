@@ -1,12 +1,17 @@
 from botocore.exceptions import ClientError
 import logging
-from typing import Optional, List
-from boto3.dynamodb.conditions import Key
-from common.models.bookings import Booking, BookingStatus
+from typing import Optional, List, Iterator, Tuple
+from boto3.dynamodb.conditions import Key, Attr
+from common.models.bookings import Booking, BookingStatus, Hold
 from common.models.rooms import Category, RoomStatus
-from common.utils.datetime_normaliser import from_iso_string
+from common.repository.decoders import decode_booking, decode_hold
+from common.repository.outbox_repo import OutboxRepository
+from common.utils.datetime_normaliser import to_timestamp, to_epoch_seconds
+from common.utils.occupancy import stay_nights
+from common.utils.custom_exceptions import InvalidCursor, NotFoundException, RoomTaken
+from common.utils.constants import IDEMPOTENCY_HOURS
 from decimal import Decimal
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone, timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,6 +24,12 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# an availability slot is free to take if nothing holds it or only an
+# expired hold does (TTL deletion lags expiry)
+SLOT_FREE_CONDITION = "attribute_not_exists(sk) OR hold_expires_at < :now"
+# cancellation reasons meaning another writer got the room's slot first
+ROOM_TAKEN_CODES = ("ConditionalCheckFailed", "TransactionConflict")
+
 
 class BookingRepository:
     def __init__(self, table: Table, client: DynamoDBClient = None):
@@ -27,19 +38,90 @@ class BookingRepository:
 
     @staticmethod
     def _iso(dt: datetime | str) -> str:
-        if isinstance(dt, str):
-            parsed = datetime.fromisoformat(dt)
-        else:
-            parsed = dt
+        return to_timestamp(dt)
+
+    @staticmethod
+    def user_booking_sk(checkin_iso: str, booking_id: str) -> str:
+        return f"BOOKING#{checkin_iso}#{booking_id}"
 
-        if parsed.tzinfo is None:
-            raise ValueError("Datetime must be timezone-aware")
+    @staticmethod
+    def availability_sk(checkin_iso: str, room_id: str) -> str:
+        return f"CHECKIN#{checkin_iso}#ROOM#{room_id}"
+
+    @staticmethod
+    def checkout_index_sk(checkout_iso: str, room_id: str) -> str:
+        return f"CHECKOUT#{checkout_iso}#ROOM#{room_id}"
 
-        return parsed.astimezone(timezone.utc).isoformat()
+    @staticmethod
+    def night_sk(night: date) -> str:
+        return f"NIGHT#{night.isoformat()}"
 
-    def add_booking(self, booking: Booking):
+    def _night_puts(
+        self, room_id: str, start: datetime, end: datetime, attributes: dict, condition: dict
+    ) -> list[dict]:
+        """One lock item per night of the room between start and end.
+
+        Stays that overlap share a night whatever their check-in times, so
+        the conditional puts make a second booking of the same nights fail.
+        """
+        return [
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": {"pk": f"ROOM#{room_id}", "sk": self.night_sk(night), **attributes},
+                    **condition,
+                }
+            }
+            for night in stay_nights(start, end)
+        ]
+
+    def _night_deletes(
+        self, room_id: str, start: datetime, end: datetime, booking_id: str
+    ) -> list[dict]:
+        # locks missing from bookings made before they existed are no error
+        return [
+            {
+                "Delete": {
+                    "TableName": self.table.name,
+                    "Key": {"pk": f"ROOM#{room_id}", "sk": self.night_sk(night)},
+                    "ConditionExpression": "attribute_not_exists(pk) OR booking_id = :booking_id",
+                    "ExpressionAttributeValues": {":booking_id": booking_id},
+                }
+            }
+            for night in stay_nights(start, end)
+        ]
+
+    def _user_bookings_key_condition(
+        self,
+        user_id: str,
+        checkin_from: Optional[datetime] = None,
+        checkin_to: Optional[datetime] = None,
+    ):
+        condition = Key("pk").eq(f"USER#{user_id}")
+        if checkin_from is None and checkin_to is None:
+            return condition & Key("sk").begins_with("BOOKING#")
+
+        # "$" sorts right after "#", so "BOOKING#<to>$" is above every
+        # "BOOKING#<to>#<id>" key and "BOOKING$" is above every booking key
+        lower = f"BOOKING#{self._iso(checkin_from)}" if checkin_from else "BOOKING#"
+        upper = f"BOOKING#{self._iso(checkin_to)}$" if checkin_to else "BOOKING$"
+        return condition & Key("sk").between(lower, upper)
+
+    def _booking_transact_items(self, booking: Booking, hold_id: Optional[str] = None) -> list[dict]:
+        """The booking's items; with hold_id they may only replace that hold's."""
         checkin_iso = self._iso(booking.checkin)
         checkout_iso = self._iso(booking.checkout)
+        now = to_epoch_seconds(datetime.now(timezone.utc))
+        if hold_id is None:
+            slot_condition = {
+                "ConditionExpression": SLOT_FREE_CONDITION,
+                "ExpressionAttributeValues": {":now": now},
+            }
+        else:
+            slot_condition = {
+                "ConditionExpression": "hold_id = :hold_id AND hold_expires_at >= :now",
+                "ExpressionAttributeValues": {":hold_id": hold_id, ":now": now},
+            }
 
         booking_item = {
             "pk": f"BOOKING#{booking.booking_id}",
@@ -57,7 +139,8 @@ class BookingRepository:
 
         user_booking = {
             "pk": f"USER#{booking.user_id}",
-            "sk": f"BOOKING#{booking.booking_id}",
+            "sk": self.user_booking_sk(checkin_iso, booking.booking_id),
+            "booking_id": booking.booking_id,
             "check_in": checkin_iso,
             "check_out": checkout_iso,
             "category": booking.category.value,
@@ -77,11 +160,159 @@ class BookingRepository:
         }
         availability_item = {
             "pk": f"CATEGORY#{booking.category.value}",
-            "sk": f"CHECKIN#{checkin_iso}#ROOM#{booking.room_id}",
+            "sk": self.availability_sk(checkin_iso, booking.room_id),
             "room_id": booking.room_id,
             "checkout": checkout_iso,
             "booking_id": booking.booking_id,
-            "ttl_attribute": int(booking.checkout.timestamp()),
+            "ttl_attribute": to_epoch_seconds(booking.checkout),
+        }
+        # same stay keyed by checkout, so availability searches can start at
+        # the requested check-in instead of MAX_STAY days before it
+        checkout_item = {
+            "pk": f"CATEGORY#{booking.category.value}",
+            "sk": self.checkout_index_sk(checkout_iso, booking.room_id),
+            "room_id": booking.room_id,
+            "checkin": checkin_iso,
+            "booking_id": booking.booking_id,
+            "ttl_attribute": to_epoch_seconds(booking.checkout),
+        }
+        # the checkout schedule is created from this entry after commit, so
+        # a booking never exists without one and never waits on the scheduler
+        outbox_item = OutboxRepository.schedule_checkout_item(
+            booking.booking_id, booking.user_id, booking.room_id, checkout_iso
+        )
+
+        return [
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": booking_item,
+                    "ConditionExpression": "attribute_not_exists(pk)",
+                }
+            },
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": user_booking,
+                }
+            },
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": room_booking,
+                }
+            },
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": availability_item,
+                    **slot_condition,
+                }
+            },
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": checkout_item,
+                }
+            },
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": outbox_item,
+                }
+            },
+            *self._night_puts(
+                booking.room_id,
+                booking.checkin,
+                booking.checkout,
+                {"booking_id": booking.booking_id, "ttl_attribute": to_epoch_seconds(booking.checkout)},
+                slot_condition,
+            ),
+        ]
+
+    @staticmethod
+    def idempotency_key(user_id: str, key: str) -> dict:
+        # scoped per user so one guest's key never replays another's booking
+        return {"pk": f"IDEMPOTENCY#{key}", "sk": f"USER#{user_id}"}
+
+    def get_idempotency_record(self, user_id: str, key: str) -> Optional[dict]:
+        """The stored result for an Idempotency-Key, if it has not expired."""
+        try:
+            response = self.table.get_item(Key=self.idempotency_key(user_id, key))
+        except ClientError as err:
+            logger.error(f"Error retrieving idempotency key {key}: {err}")
+            raise
+
+        item = response.get("Item")
+        # TTL deletion lags expiry
+        if not item or item["ttl_attribute"] < to_epoch_seconds(datetime.now(timezone.utc)):
+            return None
+        return item
+
+    def add_booking(
+        self,
+        booking: Booking,
+        idempotency_key: Optional[str] = None,
+        request_hash: Optional[str] = None,
+    ) -> bool:
+        """Write the booking; with an idempotency key, record it in the same transaction.
+
+        Returns False when another request already stored a result under the
+        key, in which case nothing is written. Raises RoomTaken when a
+        concurrent booking or hold got the room first.
+        """
+        items = self._booking_transact_items(booking)
+        if idempotency_key:
+            now = datetime.now(timezone.utc)
+            items.append(
+                {
+                    "Put": {
+                        "TableName": self.table.name,
+                        "Item": {
+                            **self.idempotency_key(booking.user_id, idempotency_key),
+                            "booking_id": booking.booking_id,
+                            "request_hash": request_hash,
+                            "created_at": self._iso(now),
+                            "ttl_attribute": to_epoch_seconds(
+                                now + timedelta(hours=IDEMPOTENCY_HOURS)
+                            ),
+                        },
+                        "ConditionExpression": "attribute_not_exists(pk) OR ttl_attribute < :now",
+                        "ExpressionAttributeValues": {":now": to_epoch_seconds(now)},
+                    }
+                }
+            )
+        try:
+            self.client.transact_write_items(TransactItems=items)
+
+        except ClientError as err:
+            reasons = err.response.get("CancellationReasons", [])
+            if (
+                idempotency_key
+                and len(reasons) == len(items)
+                and reasons[-1].get("Code") == "ConditionalCheckFailed"
+            ):
+                return False
+            if any(r.get("Code") in ROOM_TAKEN_CODES for r in reasons):
+                raise RoomTaken(booking.room_id) from err
+            logger.error(f"Error creating booking {booking.booking_id}: {err}")
+            raise
+        return True
+
+    def add_hold(self, hold: Hold) -> bool:
+        """Reserve the room with the same availability items a booking uses.
+
+        The items carry hold_id and hold_expires_at and expire by TTL; until
+        then searches treat the room as booked. Returns False when the slot
+        was taken meanwhile.
+        """
+        checkin_iso = self._iso(hold.checkin)
+        checkout_iso = self._iso(hold.checkout)
+        expires_at = to_epoch_seconds(hold.expires_at)
+        hold_attributes = {
+            "hold_id": hold.hold_id,
+            "hold_expires_at": expires_at,
+            "ttl_attribute": expires_at,
         }
 
         try:
@@ -90,71 +321,199 @@ class BookingRepository:
                     {
                         "Put": {
                             "TableName": self.table.name,
-                            "Item": booking_item,
+                            "Item": {
+                                "pk": f"HOLD#{hold.hold_id}",
+                                "sk": "DETAILS",
+                                "user_id": hold.user_id,
+                                "room_id": hold.room_id,
+                                "category": hold.category.value,
+                                "check_in": checkin_iso,
+                                "check_out": checkout_iso,
+                                "price_per_night": Decimal(str(hold.price_per_night)),
+                                "expires_at": expires_at,
+                                "ttl_attribute": expires_at,
+                            },
                             "ConditionExpression": "attribute_not_exists(pk)",
                         }
                     },
                     {
                         "Put": {
                             "TableName": self.table.name,
-                            "Item": user_booking,
+                            "Item": {
+                                "pk": f"ROOM#{hold.room_id}",
+                                "sk": f"CHECKIN#{checkin_iso}",
+                                "checkout_date": checkout_iso,
+                                "checkin_date": checkin_iso,
+                                **hold_attributes,
+                            },
                         }
                     },
                     {
                         "Put": {
                             "TableName": self.table.name,
-                            "Item": room_booking,
+                            "Item": {
+                                "pk": f"CATEGORY#{hold.category.value}",
+                                "sk": self.availability_sk(checkin_iso, hold.room_id),
+                                "room_id": hold.room_id,
+                                "checkout": checkout_iso,
+                                **hold_attributes,
+                            },
+                            "ConditionExpression": SLOT_FREE_CONDITION,
+                            "ExpressionAttributeValues": {
+                                ":now": to_epoch_seconds(datetime.now(timezone.utc)),
+                            },
                         }
                     },
                     {
                         "Put": {
                             "TableName": self.table.name,
-                            "Item": availability_item,
-                            "ConditionExpression": "attribute_not_exists(sk)",
+                            "Item": {
+                                "pk": f"CATEGORY#{hold.category.value}",
+                                "sk": self.checkout_index_sk(checkout_iso, hold.room_id),
+                                "room_id": hold.room_id,
+                                "checkin": checkin_iso,
+                                **hold_attributes,
+                            },
                         }
                     },
+                    *self._night_puts(
+                        hold.room_id,
+                        hold.checkin,
+                        hold.checkout,
+                        hold_attributes,
+                        {
+                            "ConditionExpression": SLOT_FREE_CONDITION,
+                            "ExpressionAttributeValues": {
+                                ":now": to_epoch_seconds(datetime.now(timezone.utc)),
+                            },
+                        },
+                    ),
                 ]
             )
-
         except ClientError as err:
-            logger.error(f"Error creating booking {booking.booking_id}: {err}")
+            reasons = err.response.get("CancellationReasons", [])
+            if any(r.get("Code") in ROOM_TAKEN_CODES for r in reasons):
+                return False
+            logger.error(f"Error creating hold {hold.hold_id}: {err}")
             raise
+        return True
 
-    def get_user_bookings(self, user_id: str) -> List[Booking]:
+    def get_hold(self, hold_id: str) -> Optional[Hold]:
         try:
-            response = self.table.query(
-                KeyConditionExpression=Key("pk").eq(f"USER#{user_id}")
-                & Key("sk").begins_with("BOOKING#")
+            response = self.table.get_item(
+                Key={"pk": f"HOLD#{hold_id}", "sk": "DETAILS"}
             )
         except ClientError as err:
-            logger.error(f"Error retrieving user {user_id} bookings: {err}")
+            logger.error(f"Error retrieving hold {hold_id}: {err}")
             raise
 
-        items = response.get("Items", [])
-        if not items:
-            return []
-
-        bookings = []
-        for item in items:
-            checkin_dt = from_iso_string(item["check_in"])
-            checkout_dt = from_iso_string(item["check_out"])
-            booked_at_dt = datetime.fromisoformat(item["booked_at"])
-
-            booking = Booking(
-                booking_id=item["sk"].removeprefix("BOOKING#"),
-                user_id=user_id,
-                room_id=item["room_id"],
-                category=Category(item["category"]),
-                status=BookingStatus(item["booking_status"]),
-                checkin=checkin_dt,
-                checkout=checkout_dt,
-                price_per_night=float(item["price_per_night"]),
-                booked_at=booked_at_dt,
-                user_email=item.get("user_email"),
+        item = response.get("Item")
+        if not item:
+            return None
+        return decode_hold(item)
+
+    def convert_hold(self, hold: Hold, booking: Booking) -> bool:
+        """Turn an unexpired hold into the booking in one transaction.
+
+        The booking's items overwrite the hold's; returns False when the hold
+        has expired or been used meanwhile.
+        """
+        now = to_epoch_seconds(datetime.now(timezone.utc))
+        items = self._booking_transact_items(booking, hold_id=hold.hold_id)
+        items.append(
+            {
+                "Delete": {
+                    "TableName": self.table.name,
+                    "Key": {"pk": f"HOLD#{hold.hold_id}", "sk": "DETAILS"},
+                    "ConditionExpression": "user_id = :user_id AND expires_at >= :now",
+                    "ExpressionAttributeValues": {
+                        ":user_id": booking.user_id,
+                        ":now": now,
+                    },
+                }
+            }
+        )
+
+        try:
+            self.client.transact_write_items(TransactItems=items)
+        except ClientError as err:
+            reasons = err.response.get("CancellationReasons", [])
+            if any(r.get("Code") == "ConditionalCheckFailed" for r in reasons):
+                return False
+            logger.error(f"Error converting hold {hold.hold_id}: {err}")
+            raise
+        return True
+
+    def get_user_bookings(
+        self,
+        user_id: str,
+        checkin_from: Optional[datetime] = None,
+        checkin_to: Optional[datetime] = None,
+        status: Optional[BookingStatus] = None,
+    ) -> List[Booking]:
+        return list(
+            self.iter_user_bookings(
+                user_id,
+                checkin_from=checkin_from,
+                checkin_to=checkin_to,
+                status=status,
+            )
+        )
+
+    def iter_user_bookings(
+        self,
+        user_id: str,
+        checkin_from: Optional[datetime] = None,
+        checkin_to: Optional[datetime] = None,
+        status: Optional[BookingStatus] = None,
+    ) -> Iterator[Booking]:
+        start_key = None
+        while True:
+            bookings, start_key = self.get_user_bookings_page(
+                user_id,
+                exclusive_start_key=start_key,
+                checkin_from=checkin_from,
+                checkin_to=checkin_to,
+                status=status,
+            )
+            yield from bookings
+            if not start_key:
+                return
+
+    def get_user_bookings_page(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        exclusive_start_key: Optional[dict] = None,
+        checkin_from: Optional[datetime] = None,
+        checkin_to: Optional[datetime] = None,
+        status: Optional[BookingStatus] = None,
+    ) -> Tuple[List[Booking], Optional[dict]]:
+        query_kwargs = {
+            "KeyConditionExpression": self._user_bookings_key_condition(
+                user_id, checkin_from, checkin_to
             )
-            bookings.append(booking)
+        }
+        if status:
+            query_kwargs["FilterExpression"] = Attr("booking_status").eq(status.value)
+        if limit:
+            query_kwargs["Limit"] = limit
+        if exclusive_start_key:
+            if exclusive_start_key.get("pk") != f"USER#{user_id}":
+                raise InvalidCursor("cursor does not belong to this user")
+            query_kwargs["ExclusiveStartKey"] = exclusive_start_key
+
+        try:
+            response = self.table.query(**query_kwargs)
+        except ClientError as err:
+            logger.error(f"Error retrieving user {user_id} bookings: {err}")
+            raise
 
-        return bookings
+        bookings = [
+            decode_booking(item, user_id=user_id)
+            for item in response.get("Items", [])
+        ]
+        return bookings, response.get("LastEvaluatedKey")
 
     def get_booking_by_id(self, booking_id: str) -> Optional[Booking]:
         try:
@@ -169,54 +528,161 @@ class BookingRepository:
         if not item:
             return None
 
-        checkin_dt = from_iso_string(item["check_in"])
-        checkout_dt = from_iso_string(item["check_out"])
-        booked_at_dt = datetime.fromisoformat(item["booked_at"])
-
-        return Booking(
-            booking_id=booking_id,
-            user_id=item["user_id"],
-            room_id=item["room_id"],
-            category=Category(item["category"]),
-            status=BookingStatus(item["booking_status"]),
-            checkin=checkin_dt,
-            checkout=checkout_dt,
-            price_per_night=float(item["price_per_night"]),
-            booked_at=booked_at_dt,
-            user_email=item.get("user_email"),
-        )
+        return decode_booking(item, booking_id=booking_id)
 
-    def update_booking_status(
-        self, booking_id: str, user_id: str, room_id: str, status: BookingStatus
-    ):
+    def _get_checkin_and_category(self, booking_id: str) -> Tuple[str, str]:
+        try:
+            response = self.table.get_item(
+                Key={"pk": f"BOOKING#{booking_id}", "sk": "DETAILS"},
+                ProjectionExpression="check_in, category",
+            )
+        except ClientError as err:
+            logger.error(f"Error retrieving booking {booking_id}: {err}")
+            raise
+
+        item = response.get("Item")
+        if not item:
+            raise NotFoundException("booking", booking_id, 404)
+        return item["check_in"], item["category"]
+
+    def _room_queue_key(self, room_id: str) -> Optional[dict]:
+        """The room's current housekeeping queue entry key, if any."""
+        try:
+            response = self.client.get_item(
+                TableName=self.table.name,
+                Key={"pk": f"ROOM#{room_id}", "sk": "DETAILS"},
+                ProjectionExpression="hk_pk, hk_sk",
+            )
+        except ClientError as err:
+            logger.error(f"Error retrieving room {room_id}: {err}")
+            raise
+        item = response.get("Item") or {}
+        if "hk_pk" not in item or "hk_sk" not in item:
+            return None
+        return {"pk": item["hk_pk"], "sk": item["hk_sk"]}
+
+    def _room_status_items(
+        self, booking_id: str, room_id: str, category: str, status: BookingStatus
+    ) -> list[dict]:
+        """The room's side of a booking status change: the room update first,
+        then its category index mirror and, on checkout, its housekeeping
+        queue entry in place of any earlier one."""
         room_status = (
             RoomStatus.HOUSEKEEPING
             if status == BookingStatus.CHECKED_OUT
             else RoomStatus.OCCUPIED
         )
+        room_update = {
+            "Key": {"pk": f"ROOM#{room_id}", "sk": "DETAILS"},
+            "TableName": self.table.name,
+            "UpdateExpression": "SET #room_status = :new_value",
+            "ExpressionAttributeNames": {
+                "#room_status": "room_status",
+            },
+            "ExpressionAttributeValues": {
+                ":new_value": room_status.value,
+            },
+            "ConditionExpression": "attribute_exists(pk)",
+        }
+        items = [
+            {"Update": room_update},
+            {
+                "Update": {
+                    "Key": {"pk": f"CATEGORY#{category}", "sk": f"ROOM#{room_id}"},
+                    "TableName": self.table.name,
+                    "UpdateExpression": "SET #room_status = :new_value",
+                    "ExpressionAttributeNames": {
+                        "#room_status": "room_status",
+                    },
+                    "ExpressionAttributeValues": {
+                        ":new_value": room_status.value,
+                    },
+                }
+            },
+        ]
+        if status == BookingStatus.CHECKED_OUT:
+            # sparse housekeeping queue entry, ordered by checkout time; the
+            # room keeps its key so the entry can go when it is AVAILABLE again
+            checked_out_at = self._iso(datetime.now(timezone.utc))
+            queue_item = {
+                "pk": f"HK#{checked_out_at[:10]}",
+                "sk": f"{checked_out_at}#ROOM#{room_id}",
+                "room_id": room_id,
+                "booking_id": booking_id,
+                "checked_out_at": checked_out_at,
+            }
+            room_update["UpdateExpression"] += ", hk_pk = :hk_pk, hk_sk = :hk_sk"
+            room_update["ExpressionAttributeValues"].update(
+                {":hk_pk": queue_item["pk"], ":hk_sk": queue_item["sk"]}
+            )
+            items.append(
+                {"Put": {"TableName": self.table.name, "Item": queue_item}}
+            )
+            # checked out again before it was cleaned; one entry per room
+            previous = self._room_queue_key(room_id)
+            if previous and previous != {"pk": queue_item["pk"], "sk": queue_item["sk"]}:
+                items.append({"Delete": {"TableName": self.table.name, "Key": previous}})
+        return items
+
+    def update_booking_status(
+        self,
+        booking_id: str,
+        user_id: str,
+        room_id: str,
+        status: BookingStatus,
+        checkin: Optional[datetime | str] = None,
+        category: Optional[Category | str] = None,
+    ) -> bool:
+        """Move a booking and its room to status in one transaction.
+
+        Returns False when the booking is already CANCELLED or CHECKED_OUT,
+        so a late or repeated checkout schedule changes nothing.
+        """
+        if checkin and category:
+            checkin_iso = self._iso(checkin)
+        else:
+            stored_checkin, stored_category = self._get_checkin_and_category(booking_id)
+            checkin_iso = self._iso(checkin) if checkin else stored_checkin
+            category = category or stored_category
+        if isinstance(category, Category):
+            category = category.value
+        room_update, *extra_items = self._room_status_items(
+            booking_id, room_id, category, status
+        )
 
         try:
             self.client.transact_write_items(
                 TransactItems=[
+                    room_update,
                     {
                         "Update": {
-                            "Key": {"pk": f"ROOM#{room_id}", "sk": "DETAILS"},
+                            "Key": {
+                                "pk": f"BOOKING#{booking_id}",
+                                "sk": "DETAILS",
+                            },
                             "TableName": self.table.name,
-                            "UpdateExpression": "SET #room_status = :new_value",
+                            "UpdateExpression": "SET #booking_status = :new_value",
                             "ExpressionAttributeNames": {
-                                "#room_status": "room_status",
+                                "#booking_status": "booking_status",
                             },
                             "ExpressionAttributeValues": {
-                                ":new_value": room_status.value,
+                                ":new_value": status.value,
+                                ":cancelled": BookingStatus.CANCELLED.value,
+                                ":checked_out": BookingStatus.CHECKED_OUT.value,
                             },
-                            "ConditionExpression": "attribute_exists(pk)",
+                            # a late checkout schedule must not revive a cancellation
+                            # or check an early-checked-out booking out again
+                            "ConditionExpression": (
+                                "attribute_exists(pk) AND "
+                                "NOT #booking_status IN (:cancelled, :checked_out)"
+                            ),
                         }
                     },
                     {
                         "Update": {
                             "Key": {
-                                "pk": f"BOOKING#{booking_id}",
-                                "sk": "DETAILS",
+                                "pk": f"USER#{user_id}",
+                                "sk": self.user_booking_sk(checkin_iso, booking_id),
                             },
                             "TableName": self.table.name,
                             "UpdateExpression": "SET #booking_status = :new_value",
@@ -229,25 +695,273 @@ class BookingRepository:
                             "ConditionExpression": "attribute_exists(pk)",
                         }
                     },
+                    *extra_items,
+                ]
+            )
+        except ClientError as err:
+            reasons = err.response.get("CancellationReasons", [])
+            if len(reasons) > 1 and reasons[1].get("Code") == "ConditionalCheckFailed":
+                return False
+            logger.error(f"Error updating booking {booking_id} status: {err}")
+            raise
+        return True
+
+    def cancel_booking(self, booking: Booking) -> bool:
+        """Cancel an UPCOMING booking and free its room in one transaction.
+
+        Both booking items are marked CANCELLED; the room and availability
+        items are deleted and the checkout schedule is queued for deletion.
+        Returns False when the booking is no longer UPCOMING or its stay has
+        started.
+        """
+        checkin_iso = self._iso(booking.checkin)
+        checkout_iso = self._iso(booking.checkout)
+        category_pk = f"CATEGORY#{booking.category.value}"
+        status_update = {
+            "UpdateExpression": "SET #booking_status = :new_value",
+            "ExpressionAttributeNames": {"#booking_status": "booking_status"},
+            "ExpressionAttributeValues": {
+                ":new_value": BookingStatus.CANCELLED.value,
+                ":upcoming": BookingStatus.UPCOMING.value,
+                ":now": self._iso(datetime.now(timezone.utc)),
+            },
+            # a stay in progress keeps its room until it is checked out
+            "ConditionExpression": "#booking_status = :upcoming AND check_in > :now",
+        }
+        # only this booking's rows; a twin missing from before the checkout
+        # index backfill is not an error
+        owned = {
+            "ConditionExpression": "attribute_not_exists(pk) OR booking_id = :booking_id",
+            "ExpressionAttributeValues": {":booking_id": booking.booking_id},
+        }
+
+        try:
+            self.client.transact_write_items(
+                TransactItems=[
+                    {
+                        "Update": {
+                            "TableName": self.table.name,
+                            "Key": {"pk": f"BOOKING#{booking.booking_id}", "sk": "DETAILS"},
+                            **status_update,
+                        }
+                    },
                     {
                         "Update": {
+                            "TableName": self.table.name,
                             "Key": {
-                                "pk": f"USER#{user_id}",
-                                "sk": f"BOOKING#{booking_id}",
+                                "pk": f"USER#{booking.user_id}",
+                                "sk": self.user_booking_sk(checkin_iso, booking.booking_id),
                             },
+                            **status_update,
+                        }
+                    },
+                    {
+                        "Delete": {
                             "TableName": self.table.name,
-                            "UpdateExpression": "SET #booking_status = :new_value",
-                            "ExpressionAttributeNames": {
-                                "#booking_status": "booking_status",
+                            "Key": {"pk": f"ROOM#{booking.room_id}", "sk": f"CHECKIN#{checkin_iso}"},
+                            **owned,
+                        }
+                    },
+                    {
+                        "Delete": {
+                            "TableName": self.table.name,
+                            "Key": {
+                                "pk": category_pk,
+                                "sk": self.availability_sk(checkin_iso, booking.room_id),
+                            },
+                            **owned,
+                        }
+                    },
+                    {
+                        "Delete": {
+                            "TableName": self.table.name,
+                            "Key": {
+                                "pk": category_pk,
+                                "sk": self.checkout_index_sk(checkout_iso, booking.room_id),
                             },
+                            **owned,
+                        }
+                    },
+                    {
+                        "Put": {
+                            "TableName": self.table.name,
+                            "Item": OutboxRepository.cancel_checkout_item(booking.booking_id),
+                        }
+                    },
+                    *self._night_deletes(
+                        booking.room_id, booking.checkin, booking.checkout, booking.booking_id
+                    ),
+                ]
+            )
+        except ClientError as err:
+            reasons = err.response.get("CancellationReasons", [])
+            if any(r.get("Code") == "ConditionalCheckFailed" for r in reasons):
+                return False
+            logger.error(f"Error cancelling booking {booking.booking_id}: {err}")
+            raise
+        return True
+
+    def extend_booking(self, booking: Booking, new_checkout: datetime) -> bool:
+        """Move the booking's checkout later, with its TTLs and schedule.
+
+        Conditional on the stored checkout still being booking.checkout and
+        the booking not being over; returns False otherwise.
+        """
+        outbox_item = OutboxRepository.schedule_checkout_item(
+            booking.booking_id, booking.user_id, booking.room_id, self._iso(new_checkout)
+        )
+        added_nights = self._night_puts(
+            booking.room_id,
+            booking.checkout,
+            new_checkout,
+            {"booking_id": booking.booking_id, "ttl_attribute": to_epoch_seconds(new_checkout)},
+            {
+                "ConditionExpression": SLOT_FREE_CONDITION,
+                "ExpressionAttributeValues": {
+                    ":now": to_epoch_seconds(datetime.now(timezone.utc)),
+                },
+            },
+        )
+        return self._move_checkout(booking, new_checkout, outbox_item, extra_items=added_nights)
+
+    def shorten_booking(self, booking: Booking, new_checkout: datetime) -> bool:
+        """Check a guest out early, moving the checkout to new_checkout.
+
+        One transaction marks the booking CHECKED_OUT, sends the room to
+        housekeeping, frees the remaining nights and queues the pending
+        checkout schedule for deletion; same conditions as extend_booking.
+        """
+        outbox_item = OutboxRepository.cancel_checkout_item(booking.booking_id)
+        return self._move_checkout(
+            booking,
+            new_checkout,
+            outbox_item,
+            status=BookingStatus.CHECKED_OUT,
+            extra_items=[
+                *self._room_status_items(
+                    booking.booking_id,
+                    booking.room_id,
+                    booking.category.value,
+                    BookingStatus.CHECKED_OUT,
+                ),
+                *self._night_deletes(
+                    booking.room_id, new_checkout, booking.checkout, booking.booking_id
+                ),
+            ],
+        )
+
+    def _move_checkout(
+        self,
+        booking: Booking,
+        new_checkout: datetime,
+        outbox_item: dict,
+        status: Optional[BookingStatus] = None,
+        extra_items: list[dict] = (),
+    ) -> bool:
+        checkin_iso = self._iso(booking.checkin)
+        old_checkout_iso = self._iso(booking.checkout)
+        new_checkout_iso = self._iso(new_checkout)
+        ttl = to_epoch_seconds(new_checkout)
+        category_pk = f"CATEGORY#{booking.category.value}"
+        booking_update = {
+            "UpdateExpression": "SET check_out = :new_checkout",
+            "ExpressionAttributeValues": {
+                ":new_checkout": new_checkout_iso,
+                ":old_checkout": old_checkout_iso,
+                ":upcoming": BookingStatus.UPCOMING.value,
+                ":checked_in": BookingStatus.CHECKED_IN.value,
+            },
+            "ConditionExpression": (
+                "check_out = :old_checkout AND booking_status IN (:upcoming, :checked_in)"
+            ),
+        }
+        if status is not None:
+            booking_update["UpdateExpression"] += ", booking_status = :status"
+            booking_update["ExpressionAttributeValues"][":status"] = status.value
+
+        try:
+            self.client.transact_write_items(
+                TransactItems=[
+                    {
+                        "Update": {
+                            "TableName": self.table.name,
+                            "Key": {"pk": f"BOOKING#{booking.booking_id}", "sk": "DETAILS"},
+                            **booking_update,
+                        }
+                    },
+                    {
+                        "Update": {
+                            "TableName": self.table.name,
+                            "Key": {
+                                "pk": f"USER#{booking.user_id}",
+                                "sk": self.user_booking_sk(checkin_iso, booking.booking_id),
+                            },
+                            **booking_update,
+                        }
+                    },
+                    {
+                        "Update": {
+                            "TableName": self.table.name,
+                            "Key": {"pk": f"ROOM#{booking.room_id}", "sk": f"CHECKIN#{checkin_iso}"},
+                            "UpdateExpression": "SET checkout_date = :checkout",
+                            "ConditionExpression": "booking_id = :booking_id",
                             "ExpressionAttributeValues": {
-                                ":new_value": status.value,
+                                ":checkout": new_checkout_iso,
+                                ":booking_id": booking.booking_id,
+                            },
+                        }
+                    },
+                    {
+                        "Update": {
+                            "TableName": self.table.name,
+                            "Key": {
+                                "pk": category_pk,
+                                "sk": self.availability_sk(checkin_iso, booking.room_id),
+                            },
+                            "UpdateExpression": "SET checkout = :checkout, ttl_attribute = :ttl",
+                            "ConditionExpression": "booking_id = :booking_id",
+                            "ExpressionAttributeValues": {
+                                ":checkout": new_checkout_iso,
+                                ":ttl": ttl,
+                                ":booking_id": booking.booking_id,
+                            },
+                        }
+                    },
+                    {
+                        "Delete": {
+                            "TableName": self.table.name,
+                            "Key": {
+                                "pk": category_pk,
+                                "sk": self.checkout_index_sk(old_checkout_iso, booking.room_id),
+                            },
+                        }
+                    },
+                    {
+                        "Put": {
+                            "TableName": self.table.name,
+                            "Item": {
+                                "pk": category_pk,
+                                "sk": self.checkout_index_sk(new_checkout_iso, booking.room_id),
+                                "room_id": booking.room_id,
+                                "checkin": checkin_iso,
+                                "booking_id": booking.booking_id,
+                                "ttl_attribute": ttl,
                             },
-                            "ConditionExpression": "attribute_exists(pk)",
                         }
                     },
+                    {
+                        "Put": {
+                            "TableName": self.table.name,
+                            "Item": outbox_item,
+                        }
+                    },
+                    *extra_items,
                 ]
             )
         except ClientError as err:
-            logger.error(f"Error updating booking {booking_id} status: {err}")
+            reasons = err.response.get("CancellationReasons", [])
+            if any(r.get("Code") == "ConditionalCheckFailed" for r in reasons):
+                return False
+            logger.error(f"Error moving checkout of booking {booking.booking_id}: {err}")
             raise
+        return True
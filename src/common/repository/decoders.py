@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+from common.models.bookings import Booking, BookingStatus, Hold
+from common.models.rooms import Room, Category, RoomStatus, HousekeepingTask
+from common.models.users import User, UserRole
+
+# enum lookups by stored value, built once instead of Enum(value) per item
+CATEGORIES = {c.value: c for c in Category}
+BOOKING_STATUSES = {s.value: s for s in BookingStatus}
+ROOM_STATUSES = {s.value: s for s in RoomStatus}
+USER_ROLES = {r.value: r for r in UserRole}
+
+
+@lru_cache(maxsize=16384)
+def parse_timestamp(value: str) -> datetime:
+    # datetimes are immutable and stored check-in/out values repeat heavily,
+    # so parsed results are shared across items
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        raise ValueError("Stored datetime must be timezone-aware")
+    if dt.tzinfo is timezone.utc:
+        return dt
+    return dt.astimezone(timezone.utc)
+
+
+def _enum(lookup: dict, enum_cls, value):
+    member = lookup.get(value)
+    if member is None:
+        # unknown values fail the same way Enum(value) does
+        return enum_cls(value)
+    return member
+
+
+def decode_booking(
+    item: dict, booking_id: Optional[str] = None, user_id: Optional[str] = None
+) -> Booking:
+    # handles both BOOKING#<id>/DETAILS and USER#<id>/BOOKING#<checkin>#<id> items
+    pk = item.get("pk", "")
+    if booking_id is None:
+        if pk.startswith("BOOKING#"):
+            booking_id = pk[8:]
+        else:
+            booking_id = item.get("booking_id") or item["sk"].rsplit("#", 1)[1]
+    if user_id is None:
+        user_id = item.get("user_id") or pk.removeprefix("USER#")
+
+    return Booking(
+        booking_id=booking_id,
+        user_id=user_id,
+        user_email=item.get("user_email"),
+        room_id=item["room_id"],
+        category=_enum(CATEGORIES, Category, item["category"]),
+        checkin=parse_timestamp(item["check_in"]),
+        checkout=parse_timestamp(item["check_out"]),
+        status=_enum(BOOKING_STATUSES, BookingStatus, item["booking_status"]),
+        price_per_night=float(item["price_per_night"]),
+        booked_at=parse_timestamp(item["booked_at"]),
+    )
+
+
+def decode_hold(item: dict) -> Hold:
+    return Hold(
+        hold_id=item["pk"].removeprefix("HOLD#"),
+        user_id=item["user_id"],
+        room_id=item["room_id"],
+        category=_enum(CATEGORIES, Category, item["category"]),
+        checkin=parse_timestamp(item["check_in"]),
+        checkout=parse_timestamp(item["check_out"]),
+        price_per_night=float(item["price_per_night"]),
+        expires_at=datetime.fromtimestamp(int(item["expires_at"]), timezone.utc),
+    )
+
+
+def decode_room(item: dict, room_id: Optional[str] = None) -> Room:
+    return Room(
+        room_id=room_id if room_id is not None else item["pk"].removeprefix("ROOM#"),
+        category=_enum(CATEGORIES, Category, item["category"]),
+        status=_enum(ROOM_STATUSES, RoomStatus, item["room_status"]),
+        floor=int(item["floor"]) if "floor" in item else None,
+    )
+
+
+def decode_housekeeping_task(item: dict) -> HousekeepingTask:
+    return HousekeepingTask(
+        room_id=item["room_id"],
+        booking_id=item["booking_id"],
+        checked_out_at=parse_timestamp(item["checked_out_at"]),
+    )
+
+
+def decode_user(item: dict) -> User:
+    return User(
+        user_id=item["pk"].split("#", 1)[1],
+        username=item["username"],
+        email=item["email"],
+        phone_number=item.get("phone_number"),
+        role=_enum(USER_ROLES, UserRole, item["role"]),
+        password=item["password"],
+    )
@@ -0,0 +1,108 @@
+from botocore.exceptions import ClientError
+import logging
+from typing import List, Optional
+from boto3.dynamodb.conditions import Key
+from datetime import datetime, timezone
+from hashlib import sha256
+from common.utils.datetime_normaliser import to_timestamp
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types_boto3_dynamodb.service_resource import Table
+else:
+    Table = object
+
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_PK_PREFIX = "OUTBOX#"
+# entries are spread over this many partitions so one is not a write hot spot
+OUTBOX_SHARDS = 8
+SCHEDULE_CHECKOUT = "SCHEDULE_CHECKOUT"
+CANCEL_CHECKOUT = "CANCEL_CHECKOUT"
+
+
+class OutboxRepository:
+    """Side effects that must follow a committed write, e.g. checkout schedules.
+
+    Entries are written inside the caller's transaction and removed once a
+    processor has applied them. One entry per booking: a later write for
+    the same booking replaces the pending one, so only its latest state is
+    applied.
+    """
+
+    def __init__(self, table: Table):
+        self.table = table
+        # shard get_pending starts from, rotated so a stuck shard cannot starve the rest
+        self._next_shard = 0
+
+    @staticmethod
+    def shard_pk(booking_id: str) -> str:
+        # a stable hash: every writer must put a booking's entries in the same shard
+        shard = int.from_bytes(sha256(booking_id.encode()).digest()[:8], "big") % OUTBOX_SHARDS
+        return f"{OUTBOX_PK_PREFIX}{shard}"
+
+    @staticmethod
+    def _entry(booking_id: str, action: str, **attributes) -> dict:
+        return {
+            "pk": OutboxRepository.shard_pk(booking_id),
+            "sk": f"BOOKING#{booking_id}",
+            "action": action,
+            "booking_id": booking_id,
+            **attributes,
+            "queued_at": to_timestamp(datetime.now(timezone.utc)),
+        }
+
+    @staticmethod
+    def schedule_checkout_item(
+        booking_id: str, user_id: str, room_id: str, checkout_iso: str
+    ) -> dict:
+        return OutboxRepository._entry(
+            booking_id,
+            SCHEDULE_CHECKOUT,
+            user_id=user_id,
+            room_id=room_id,
+            checkout=checkout_iso,
+        )
+
+    @staticmethod
+    def cancel_checkout_item(booking_id: str) -> dict:
+        return OutboxRepository._entry(booking_id, CANCEL_CHECKOUT)
+
+    def get_pending(self, limit: Optional[int] = None) -> List[dict]:
+        """Pending entries from every shard, up to limit in total."""
+        start = self._next_shard
+        self._next_shard = (start + 1) % OUTBOX_SHARDS
+        entries = []
+        for offset in range(OUTBOX_SHARDS):
+            query_kwargs = {
+                "KeyConditionExpression": Key("pk").eq(
+                    f"{OUTBOX_PK_PREFIX}{(start + offset) % OUTBOX_SHARDS}"
+                )
+            }
+            if limit:
+                query_kwargs["Limit"] = limit - len(entries)
+            try:
+                entries.extend(self.table.query(**query_kwargs).get("Items", []))
+            except ClientError as err:
+                logger.error(f"Error retrieving outbox entries: {err}")
+                raise
+            if limit and len(entries) >= limit:
+                break
+        return entries
+
+    def delete(self, entry: dict) -> bool:
+        # only the version that was applied; a newer one is left for its own run
+        try:
+            self.table.delete_item(
+                Key={"pk": entry["pk"], "sk": entry["sk"]},
+                ConditionExpression="queued_at = :queued_at",
+                ExpressionAttributeValues={":queued_at": entry["queued_at"]},
+            )
+        except ClientError as err:
+            if err.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return False
+            logger.error(f"Error deleting outbox entry {entry['sk']}: {err}")
+            raise
+        return True
@@ -0,0 +1,58 @@
+from botocore.exceptions import ClientError
+import logging
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types_boto3_dynamodb.service_resource import Table
+else:
+    Table = object
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitRepository:
+    """Request counters, one item per key and refill window.
+
+    Items expire by TTL once their window is over.
+    """
+
+    def __init__(self, table: Table):
+        self.table = table
+
+    def take(self, key: str, window: int, capacity: int, expires_at: int) -> bool:
+        """Take one token from the key's bucket for this window.
+
+        A single atomic increment; the condition stops the count at capacity,
+        so returns False without counting when the bucket is empty.
+        """
+        try:
+            self.table.update_item(
+                Key={"pk": f"RATELIMIT#{key}", "sk": f"WINDOW#{window}"},
+                UpdateExpression="ADD hits :one SET ttl_attribute = :ttl",
+                ConditionExpression="attribute_not_exists(hits) OR hits < :capacity",
+                ExpressionAttributeValues={
+                    ":one": 1,
+                    ":capacity": capacity,
+                    ":ttl": expires_at,
+                },
+            )
+        except ClientError as err:
+            if err.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return False
+            logger.error(f"Error counting request for {key}: {err}")
+            raise
+        return True
+
+    def count(self, key: str, window: int) -> int:
+        """Tokens already taken from the key's bucket in this window."""
+        try:
+            response = self.table.get_item(
+                Key={"pk": f"RATELIMIT#{key}", "sk": f"WINDOW#{window}"},
+                ProjectionExpression="hits",
+            )
+        except ClientError as err:
+            logger.error(f"Error reading request count for {key}: {err}")
+            raise
+        return int(response.get("Item", {}).get("hits", 0))
@@ -1,12 +1,21 @@
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 import logging
-from typing import Optional, List
+import time
+from typing import Dict, Iterator, Optional, List, Tuple
 from boto3.dynamodb.conditions import Key
-from common.models.rooms import Room, Category, RoomStatus
-from datetime import datetime, timezone, timedelta
-from common.utils.custom_exceptions import NotFoundException,RoomAlreadyExists
+from common.models.rooms import Room, Category, RoomStatus, HousekeepingTask, FreeRoom
+from datetime import date, datetime, timezone, timedelta
+from common.utils.custom_exceptions import InvalidCursor, NotFoundException,RoomAlreadyExists
 from common.utils.constants import MAX_STAY
-from common.utils.datetime_normaliser import from_iso_string
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from common.utils.datetime_normaliser import to_timestamp, normalise_timestamp, to_epoch_seconds
+from common.repository.decoders import (
+    CATEGORIES,
+    ROOM_STATUSES,
+    decode_housekeeping_task,
+    decode_room,
+    parse_timestamp,
+)
 
 from typing import TYPE_CHECKING
 
@@ -20,13 +29,31 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# TransactWriteItems limit; each room writes two or three of these
+# (DETAILS, category index and, when known, floor index)
+TRANSACTION_MAX_ITEMS = 100
+IMPORT_WORKERS = 8
+STATUS_UPDATE_BATCH = 25
+# time slices of the availability lookback range, queried concurrently
+QUERY_SLICES = 4
+# page size of the checkout-ordered availability stream; small enough that an
+# early exit on a busy day saves reads, large enough to rarely need many pages
+STREAM_PAGE_SIZE = 100
+
+# rooms that must never be offered, whatever their bookings look like
+OUT_OF_SERVICE = frozenset({RoomStatus.MAINTENANCE})
+# other containers can change a status without reaching this cache
+STATUS_MAP_TTL_SECONDS = 30
+
 
 class RoomRepository:
     def __init__(self, table: Table, client: DynamoDBClient = None):
         self.table = table
         self.client = client if client else table.meta.client
+        # category -> (loaded_at, status map); lives as long as the container
+        self._status_maps: Dict[Category, Tuple[float, Dict[str, RoomStatus]]] = {}
 
-    def add_room(self, room: Room):
+    def _room_put_items(self, room: Room) -> list[dict]:
         room_item = {
             "pk": f"ROOM#{room.room_id}",
             "sk": f"DETAILS",
@@ -36,24 +63,42 @@ class RoomRepository:
         category_item = {
             "pk": f"CATEGORY#{room.category.value}",
             "sk": f"ROOM#{room.room_id}",
+            "room_status": room.status.value,
         }
+        puts = [
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": room_item,
+                    "ConditionExpression": "attribute_not_exists(pk)",
+                }
+            },
+            {
+                "Put": {
+                    "TableName": self.table.name,
+                    "Item": category_item,
+                }
+            },
+        ]
+        if room.floor is not None:
+            room_item["floor"] = room.floor
+            puts.append(
+                {
+                    "Put": {
+                        "TableName": self.table.name,
+                        "Item": {
+                            "pk": f"FLOOR#{room.floor}",
+                            "sk": f"ROOM#{room.room_id}",
+                        },
+                    }
+                }
+            )
+        return puts
+
+    def add_room(self, room: Room):
         try:
             self.client.transact_write_items(
-                TransactItems=[
-                    {
-                        "Put": {
-                            "TableName": self.table.name,
-                            "Item": room_item,
-                            "ConditionExpression": "attribute_not_exists(pk)",
-                        }
-                    },
-                    {
-                        "Put": {
-                            "TableName": self.table.name,
-                            "Item": category_item,
-                        }
-                    },
-                ]
+                TransactItems=self._room_put_items(room)
             )
         except ClientError as e:
             logger.error(f"Error creating booking {room.room_id}: {e}")
@@ -65,6 +110,71 @@ class RoomRepository:
                     else:
                         raise          
             raise
+        finally:
+            self.invalidate_status_map(room.category)
+
+    def add_rooms(self, rooms: List[Room]) -> Tuple[List[str], List[str]]:
+        """Create rooms in full transactions across parallel workers.
+
+        Returns (conflicts, failed): the ids of rooms that already existed,
+        which are skipped, and of rooms whose transaction failed for another
+        reason, e.g. throttling. Other chunks still go through either way.
+        """
+        chunks, chunk, size = [], [], 0
+        for room in rooms:
+            items = 3 if room.floor is not None else 2
+            if size + items > TRANSACTION_MAX_ITEMS:
+                chunks.append(chunk)
+                chunk, size = [], 0
+            chunk.append(room)
+            size += items
+        if chunk:
+            chunks.append(chunk)
+        if not chunks:
+            return [], []
+        conflicts, failed = [], []
+        try:
+            with ThreadPoolExecutor(max_workers=min(IMPORT_WORKERS, len(chunks))) as pool:
+                for chunk_conflicts, chunk_failed in pool.map(self._add_room_chunk, chunks):
+                    conflicts.extend(chunk_conflicts)
+                    failed.extend(chunk_failed)
+        finally:
+            for category in {room.category for room in rooms}:
+                self.invalidate_status_map(category)
+        return conflicts, failed
+
+    def _add_room_chunk(self, rooms: List[Room]) -> Tuple[List[str], List[str]]:
+        conflicts = []
+        while rooms:
+            transact_items = []
+            owners = []
+            for index, room in enumerate(rooms):
+                puts = self._room_put_items(room)
+                transact_items.extend(puts)
+                owners.extend([index] * len(puts))
+            try:
+                self.client.transact_write_items(TransactItems=transact_items)
+                return conflicts, []
+            except BotoCoreError as e:
+                # nothing in this chunk was written; other chunks may have been
+                logger.error(f"Error importing rooms {rooms[0].room_id}..: {e}")
+                return conflicts, [room.room_id for room in rooms]
+            except ClientError as e:
+                reasons = []
+                if e.response["Error"]["Code"] == "TransactionCanceledException":
+                    reasons = e.response.get("CancellationReasons", [])
+                # only the DETAILS put of each room is conditional
+                existing = {
+                    owners[index]
+                    for index, reason in enumerate(reasons)
+                    if reason.get("Code") == "ConditionalCheckFailed"
+                }
+                if not existing:
+                    logger.error(f"Error importing rooms {rooms[0].room_id}..: {e}")
+                    return conflicts, [room.room_id for room in rooms]
+                conflicts.extend(rooms[i].room_id for i in sorted(existing))
+                rooms = [room for i, room in enumerate(rooms) if i not in existing]
+        return conflicts, []
 
     def get_room_by_id(self, room_id: str) -> Optional[Room]:
         try:
@@ -78,31 +188,27 @@ class RoomRepository:
         item = response.get("Item")
         if not item:
             return None
-        return Room(
-            room_id,
-            category=Category(item["category"]),
-            status=RoomStatus(item["room_status"]),
-        )
+        return decode_room(item, room_id=room_id)
 
-    def get_rooms_ids_by_category(self, category: Category) -> List[str]:
+    def get_room_ids_by_floor(self, floor: int) -> List[str]:
+        query_kwargs = {
+            "KeyConditionExpression": (
+                Key("pk").eq(f"FLOOR#{floor}") & Key("sk").begins_with("ROOM#")
+            )
+        }
+        room_ids = []
         try:
-            response = self.table.query(
-                KeyConditionExpression=(
-                    Key("pk").eq(f"CATEGORY#{category.value}")
-                    & Key("sk").begins_with("ROOM#")
+            while True:
+                response = self.table.query(**query_kwargs)
+                room_ids.extend(
+                    item["sk"].split("ROOM#", 1)[1] for item in response.get("Items", [])
                 )
-            )
+                if "LastEvaluatedKey" not in response:
+                    return room_ids
+                query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
         except ClientError as err:
-            logger.error(f"Error retrieving {category.value} rooms: {err}")
+            logger.error(f"Error retrieving floor {floor} rooms: {err}")
             raise
-        items = response.get("Items", [])
-        if not items:
-            return []
-        room_ids = []
-        for item in items:
-            id = item["sk"].split("ROOM#", 1)[1]
-            room_ids.append(id)
-        return room_ids
 
     def get_category_price(self, category: Category) -> Optional[float]:
         try:
@@ -117,26 +223,180 @@ class RoomRepository:
             return None
         return float(item["price"])
 
+    def get_room_status_map(self, category: Category) -> Dict[str, RoomStatus]:
+        """room_id -> status for every room in the category, from one query.
+
+        Cached on the repository (so across warm invocations) for
+        STATUS_MAP_TTL_SECONDS; status changes made here drop the entry.
+        """
+        cached = self._status_maps.get(category)
+        if cached and time.monotonic() - cached[0] < STATUS_MAP_TTL_SECONDS:
+            return cached[1]
+
+        status_map = {}
+        query_kwargs = {
+            "KeyConditionExpression": (
+                Key("pk").eq(f"CATEGORY#{category.value}")
+                & Key("sk").begins_with("ROOM#")
+            )
+        }
+        try:
+            while True:
+                response = self.table.query(**query_kwargs)
+                for item in response.get("Items", []):
+                    # index items written before the status was mirrored count as AVAILABLE
+                    status_map[item["sk"].split("ROOM#", 1)[1]] = ROOM_STATUSES.get(
+                        item.get("room_status"), RoomStatus.AVAILABLE
+                    )
+                if "LastEvaluatedKey" not in response:
+                    break
+                query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except ClientError as err:
+            logger.error(f"Error retrieving {category.value} room statuses: {err}")
+            raise
+
+        self._status_maps[category] = (time.monotonic(), status_map)
+        return status_map
+
+    def invalidate_status_map(self, category: Optional[Category] = None):
+        if category is None:
+            self._status_maps.clear()
+        else:
+            self._status_maps.pop(category, None)
+
     def update_room_status(self, room_id: str, status: RoomStatus):
+        if not self._set_room_status(room_id, status):
+            raise NotFoundException("room", room_id, 404)
+
+    def update_rooms_status(
+        self, room_ids: List[str], from_status: RoomStatus, to_status: RoomStatus
+    ) -> List[str]:
+        """Move rooms still in from_status to to_status, in parallel batches.
+
+        Each update is conditional on the current status, so rooms that
+        moved on since the index was read are left alone. Returns the ids
+        that were updated.
+        """
+        batches = [
+            room_ids[i : i + STATUS_UPDATE_BATCH]
+            for i in range(0, len(room_ids), STATUS_UPDATE_BATCH)
+        ]
+        if not batches:
+            return []
+        updated = []
+        with ThreadPoolExecutor(max_workers=min(IMPORT_WORKERS, len(batches))) as pool:
+            for batch_updated in pool.map(
+                lambda batch: self._update_status_batch(batch, from_status, to_status),
+                batches,
+            ):
+                updated.extend(batch_updated)
+        return updated
+
+    def _update_status_batch(
+        self, room_ids: List[str], from_status: RoomStatus, to_status: RoomStatus
+    ) -> List[str]:
+        return [
+            room_id
+            for room_id in room_ids
+            if self._set_room_status(room_id, to_status, expected=from_status)
+        ]
+
+    def _set_room_status(
+        self, room_id: str, status: RoomStatus, expected: Optional[RoomStatus] = None
+    ) -> bool:
+        """Set a room's status, mirror it on the category index item and,
+        when the room becomes AVAILABLE, drop its housekeeping queue entry,
+        all in one transaction.
+
+        Returns False when the room does not exist or is not in expected.
+        """
+        key = {"pk": f"ROOM#{room_id}", "sk": "DETAILS"}
         try:
-            self.table.update_item(
-                Key={"pk": f"ROOM#{room_id}", "sk": "DETAILS"},
-                UpdateExpression="SET #attribute=:value",
-                ExpressionAttributeNames={"#attribute": "room_status"},
-                ExpressionAttributeValues={
-                    ":value": status.value,
-                },
-                ConditionExpression="attribute_exists(pk)",
+            details = self.client.get_item(
+                TableName=self.table.name,
+                Key=key,
+                ProjectionExpression="category, hk_pk, hk_sk",
+            ).get("Item")
+        except ClientError as err:
+            logger.error(f"Error retrieving room {room_id}: {err}")
+            raise
+        if not details:
+            return False
+
+        update = {
+            "TableName": self.table.name,
+            "Key": key,
+            "UpdateExpression": "SET #attribute=:value",
+            "ConditionExpression": "attribute_exists(pk)",
+            "ExpressionAttributeNames": {"#attribute": "room_status"},
+            "ExpressionAttributeValues": {":value": status.value},
+        }
+        if expected is not None:
+            update["ConditionExpression"] = "#attribute=:expected"
+            update["ExpressionAttributeValues"][":expected"] = expected.value
+        transact_items = [
+            {"Update": update},
+            {
+                "Update": {
+                    "TableName": self.table.name,
+                    "Key": {
+                        "pk": f"CATEGORY#{details['category']}",
+                        "sk": f"ROOM#{room_id}",
+                    },
+                    "UpdateExpression": "SET #attribute=:value",
+                    "ExpressionAttributeNames": {"#attribute": "room_status"},
+                    "ExpressionAttributeValues": {":value": status.value},
+                }
+            },
+        ]
+        if status == RoomStatus.AVAILABLE and "hk_sk" in details:
+            update["UpdateExpression"] += " REMOVE hk_pk, hk_sk"
+            update["ConditionExpression"] += " AND hk_sk=:hk_sk"
+            update["ExpressionAttributeValues"][":hk_sk"] = details["hk_sk"]
+            transact_items.append(
+                {
+                    "Delete": {
+                        "TableName": self.table.name,
+                        "Key": {"pk": details["hk_pk"], "sk": details["hk_sk"]},
+                    }
+                }
             )
-        
+
+        try:
+            self.client.transact_write_items(TransactItems=transact_items)
         except ClientError as err:
-            if (
-                err.response.get("Error", {}).get("Code")
-                == "ConditionalCheckFailedException"
-            ):
-                raise NotFoundException("room", room_id, 404)
+            reasons = err.response.get("CancellationReasons", [])
+            if any(reason.get("Code") == "ConditionalCheckFailed" for reason in reasons):
+                return False
             logger.error(f"Error updating room {room_id} status: {err}")
             raise
+        finally:
+            self.invalidate_status_map(CATEGORIES.get(details["category"]))
+        return True
+
+    def get_housekeeping_page(
+        self,
+        day: date,
+        limit: Optional[int] = None,
+        exclusive_start_key: Optional[dict] = None,
+    ) -> Tuple[List[HousekeepingTask], Optional[dict]]:
+        pk = f"HK#{day.isoformat()}"
+        query_kwargs = {"KeyConditionExpression": Key("pk").eq(pk)}
+        if limit:
+            query_kwargs["Limit"] = limit
+        if exclusive_start_key:
+            if exclusive_start_key.get("pk") != pk:
+                raise InvalidCursor("cursor does not belong to this day")
+            query_kwargs["ExclusiveStartKey"] = exclusive_start_key
+
+        try:
+            response = self.table.query(**query_kwargs)
+        except ClientError as err:
+            logger.error(f"Error retrieving housekeeping queue for {day}: {err}")
+            raise
+
+        tasks = [decode_housekeeping_task(item) for item in response.get("Items", [])]
+        return tasks, response.get("LastEvaluatedKey")
 
     def _to_utc(self, dt: datetime) -> datetime:
         if dt.tzinfo is None:
@@ -144,65 +404,245 @@ class RoomRepository:
         return dt.astimezone(timezone.utc)
 
     def _to_iso(self, dt: datetime) -> str:
-        return self._to_utc(dt).isoformat()
+        return to_timestamp(self._to_utc(dt))
 
-    def get_available_rooms(
-        self, category: Category, checkin: datetime, checkout: datetime
-    ) -> list[str]:
-        requested_checkin = self._to_utc(checkin)
-        requested_checkout = self._to_utc(checkout)
-        max_stay_delta = timedelta(days=MAX_STAY)
-        lower_iso = self._to_iso(requested_checkin - max_stay_delta)
-        upper_iso = self._to_iso(requested_checkout)
-        rooms = self.get_rooms_ids_by_category(category)
-        all_room_ids: set[str] = set(rooms)
-        if not all_room_ids:
-            return []
-        blocked_rooms: set[str] = set()
-        try:
-            resp = self.table.query(
-                KeyConditionExpression=(
-                    Key("pk").eq(f"CATEGORY#{category.value}")
-                    & Key("sk").between(
-                        f"CHECKIN#{lower_iso}",
-                        f"CHECKIN#{upper_iso}",
-                    )
+    @staticmethod
+    def _stay_bounds(item: dict) -> tuple[str, str]:
+        checkin = item["sk"].split("CHECKIN#", 1)[1].split("#ROOM#", 1)[0]
+        return normalise_timestamp(checkin), normalise_timestamp(item["checkout"])
+
+    @staticmethod
+    def _expired_hold(item: dict, now: int) -> bool:
+        # a lapsed hold blocks nothing, even before TTL deletes it
+        return "hold_expires_at" in item and item["hold_expires_at"] < now
+
+    def _slice_bounds(self, lower: datetime, upper: datetime) -> List[Tuple[str, str]]:
+        # contiguous CHECKIN#<a>..CHECKIN#<b> ranges; an item whose checkin
+        # equals a shared boundary sorts after CHECKIN#<b> ("#ROOM#" suffix),
+        # so it is read by the next slice only
+        step = (upper - lower) / QUERY_SLICES
+        edges = [self._to_iso(lower + step * i) for i in range(QUERY_SLICES)]
+        edges.append(self._to_iso(upper))
+        return list(zip(edges, edges[1:]))
+
+    def _query_slice(self, category: Category, lower_iso: str, upper_iso: str) -> List[dict]:
+        items = []
+        query_kwargs = {
+            "KeyConditionExpression": (
+                Key("pk").eq(f"CATEGORY#{category.value}")
+                & Key("sk").between(
+                    f"CHECKIN#{lower_iso}",
+                    f"CHECKIN#{upper_iso}",
                 )
+            ),
+            "ProjectionExpression": "sk, room_id, checkout, hold_expires_at",
+        }
+        try:
+            while True:
+                resp = self.table.query(**query_kwargs)
+                items.extend(resp.get("Items", []))
+                if "LastEvaluatedKey" not in resp:
+                    return items
+                query_kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+        except ClientError as err:
+            logger.error(
+                f"Error retrieving bookings for {category.value} between {lower_iso} and {upper_iso}: {err}"
             )
-            for item in resp.get("Items", []):
-                existing_checkout = from_iso_string(item["checkout"])
-                existing_checkin = from_iso_string(
-                    item["sk"].split("CHECKIN#", 1)[1].split("#ROOM#", 1)[0]
-                )
-                if (
-                    requested_checkin < existing_checkout
-                    and existing_checkin < requested_checkout
-                ):
-                    blocked_rooms.add(item["room_id"])
-            while "LastEvaluatedKey" in resp:
-                resp = self.table.query(
-                    KeyConditionExpression=(
-                        Key("pk").eq(f"CATEGORY#{category.value}")
-                        & Key("sk").between(
-                            f"CHECKIN#{lower_iso}",
-                            f"CHECKIN#{upper_iso}",
-                        )
-                    ),
-                    ExclusiveStartKey=resp["LastEvaluatedKey"],
-                )
+            raise
+
+    def get_stays(
+        self, category: Category, start: datetime, end: datetime
+    ) -> List[Tuple[str, str, str]]:
+        """(room_id, checkin, checkout) of every stay overlapping [start, end).
+
+        Timestamps are the stored fixed-width strings. The lookback range is
+        split into QUERY_SLICES time slices that are paged concurrently and
+        merged as each one finishes.
+        """
+        start_utc = self._to_utc(start)
+        start_key = self._to_iso(start_utc)
+        upper_iso = self._to_iso(end)
+        slices = self._slice_bounds(
+            start_utc - timedelta(days=MAX_STAY), self._to_utc(end)
+        )
+        now = to_epoch_seconds(datetime.now(timezone.utc))
+        stays = []
+        with ThreadPoolExecutor(max_workers=QUERY_SLICES) as pool:
+            futures = [
+                pool.submit(self._query_slice, category, lower, upper)
+                for lower, upper in slices
+            ]
+            for future in as_completed(futures):
+                for item in future.result():
+                    if self._expired_hold(item, now):
+                        continue
+                    # fixed-width UTC strings: string order is time order
+                    existing_checkin, existing_checkout = self._stay_bounds(item)
+                    if start_key < existing_checkout and existing_checkin < upper_iso:
+                        stays.append((item["room_id"], existing_checkin, existing_checkout))
+        return stays
+
+    def is_room_free(self, room_id: str, start: datetime, end: datetime) -> bool:
+        """Whether no stay or unexpired hold of this room starts in [start, end).
+
+        Only valid for extending a stay of this room that ends at start:
+        an earlier stay of the room cannot reach past that one.
+        """
+        start_key = self._to_iso(start)
+        end_key = self._to_iso(end)
+        now = to_epoch_seconds(datetime.now(timezone.utc))
+        query_kwargs = {
+            "KeyConditionExpression": (
+                Key("pk").eq(f"ROOM#{room_id}")
+                & Key("sk").between(f"CHECKIN#{start_key}", f"CHECKIN#{end_key}")
+            ),
+            "ProjectionExpression": "sk, hold_expires_at",
+        }
+        try:
+            while True:
+                resp = self.table.query(**query_kwargs)
                 for item in resp.get("Items", []):
-                    existing_checkout = from_iso_string(item["checkout"])
-                    existing_checkin = from_iso_string(
-                        item["sk"].split("CHECKIN#", 1)[1].split("#ROOM#", 1)[0]
-                    )
-                    if (
-                        requested_checkin < existing_checkout
-                        and existing_checkin < requested_checkout
-                    ):
-                        blocked_rooms.add(item["room_id"])
+                    checkin = normalise_timestamp(item["sk"].removeprefix("CHECKIN#"))
+                    if checkin < end_key and not self._expired_hold(item, now):
+                        return False
+                if "LastEvaluatedKey" not in resp:
+                    return True
+                query_kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+        except ClientError as err:
+            logger.error(f"Error retrieving stays of room {room_id}: {err}")
+            raise
+
+    def get_in_service_room_ids(self, category: Category) -> set[str]:
+        return {
+            room_id
+            for room_id, status in self.get_room_status_map(category).items()
+            if status not in OUT_OF_SERVICE
+        }
+
+    def _iter_stays_by_checkout(
+        self, category: Category, lower_iso: str, upper_iso: str
+    ) -> Iterator[dict]:
+        # CHECKOUT# index items in checkout order, strictly after lower_iso
+        # ("$" sorts after "#"); pages are only fetched as the consumer asks
+        query_kwargs = {
+            "KeyConditionExpression": (
+                Key("pk").eq(f"CATEGORY#{category.value}")
+                & Key("sk").between(
+                    f"CHECKOUT#{lower_iso}$",
+                    f"CHECKOUT#{upper_iso}",
+                )
+            ),
+            "ProjectionExpression": "sk, room_id, checkin, hold_expires_at",
+            "Limit": STREAM_PAGE_SIZE,
+        }
+        try:
+            while True:
+                resp = self.table.query(**query_kwargs)
+                yield from resp.get("Items", [])
+                if "LastEvaluatedKey" not in resp:
+                    return
+                query_kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
         except ClientError as err:
             logger.error(
-                f"Error retrieving bookings for {category.value} between {lower_iso} and {upper_iso}: {err}"
+                f"Error retrieving bookings for {category.value} checking out between {lower_iso} and {upper_iso}: {err}"
             )
             raise
-        return list(all_room_ids - blocked_rooms)
+
+    def iter_room_verdicts(
+        self,
+        category: Category,
+        checkin: datetime,
+        checkout: datetime,
+        lookbehind: timedelta = timedelta(0),
+    ) -> Iterator[Tuple[str, Optional[FreeRoom]]]:
+        """Yield (room_id, FreeRoom or None if blocked) per room with a stay ending after checkin.
+
+        Stays are read by checkout, earliest first, so stays that ended
+        before checkin - lookbehind are never read; those inside the
+        lookbehind only record the room's previous checkout. A room's stays
+        never overlap, so the first one ending after checkin decides it: if
+        it starts at or after checkout, every later stay does too. Rooms
+        seen only inside the lookbehind are yielded free once the read ends;
+        rooms with no stay in the range are not yielded, and are free too.
+        Unexpired holds count as stays; expired ones are skipped.
+        """
+        start_utc = self._to_utc(checkin)
+        start_key = self._to_iso(start_utc)
+        checkout_utc = self._to_utc(checkout)
+        checkout_key = self._to_iso(checkout_utc)
+        now = to_epoch_seconds(datetime.now(timezone.utc))
+        previous_checkout = {}
+        seen = set()
+        for item in self._iter_stays_by_checkout(
+            category,
+            self._to_iso(start_utc - lookbehind),
+            self._to_iso(checkout_utc + timedelta(days=MAX_STAY)),
+        ):
+            room_id = item["room_id"]
+            if room_id in seen or self._expired_hold(item, now):
+                continue
+            existing_checkout = item["sk"].removeprefix("CHECKOUT#").split("#ROOM#")[0]
+            if existing_checkout <= start_key:
+                previous_checkout[room_id] = existing_checkout
+                continue
+            seen.add(room_id)
+            existing_checkin = normalise_timestamp(item["checkin"])
+            if existing_checkin < checkout_key:
+                yield room_id, None
+                continue
+            previous = previous_checkout.get(room_id)
+            yield room_id, FreeRoom(
+                room_id=room_id,
+                previous_checkout=parse_timestamp(previous) if previous else None,
+                next_checkin=parse_timestamp(existing_checkin),
+            )
+        # no stay after checkin at all: free, with only the previous checkout known
+        for room_id, previous in previous_checkout.items():
+            if room_id not in seen:
+                yield room_id, FreeRoom(
+                    room_id=room_id, previous_checkout=parse_timestamp(previous)
+                )
+
+    def get_free_rooms(
+        self,
+        category: Category,
+        checkin: datetime,
+        checkout: datetime,
+        limit: Optional[int] = None,
+        lookbehind: timedelta = timedelta(0),
+    ) -> List[FreeRoom]:
+        """Free in-service rooms for the stay, at most ``limit`` of them.
+
+        Stops reading as soon as every room is decided (e.g. all blocked on
+        a full day) or ``limit`` free rooms are confirmed.
+        """
+        undecided = self.get_in_service_room_ids(category)
+        if not undecided:
+            return []
+        free = []
+        for room_id, room in self.iter_room_verdicts(
+            category, checkin, checkout, lookbehind
+        ):
+            if room_id not in undecided:
+                continue
+            undecided.discard(room_id)
+            if room:
+                free.append(room)
+                if limit and len(free) >= limit:
+                    return free
+            if not undecided:
+                return free
+        free.extend(FreeRoom(room_id=room_id) for room_id in undecided)
+        return free[:limit] if limit else free
+
+    def get_available_rooms(
+        self,
+        category: Category,
+        checkin: datetime,
+        checkout: datetime,
+        limit: Optional[int] = None,
+    ) -> list[str]:
+        return [
+            room.room_id
+            for room in self.get_free_rooms(category, checkin, checkout, limit)
+        ]
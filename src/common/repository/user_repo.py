@@ -2,7 +2,8 @@ from botocore.exceptions import ClientError
 import logging
 from typing import Optional
 from boto3.dynamodb.conditions import Key
-from common.models.users import User, UserRole
+from common.models.users import User
+from common.repository.decoders import decode_user
 
 from typing import TYPE_CHECKING
 
@@ -97,11 +98,4 @@ class UserRepository:
 
     @staticmethod
     def _to_domain(item: dict) -> User:
-        return User(
-            user_id=item["pk"].split("#", 1)[1],
-            username=item["username"],
-            email=item["email"],
-            phone_number=item.get("phone_number"),
-            role=UserRole(item["role"]),
-            password=item["password"],
-        )
+        return decode_user(item)
@@ -29,3 +29,14 @@ class BookingRequest(BaseModel):
         self.checkout = checkout_utc
 
         return self
+
+
+class ExtendStayRequest(BaseModel):
+    checkout: datetime
+
+    @model_validator(mode="after")
+    def validate_and_normalize(self):
+        if self.checkout.tzinfo is None:
+            raise ValueError("checkout must include timezone info")
+        self.checkout = self.checkout.astimezone(timezone.utc)
+        return self
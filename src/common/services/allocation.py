@@ -0,0 +1,78 @@
+import random
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from common.models.rooms import FreeRoom
+
+# how far either side of a stay best-fit looks for neighbouring bookings;
+# a longer gap is as good as an open calendar
+BEST_FIT_HORIZON = timedelta(days=7)
+# candidate rooms tried when the chosen one is taken by a concurrent booking
+ALLOCATION_ATTEMPTS = 3
+
+
+class FirstFitStrategy:
+    """Take one of the first free rooms found; needs the least reading.
+
+    The few rooms read are shuffled so concurrent requests do not all go
+    for the same one.
+    """
+
+    limit: Optional[int] = ALLOCATION_ATTEMPTS
+    lookbehind = timedelta(0)
+
+    def rank(self, rooms: List[FreeRoom], checkin: datetime, checkout: datetime) -> List[str]:
+        return [room.room_id for room in random.sample(rooms, len(rooms))]
+
+
+class RandomStrategy:
+    """Spread bookings evenly over the free rooms."""
+
+    limit: Optional[int] = None
+    lookbehind = timedelta(0)
+
+    def rank(self, rooms: List[FreeRoom], checkin: datetime, checkout: datetime) -> List[str]:
+        return [room.room_id for room in random.sample(rooms, len(rooms))]
+
+
+class BestFitStrategy:
+    """Take the room whose neighbouring bookings leave the smallest gaps.
+
+    Stays placed against existing ones keep free nights together, so long
+    stays still fit later instead of meeting 1-2 night holes.
+    """
+
+    limit: Optional[int] = None
+    lookbehind = BEST_FIT_HORIZON
+
+    def _gap(self, start: Optional[datetime], end: Optional[datetime]) -> timedelta:
+        if start is None or end is None:
+            return BEST_FIT_HORIZON
+        return min(end - start, BEST_FIT_HORIZON)
+
+    def rank(self, rooms: List[FreeRoom], checkin: datetime, checkout: datetime) -> List[str]:
+        # equally good rooms in random order, so concurrent requests for the
+        # same stay spread out instead of racing for one room
+        ranked = sorted(
+            rooms,
+            key=lambda room: (
+                self._gap(room.previous_checkout, checkin)
+                + self._gap(checkout, room.next_checkin),
+                random.random(),
+            ),
+        )
+        return [room.room_id for room in ranked]
+
+
+ALLOCATION_STRATEGIES = {
+    "first_fit": FirstFitStrategy,
+    "random": RandomStrategy,
+    "best_fit": BestFitStrategy,
+}
+
+
+def get_allocation_strategy(name: str):
+    try:
+        return ALLOCATION_STRATEGIES[name]()
+    except KeyError:
+        raise ValueError(f"unknown allocation strategy {name!r}") from None
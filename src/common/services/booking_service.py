@@ -1,14 +1,17 @@
 from common.repository.booking_repo import BookingRepository
-from common.models.bookings import Booking, BookingStatus
+from common.models.bookings import Booking, BookingStatus, Hold
 from common.schemas.bookings import BookingRequest
 from common.models.rooms import Category
-from typing import List,Optional
+from typing import List,Optional,Tuple
 from common.repository.user_repo import UserRepository
 from common.repository.room_repo import RoomRepository
-from common.utils.custom_exceptions import NotFoundException,NoAvailableRooms
-from common.services.schedule_service import SchedulerService
+from common.utils.custom_exceptions import NotFoundException,NoAvailableRooms,InvalidBookingState,InvalidDates,IdempotencyKeyReused,RoomTaken
+from common.services.allocation import ALLOCATION_ATTEMPTS, BestFitStrategy
+from common.utils.cursor import encode_cursor, decode_cursor
+from common.utils.constants import HOLD_MINUTES, MAX_STAY
+from datetime import datetime, timezone, timedelta
+from hashlib import sha256
 from uuid import uuid4
-import random
 
 class BookingService:
     def __init__(
@@ -16,14 +19,28 @@ class BookingService:
         booking_repo: BookingRepository,
         user_repo: UserRepository,
         room_repo: RoomRepository,
-        schedule_service:Optional[SchedulerService]=None
+        allocation_strategy=None,
     ):
         self.booking_repo = booking_repo
         self.user_repo = user_repo
         self.room_repo = room_repo
-        self.schedule_service=schedule_service
+        self.allocation_strategy = allocation_strategy or BestFitStrategy()
+
+    def add_booking(
+        self, req: BookingRequest, user_id: str, idempotency_key: Optional[str] = None
+    ) -> str:
+        """Book a room; returns the booking id.
+
+        A repeated idempotency_key returns the first request's booking without
+        booking again.
+        """
+        request_hash = None
+        if idempotency_key:
+            request_hash = sha256(req.model_dump_json().encode()).hexdigest()
+            booking_id = self._replay(user_id, idempotency_key, request_hash)
+            if booking_id:
+                return booking_id
 
-    def add_booking(self, req: BookingRequest, user_id: str):
         user = self.user_repo.get_by_id(user_id)
         if user is None:
             raise NotFoundException(
@@ -36,50 +53,192 @@ class BookingService:
 
         price = float(price)
         booking_id = str(uuid4())
-        room_id = self._allocate_room(category,req)
-        booking = Booking(
-            booking_id=booking_id,
-            user_id=user_id,
-            room_id=room_id,
-            category=category,
-            checkin=req.checkin,
-            checkout=req.checkout,
-            price_per_night=price,
-            user_email=user.email,
-        )
-        self.booking_repo.add_booking(booking)
-        if self.schedule_service:
-            self.schedule_service.schedule_checkout(
+        for room_id in self._candidate_rooms(category, req):
+            booking = Booking(
                 booking_id=booking_id,
                 user_id=user_id,
                 room_id=room_id,
-                checkout_time=booking.checkout,
+                category=category,
+                checkin=req.checkin,
+                checkout=req.checkout,
+                price_per_night=price,
+                user_email=user.email,
+            )
+            # the checkout schedule is created from the booking's outbox entry
+            try:
+                if not self.booking_repo.add_booking(booking, idempotency_key, request_hash):
+                    # a concurrent retry with the same key booked first
+                    return self._replay(user_id, idempotency_key, request_hash)
+            except RoomTaken:
+                continue
+            return booking_id
+        raise NoAvailableRooms("the free rooms were just taken, please try again")
+
+    def _replay(self, user_id: str, idempotency_key: str, request_hash: str) -> Optional[str]:
+        record = self.booking_repo.get_idempotency_record(user_id, idempotency_key)
+        if record is None:
+            return None
+        if record["request_hash"] != request_hash:
+            raise IdempotencyKeyReused("Idempotency-Key was already used for a different request")
+        return record["booking_id"]
+
+    def hold_room(self, req: BookingRequest, user_id: str) -> Hold:
+        """Reserve a room for HOLD_MINUTES while the guest pays."""
+        if self.user_repo.get_by_id(user_id) is None:
+            raise NotFoundException("user", user_id, 404)
+        category = Category(req.category.upper())
+        price = self.room_repo.get_category_price(category)
+        if price is None:
+            raise NotFoundException("category", category.value, 404)
+
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=HOLD_MINUTES)
+        for room_id in self._candidate_rooms(category, req):
+            hold = Hold(
+                hold_id=str(uuid4()),
+                user_id=user_id,
+                room_id=room_id,
+                category=category,
+                checkin=req.checkin,
+                checkout=req.checkout,
+                price_per_night=float(price),
+                expires_at=expires_at,
             )
+            if self.booking_repo.add_hold(hold):
+                return hold
+        raise NoAvailableRooms("the free rooms were just taken, please try again")
+
+    def confirm_hold(self, hold_id: str, user_id: str) -> str:
+        """Book the held room at the held price; returns the booking id."""
+        hold = self.booking_repo.get_hold(hold_id)
+        if (
+            hold is None
+            or hold.user_id != user_id
+            or hold.expires_at < datetime.now(timezone.utc)
+        ):
+            raise NotFoundException("hold", hold_id, 404)
+        user = self.user_repo.get_by_id(user_id)
+        if user is None:
+            raise NotFoundException("user", user_id, 404)
+
+        booking = Booking(
+            booking_id=str(uuid4()),
+            user_id=user_id,
+            room_id=hold.room_id,
+            category=hold.category,
+            checkin=hold.checkin,
+            checkout=hold.checkout,
+            price_per_night=hold.price_per_night,
+            user_email=user.email,
+        )
+        # expired or confirmed by a concurrent request
+        if not self.booking_repo.convert_hold(hold, booking):
+            raise NotFoundException("hold", hold_id, 404)
+        return booking.booking_id
+
+    def cancel_booking(self, booking_id: str, user_id: str, is_staff: bool = False) -> Booking:
+        """Cancel an upcoming booking; guests may only cancel their own."""
+        booking = self.booking_repo.get_booking_by_id(booking_id)
+        if booking is None or (not is_staff and booking.user_id != user_id):
+            raise NotFoundException("booking", booking_id, 404)
+        if booking.status != BookingStatus.UPCOMING:
+            raise InvalidBookingState("only upcoming bookings can be cancelled")
+        if booking.checkin <= datetime.now(timezone.utc):
+            raise InvalidBookingState("the stay has started, use early checkout instead")
+        if not self.booking_repo.cancel_booking(booking):
+            raise InvalidBookingState("only upcoming bookings can be cancelled")
+        booking.status = BookingStatus.CANCELLED
+        return booking
+
+    def extend_stay(
+        self, booking_id: str, user_id: str, new_checkout: datetime, is_staff: bool = False
+    ) -> Booking:
+        """Keep the guest in the same room until new_checkout.
 
-    def update_booking(self, booking_id: str, user_id:str,room_id:str):
-        self.booking_repo.update_booking_status(
+        Only the added nights of this one room are checked, so the cost does
+        not depend on how busy the category is.
+        """
+        booking = self.booking_repo.get_booking_by_id(booking_id)
+        if booking is None or (not is_staff and booking.user_id != user_id):
+            raise NotFoundException("booking", booking_id, 404)
+        if booking.status not in (BookingStatus.UPCOMING, BookingStatus.CHECKED_IN):
+            raise InvalidBookingState("only upcoming or current stays can be extended")
+        if new_checkout <= booking.checkout:
+            raise InvalidDates("new checkout must be after the current checkout")
+        if new_checkout - booking.checkin > timedelta(days=MAX_STAY):
+            raise InvalidDates(f"Maximum stay is {MAX_STAY} days")
+
+        if not self.room_repo.is_room_free(booking.room_id, booking.checkout, new_checkout):
+            raise NoAvailableRooms("the room is not free for the extra nights")
+        # checkout moved or booking ended meanwhile
+        if not self.booking_repo.extend_booking(booking, new_checkout):
+            raise InvalidBookingState("the booking changed, please retry")
+        booking.checkout = new_checkout
+        return booking
+
+    def early_checkout(self, booking_id: str, user_id: str, is_staff: bool = False) -> Booking:
+        """Check a guest out now, before the booked checkout.
+
+        The stay is shortened to now so the remaining nights can be sold, the
+        scheduled auto-checkout is cancelled and the booking and room get the
+        same checkout as update_booking, all in one transaction.
+        """
+        booking = self.booking_repo.get_booking_by_id(booking_id)
+        if booking is None or (not is_staff and booking.user_id != user_id):
+            raise NotFoundException("booking", booking_id, 404)
+        if booking.status not in (BookingStatus.UPCOMING, BookingStatus.CHECKED_IN):
+            raise InvalidBookingState("only current stays can be checked out")
+        now = datetime.now(timezone.utc)
+        if not booking.checkin <= now < booking.checkout:
+            raise InvalidBookingState("the stay is not in progress")
+
+        if not self.booking_repo.shorten_booking(booking, now):
+            raise InvalidBookingState("the booking changed, please retry")
+        booking.checkout = now
+        booking.status = BookingStatus.CHECKED_OUT
+        return booking
+
+    def update_booking(self, booking_id: str, user_id:str,room_id:str) -> bool:
+        return self.booking_repo.update_booking_status(
             booking_id=booking_id,
             user_id=user_id,
             room_id=room_id,
             status=BookingStatus.CHECKED_OUT,
         )                                          
                          
-    def _allocate_room(self, category: Category, req: BookingRequest) -> str:
-        rooms = self.room_repo.get_available_rooms(
+    def _candidate_rooms(self, category: Category, req: BookingRequest) -> List[str]:
+        """Free rooms to try in order; later ones are used when a concurrent
+        booking takes the earlier ones first."""
+        strategy = self.allocation_strategy
+        rooms = self.room_repo.get_free_rooms(
             category,
             req.checkin,
-            req.checkout
+            req.checkout,
+            limit=strategy.limit,
+            lookbehind=strategy.lookbehind,
         )
 
         if not rooms:
             raise NoAvailableRooms("no available rooms for the category")
 
-        return random.choice(rooms)
+        return strategy.rank(rooms, req.checkin, req.checkout)[:ALLOCATION_ATTEMPTS]
 
     
-    def get_user_bookings(self,user_id)->List[Booking]:
+    def get_user_bookings(self,user_id,**filters)->List[Booking]:
         user=self.user_repo.get_by_id(user_id)
         if not user:
             raise NotFoundException("user", user_id, 404)
-        return self.booking_repo.get_user_bookings(user_id)
+        return self.booking_repo.get_user_bookings(user_id,**filters)
+
+    def get_user_bookings_page(
+        self, user_id: str, limit: int, cursor: Optional[str] = None, **filters
+    ) -> Tuple[List[Booking], Optional[str]]:
+        user = self.user_repo.get_by_id(user_id)
+        if not user:
+            raise NotFoundException("user", user_id, 404)
+        start_key = decode_cursor(cursor) if cursor else None
+        bookings, last_key = self.booking_repo.get_user_bookings_page(
+            user_id, limit=limit, exclusive_start_key=start_key, **filters
+        )
+        next_cursor = encode_cursor(last_key) if last_key else None
+        return bookings, next_cursor
 
@@ -0,0 +1,58 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from common.repository.outbox_repo import (
+    CANCEL_CHECKOUT,
+    OutboxRepository,
+    SCHEDULE_CHECKOUT,
+)
+from common.services.schedule_service import SchedulerService
+
+logger = logging.getLogger(__name__)
+
+# scheduler calls made at once; there is no batch create in the Scheduler API
+OUTBOX_WORKERS = 8
+OUTBOX_BATCH_SIZE = 25
+
+
+class OutboxProcessor:
+    def __init__(self, outbox_repo: OutboxRepository, schedule_service: SchedulerService):
+        self.outbox_repo = outbox_repo
+        self.schedule_service = schedule_service
+
+    def _apply(self, entry: dict):
+        action = entry.get("action")
+        if action == SCHEDULE_CHECKOUT:
+            self.schedule_service.schedule_checkout(
+                booking_id=entry["booking_id"],
+                user_id=entry["user_id"],
+                room_id=entry["room_id"],
+                checkout_time=entry["checkout"],
+            )
+        elif action == CANCEL_CHECKOUT:
+            self.schedule_service.cancel_checkout(entry["booking_id"])
+        else:
+            raise ValueError(f"unknown outbox action {action!r}")
+        self.outbox_repo.delete(entry)
+
+    def process(self, entries: List[dict]) -> List[bool]:
+        """Apply entries concurrently; True where an entry was applied.
+
+        Failed entries stay in the outbox and are retried on the next run.
+        """
+        if not entries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(OUTBOX_WORKERS, len(entries))) as pool:
+            futures = [pool.submit(self._apply, entry) for entry in entries]
+        results = []
+        for entry, future in zip(entries, futures):
+            err = future.exception()
+            if err:
+                logger.error(f"Outbox entry {entry.get('sk')} failed: {err}")
+            results.append(err is None)
+        return results
+
+    def drain(self, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+        """Apply one batch of pending entries; returns how many were applied."""
+        return sum(self.process(self.outbox_repo.get_pending(limit=batch_size)))
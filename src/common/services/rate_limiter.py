@@ -0,0 +1,99 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from common.repository.rate_limit_repo import RateLimitRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    capacity: int
+    refill_seconds: int
+
+
+RATE_LIMITS = {
+    # each booking runs availability queries on the category's hot partition
+    "create_booking": RateLimit(capacity=10, refill_seconds=60),
+    # per client IP: each attempt is a bcrypt check
+    "login": RateLimit(capacity=20, refill_seconds=60),
+    # per account: only wrong passwords count, checked before the bcrypt check
+    "login_failure": RateLimit(capacity=5, refill_seconds=60),
+}
+
+# blocked keys remembered per container before expired ones are swept
+MAX_BLOCKED_KEYS = 10_000
+
+
+class RateLimiter:
+    """Fixed-window counter per route and key, reset every refill_seconds.
+
+    Requests are counted in the table so every container shares the window.
+    Keys found full are remembered until the window ends, so a warm container
+    rejects repeat offenders without a write.
+    """
+
+    def __init__(self, repo: RateLimitRepository, route: str):
+        self.repo = repo
+        self.route = route
+        self.limit = RATE_LIMITS[route]
+        # key -> epoch second its bucket refills
+        self._blocked: Dict[str, int] = {}
+        # handlers may share the limiter across server threads
+        self._blocked_lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        """Count one request for key; False when its window is already full."""
+        now = time.time()
+        if self._is_blocked(key, now):
+            return False
+
+        window = int(now) // self.limit.refill_seconds
+        refills_at = (window + 1) * self.limit.refill_seconds
+        try:
+            if self.repo.take(f"{self.route}#{key}", window, self.limit.capacity, refills_at):
+                return True
+        except (ClientError, BotoCoreError) as err:
+            # an unavailable limiter must not take the endpoint down with it
+            logger.error(f"Rate limit check for {self.route} failed, allowing: {err}")
+            return True
+
+        self._block(key, refills_at, now)
+        return False
+
+    def exhausted(self, key: str) -> bool:
+        """Whether key's window is full, without counting a request."""
+        now = time.time()
+        if self._is_blocked(key, now):
+            return True
+
+        window = int(now) // self.limit.refill_seconds
+        try:
+            hits = self.repo.count(f"{self.route}#{key}", window)
+        except (ClientError, BotoCoreError) as err:
+            logger.error(f"Rate limit check for {self.route} failed, allowing: {err}")
+            return False
+        if hits < self.limit.capacity:
+            return False
+
+        self._block(key, (window + 1) * self.limit.refill_seconds, now)
+        return True
+
+    def _is_blocked(self, key: str, now: float) -> bool:
+        with self._blocked_lock:
+            refills_at = self._blocked.get(key)
+            if refills_at is not None and now < refills_at:
+                return True
+            self._blocked.pop(key, None)
+        return False
+
+    def _block(self, key: str, refills_at: int, now: float):
+        with self._blocked_lock:
+            if len(self._blocked) >= MAX_BLOCKED_KEYS:
+                self._blocked = {k: t for k, t in self._blocked.items() if t > now}
+            self._blocked[key] = refills_at
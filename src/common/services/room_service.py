@@ -1,28 +1,97 @@
 from common.repository.room_repo import RoomRepository
-from common.models.rooms import RoomStatus, Category, Room
-from typing import List, Optional
-from common.utils.custom_exceptions import NoAvailableRooms, InvalidDates
-from datetime import datetime, timezone, timedelta
-from common.utils.constants import MAX_STAY
+from common.models.rooms import (
+    CategoryAvailability,
+    Category,
+    HousekeepingTask,
+    NightAvailability,
+    Room,
+    RoomStatus,
+    StayOption,
+)
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from common.utils.custom_exceptions import NoAvailableRooms, InvalidDates, NotFoundException
+from datetime import date, datetime, timezone, timedelta
+from common.utils.cursor import encode_cursor, decode_cursor
+from common.utils.constants import MAX_CALENDAR_DAYS, MAX_STAY
+from common.utils.occupancy import free_starts, night_instant, nightly_occupancy
+from common.repository.decoders import parse_timestamp
+
+
+# bookings are made from other containers, so cached nights can only expire
+CALENDAR_TTL_SECONDS = 60
+# identical searches share one query while it runs and for this long after;
+# short enough that a booking made meanwhile shows almost at once
+SEARCH_TTL_SECONDS = 1.0
+# finished searches kept before expired ones are swept
+MAX_SEARCH_FLIGHTS = 1000
+
+
+class _SearchFlight:
+    """One availability query, awaited by every identical concurrent search."""
+
+    __slots__ = ("done", "room_ids", "error", "finished_at")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.room_ids: List[str] = []
+        self.error: Optional[Exception] = None
+        self.finished_at = 0.0
 
 
 class RoomService:
     def __init__(self, room_repo: RoomRepository):
         self.room_repo = room_repo
+        # (category, night) -> (computed_at, free rooms)
+        self._calendar_cache: Dict[Tuple[Category, date], Tuple[float, int]] = {}
+        # (category, checkin, checkout) -> running or recently finished search
+        self._search_flights: Dict[Tuple[Category, datetime, datetime], _SearchFlight] = {}
+        self._search_lock = threading.Lock()
 
-    def add_room(self, room_id: str, category: Category):
-        room = Room(room_id=room_id, category=category)
+    def add_room(self, room_id: str, category: Category, floor: Optional[int] = None):
+        room = Room(room_id=room_id, category=category, floor=floor)
         self.room_repo.add_room(room=room)
 
+    def add_rooms(self, rooms: List[Room]) -> Tuple[List[str], List[str], List[str]]:
+        unique: dict[str, Room] = {}
+        duplicates = []
+        for room in rooms:
+            if room.room_id in unique:
+                duplicates.append(room.room_id)
+            else:
+                unique[room.room_id] = room
+
+        conflicts, failed = self.room_repo.add_rooms(list(unique.values()))
+        rejected = set(conflicts) | set(failed)
+        added = [room_id for room_id in unique if room_id not in rejected]
+        return added, conflicts + duplicates, failed
+
     def update_room_status(
         self, room_id: str, status: Optional[str] = RoomStatus.HOUSEKEEPING
     ):
         self.room_repo.update_room_status(room_id, status)
 
-    def get_available_rooms(
-        self, category: Category, checkin: datetime, checkout: datetime
-    ):
+    def update_floor_status(
+        self, floor: int, from_status: RoomStatus, to_status: RoomStatus
+    ) -> List[str]:
+        room_ids = self.room_repo.get_room_ids_by_floor(floor)
+        if not room_ids:
+            raise NotFoundException("floor", str(floor), 404)
+        return self.room_repo.update_rooms_status(room_ids, from_status, to_status)
+
+    def get_housekeeping_queue(
+        self, day: date, limit: int, cursor: Optional[str] = None
+    ) -> Tuple[List[HousekeepingTask], Optional[str]]:
+        start_key = decode_cursor(cursor) if cursor else None
+        tasks, last_key = self.room_repo.get_housekeeping_page(
+            day, limit=limit, exclusive_start_key=start_key
+        )
+        next_cursor = encode_cursor(last_key) if last_key else None
+        return tasks, next_cursor
 
+    def _validate_stay(self, checkin: datetime, checkout: datetime):
         if checkout <= checkin:
             raise InvalidDates("checkout must be after checkin")
         now = datetime.now(timezone.utc)
@@ -32,8 +101,171 @@ class RoomService:
         if checkout - checkin > max_stay:
             raise ValueError(f"Maximum stay is {MAX_STAY} days")
 
-        rooms = self.room_repo.get_available_rooms(category, checkin, checkout)
+    def get_available_rooms(
+        self, category: Category, checkin: datetime, checkout: datetime
+    ):
+        self._validate_stay(checkin, checkout)
+
+        rooms = self._search(category, checkin, checkout)
 
         if not rooms:
             raise NoAvailableRooms(f"no {category.value} for {checkin} to {checkout}")
         return rooms
+
+    def _search(self, category: Category, checkin: datetime, checkout: datetime) -> List[str]:
+        """get_available_rooms of the repo, single-flight per (category, checkin, checkout).
+
+        The first caller runs the query; identical calls arriving while it
+        runs, or within SEARCH_TTL_SECONDS after, get its result. Failures
+        are handed to the waiting callers but not kept.
+        """
+        key = (category, checkin, checkout)
+        with self._search_lock:
+            flight = self._search_flights.get(key)
+            leader = flight is None or (
+                flight.done.is_set()
+                and time.monotonic() - flight.finished_at >= SEARCH_TTL_SECONDS
+            )
+            if leader:
+                if len(self._search_flights) >= MAX_SEARCH_FLIGHTS:
+                    self._sweep_searches()
+                flight = self._search_flights[key] = _SearchFlight()
+
+        if leader:
+            try:
+                flight.room_ids = self.room_repo.get_available_rooms(category, checkin, checkout)
+            except Exception as err:
+                flight.error = err
+                with self._search_lock:
+                    if self._search_flights.get(key) is flight:
+                        del self._search_flights[key]
+            finally:
+                flight.finished_at = time.monotonic()
+                flight.done.set()
+        else:
+            flight.done.wait()
+
+        if flight.error is not None:
+            raise flight.error
+        # callers get their own list; the result is shared
+        return list(flight.room_ids)
+
+    def _sweep_searches(self):
+        now = time.monotonic()
+        self._search_flights = {
+            key: flight
+            for key, flight in self._search_flights.items()
+            if not flight.done.is_set() or now - flight.finished_at < SEARCH_TTL_SECONDS
+        }
+
+    def get_availability(
+        self, categories: Sequence[Category], checkin: datetime, checkout: datetime
+    ) -> List[CategoryAvailability]:
+        """Free rooms and price for several categories, queried concurrently.
+
+        Unlike get_available_rooms, a category with no free rooms is
+        returned with an empty list rather than raising.
+        """
+        self._validate_stay(checkin, checkout)
+
+        def load(category: Category) -> CategoryAvailability:
+            return CategoryAvailability(
+                category=category,
+                price_per_night=self.room_repo.get_category_price(category),
+                room_ids=self._search(category, checkin, checkout),
+            )
+
+        with ThreadPoolExecutor(max_workers=len(categories) or 1) as pool:
+            return list(pool.map(load, categories))
+
+    def _stays_for_nights(
+        self, category: Category, first_night: date, nights: int
+    ) -> Tuple[set, Dict[str, List[Tuple[datetime, datetime]]]]:
+        # in-service room ids, and their stays touching the nights, from one fetch
+        room_ids = self.room_repo.get_in_service_room_ids(category)
+        stays: Dict[str, List[Tuple[datetime, datetime]]] = {}
+        for room_id, checkin, checkout in self.room_repo.get_stays(
+            category,
+            night_instant(first_night),
+            night_instant(first_night + timedelta(days=nights)),
+        ):
+            if room_id in room_ids:
+                stays.setdefault(room_id, []).append(
+                    (parse_timestamp(checkin), parse_timestamp(checkout))
+                )
+        return room_ids, stays
+
+    def get_calendar(
+        self, category: Category, first_night: date, nights: int
+    ) -> List[NightAvailability]:
+        if nights < 1 or nights > MAX_CALENDAR_DAYS:
+            raise ValueError(f"days must be between 1 and {MAX_CALENDAR_DAYS}")
+        if first_night < datetime.now(timezone.utc).date():
+            raise InvalidDates("calendar cannot start in the past")
+
+        days = [first_night + timedelta(days=i) for i in range(nights)]
+        now = time.monotonic()
+        cached = [self._calendar_cache.get((category, day)) for day in days]
+        if all(entry and now - entry[0] < CALENDAR_TTL_SECONDS for entry in cached):
+            return [NightAvailability(day, entry[1]) for day, entry in zip(days, cached)]
+
+        room_ids, stays = self._stays_for_nights(category, first_night, nights)
+        occupancy = nightly_occupancy(
+            (stay for room_stays in stays.values() for stay in room_stays),
+            first_night,
+            nights,
+        )
+
+        calendar = []
+        for day, occupied in zip(days, occupancy):
+            free = len(room_ids) - occupied
+            self._calendar_cache[(category, day)] = (now, free)
+            calendar.append(NightAvailability(day, free))
+        return calendar
+
+    def find_start_dates(
+        self,
+        category: Category,
+        window_start: date,
+        window_end: date,
+        nights: int,
+        limit: Optional[int] = None,
+    ) -> List[StayOption]:
+        """Start dates in [window_start, window_end] for a stay of `nights`,
+        best first (most free rooms, then earliest).
+
+        A start counts a room only when that same room is free for every
+        night of the stay, so per-room occupancy is slid over the window
+        rather than the category totals.
+        """
+        if nights < 1 or nights > MAX_STAY:
+            raise ValueError(f"nights must be between 1 and {MAX_STAY}")
+        if window_end < window_start:
+            raise InvalidDates("window end must not be before its start")
+        if window_start < datetime.now(timezone.utc).date():
+            raise InvalidDates("window cannot start in the past")
+        starts = (window_end - window_start).days + 1
+        if starts > MAX_CALENDAR_DAYS:
+            raise ValueError(f"window must be at most {MAX_CALENDAR_DAYS} days")
+
+        horizon = starts + nights - 1
+        room_ids, stays = self._stays_for_nights(category, window_start, horizon)
+
+        # rooms with no stays in the horizon are free for every start
+        free_counts = [len(room_ids) - len(stays)] * starts
+        for room_stays in stays.values():
+            occupancy = nightly_occupancy(room_stays, window_start, horizon)
+            for start, free in enumerate(free_starts(occupancy, nights)):
+                free_counts[start] += free
+
+        options = [
+            StayOption(
+                checkin=window_start + timedelta(days=start),
+                checkout=window_start + timedelta(days=start + nights),
+                free_rooms=free,
+            )
+            for start, free in enumerate(free_counts)
+            if free
+        ]
+        options.sort(key=lambda option: (-option.free_rooms, option.checkin))
+        return options[:limit] if limit else options
@@ -60,6 +60,21 @@ class SchedulerService:
             logger.exception(f"Failed to schedule checkout for {booking_id}")
             raise e
 
+    def cancel_checkout(self, booking_id: str) -> bool:
+        schedule_name = f"checkout-{booking_id}"
+        try:
+            self.client.delete_schedule(Name=schedule_name)
+            logger.info(f"Deleted checkout schedule for {booking_id}")
+            return True
+
+        except self.client.exceptions.ResourceNotFoundException:
+            logger.info(f"Schedule {schedule_name} does not exist")
+            return False
+
+        except Exception as e:
+            logger.exception(f"Failed to delete checkout schedule for {booking_id}")
+            raise e
+
     def _to_at_expression(self, dt: datetime) -> str:
         if isinstance(dt, str):
             dt = datetime.fromisoformat(dt)
@@ -1 +1,7 @@
 MAX_STAY = 30
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+MAX_IMPORT_ROOMS = 1000
+MAX_CALENDAR_DAYS = 90
+HOLD_MINUTES = 10
+IDEMPOTENCY_HOURS = 24
@@ -0,0 +1,59 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+from common.utils.custom_exceptions import InvalidCursor
+from common.utils.constants import MAX_PAGE_SIZE
+
+CURSOR_SECRET = os.environ.get("CURSOR_SECRET") or os.environ.get("JWT_SECRET")
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    if not CURSOR_SECRET:
+        raise RuntimeError("CURSOR_SECRET or JWT_SECRET environment variable is not set")
+    return hmac.new(CURSOR_SECRET.encode(), payload, hashlib.sha256).digest()
+
+
+def encode_cursor(key: dict) -> str:
+    payload = json.dumps(key, separators=(",", ":"), sort_keys=True).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        encoded_payload, encoded_signature = cursor.split(".", 1)
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except (ValueError, TypeError, AttributeError):
+        raise InvalidCursor("invalid cursor")
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursor("invalid cursor")
+
+    try:
+        key = json.loads(payload)
+    except ValueError:
+        raise InvalidCursor("invalid cursor")
+    if not isinstance(key, dict):
+        raise InvalidCursor("invalid cursor")
+    return key
+
+
+def parse_limit(value) -> int:
+    """Page size from a query string; ValueError carries the 400 message."""
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer")
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    return limit
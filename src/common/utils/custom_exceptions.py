@@ -25,4 +25,16 @@ class InvalidDates(Exception):
     pass
 
 class RoomAlreadyExists(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class InvalidCursor(Exception):
+    pass
+
+class InvalidBookingState(Exception):
+    pass
+
+class IdempotencyKeyReused(Exception):
+    pass
+
+class RoomTaken(Exception):
+    pass
@@ -1,20 +1,59 @@
-from pydantic import BaseModel
+from dataclasses import is_dataclass
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
 from typing import Generic, TypeVar, Optional
 
 T = TypeVar("T")
 
+JSON_HEADERS = {
+    'Content-Type': 'application/json',
+}
+
+# compiled serializers per dataclass type (and list of it), built on first use
+_ADAPTERS: dict = {}
 
 
 class APIResponse(BaseModel, Generic[T]):
     status_code: int
     message: str
     data: Optional[T] = None
-    
+
+
+def _adapter(tp) -> TypeAdapter:
+    adapter = _ADAPTERS.get(tp)
+    if adapter is None:
+        adapter = _ADAPTERS[tp] = TypeAdapter(tp)
+    return adapter
+
+
+def _encode(value) -> bytes:
+    if isinstance(value, dict) and all(type(k) is str for k in value):
+        return b"{" + b",".join(to_json(k) + b":" + _encode(v) for k, v in value.items()) + b"}"
+    if isinstance(value, list) and value and is_dataclass(value[0]):
+        cls = type(value[0])
+        if all(type(item) is cls for item in value):
+            return _adapter(list[cls]).dump_json(value)
+    elif is_dataclass(value) and not isinstance(value, type):
+        return _adapter(type(value)).dump_json(value)
+    return to_json(value)
+
+
+def build_body(status_code: int, message: str, data: Optional[T] = None) -> str:
+    # byte-identical to APIResponse(...).model_dump_json(exclude_none=True), without
+    # building and validating the model; domain dataclasses go through a compiled
+    # per-type serializer instead of pydantic's per-object inference
+    payload = {'status_code': status_code, 'message': message}
+    if data is None:
+        return to_json(payload).decode()
+    payload['data'] = data
+    if isinstance(data, (str, int, float, bool)):
+        return to_json(payload).decode()
+    return _encode(payload).decode()
+
+
 def send_custom_response(status_code:int,message:str,data:Optional[T]=None):
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-        },
-        'body': APIResponse(status_code=status_code, message=message, data=data).model_dump_json(exclude_none=True)
-    }
\ No newline at end of file
+        'headers': JSON_HEADERS,
+        'body': build_body(status_code, message, data),
+    }
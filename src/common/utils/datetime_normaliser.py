@@ -1,7 +1,42 @@
 from datetime import datetime, timezone
 
+# Stored timestamps are fixed-width UTC strings, e.g. 2026-01-29T06:00:00.000000Z.
+# Every value has the same length and offset, so string order is time order and
+# sort-key ranges / overlap checks can compare the stored strings directly.
+TIMESTAMP_LENGTH = len("2026-01-29T06:00:00.000000Z")
+
+
 def from_iso_string(value: str) -> datetime:
     dt = datetime.fromisoformat(value)
     if dt.tzinfo is None:
         raise ValueError("Stored datetime must be timezone-aware")
-    return dt.astimezone(timezone.utc)
\ No newline at end of file
+    return dt.astimezone(timezone.utc)
+
+
+def to_timestamp(value: datetime | str) -> str:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        raise ValueError("Datetime must be timezone-aware")
+    utc = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return utc.isoformat(timespec="microseconds") + "Z"
+
+
+def is_canonical_timestamp(value: str) -> bool:
+    return len(value) == TIMESTAMP_LENGTH and value[-1] == "Z"
+
+
+def normalise_timestamp(value: str) -> str:
+    # rows written before the fixed-width format carried "+00:00" offsets and
+    # optional microseconds; re-encode those so comparisons stay exact
+    if is_canonical_timestamp(value):
+        return value
+    return to_timestamp(value)
+
+
+def to_epoch_seconds(value: datetime | str) -> int:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        raise ValueError("Datetime must be timezone-aware")
+    return int(value.timestamp())
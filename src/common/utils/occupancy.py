@@ -0,0 +1,69 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, List, Tuple
+
+DAY = timedelta(days=1)
+
+
+def night_instant(night: date) -> datetime:
+    # a stay takes night d when it spans the midnight that closes it, so a
+    # 14:00 check-in / 11:00 checkout stay takes exactly one night
+    return datetime.combine(night + DAY, time(), tzinfo=timezone.utc)
+
+
+def stay_nights(checkin: datetime, checkout: datetime) -> List[date]:
+    """The nights a stay takes: those whose closing midnight is in [checkin, checkout)."""
+    midnight = datetime.combine(checkin.astimezone(timezone.utc).date(), time(), tzinfo=timezone.utc)
+    if midnight < checkin:
+        midnight += DAY
+    nights = []
+    while midnight < checkout:
+        nights.append((midnight - DAY).date())
+        midnight += DAY
+    return nights
+
+
+def _ceil_days(delta: timedelta) -> int:
+    return -((-delta) // DAY)
+
+
+def nightly_occupancy(
+    stays: Iterable[Tuple[datetime, datetime]], first_night: date, nights: int
+) -> List[int]:
+    """Occupied-room count per night, from one sweep over stay boundaries.
+
+    Each stay adds +1 at its first night and -1 after its last; a prefix
+    sum over those deltas gives every night's count in O(stays + nights).
+    """
+    base = night_instant(first_night)
+    deltas = [0] * (nights + 1)
+    for checkin, checkout in stays:
+        # first night whose closing midnight falls in [checkin, checkout)
+        first = max(_ceil_days(checkin - base), 0)
+        end = min(_ceil_days(checkout - base), nights)
+        if first < end:
+            deltas[first] += 1
+            deltas[end] -= 1
+
+    occupancy = []
+    running = 0
+    for delta in deltas[:nights]:
+        running += delta
+        occupancy.append(running)
+    return occupancy
+
+
+def free_starts(occupancy: List[int], nights: int) -> List[bool]:
+    """For each start index, whether `nights` consecutive nights are all free.
+
+    Keeps a running count of occupied nights in a window that slides one
+    night at a time, so the whole pass is O(len(occupancy)).
+    """
+    starts = len(occupancy) - nights + 1
+    if starts <= 0:
+        return []
+    occupied = sum(1 for count in occupancy[:nights] if count)
+    result = [occupied == 0]
+    for start in range(1, starts):
+        occupied += bool(occupancy[start + nights - 1]) - bool(occupancy[start - 1])
+        result.append(occupied == 0)
+    return result
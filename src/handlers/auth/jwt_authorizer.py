@@ -35,8 +35,6 @@ def _get_stage_arn(method_arn: str) -> str:
 
 
 def lambda_handler(event, context):
-    print("Full Event:", event)
-
     try:
         token = event.get("authorizationToken")
 
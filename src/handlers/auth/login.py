@@ -1,6 +1,8 @@
 import os
 from common.repository.user_repo import UserRepository
+from common.repository.rate_limit_repo import RateLimitRepository
 from common.services.user_service import UserService
+from common.services.rate_limiter import RateLimiter
 from common.schemas.users import LoginRequest
 from common.utils.custom_exceptions import IncorrectCredentials, NotFoundException
 from common.utils.custom_response import send_custom_response
@@ -13,6 +15,16 @@ dynamodb = resource("dynamodb", region_name="ap-south-1")
 table = dynamodb.Table(TABLE_NAME)
 repo = UserRepository(table=table)
 service = UserService(user_repo=repo)
+rate_limit_repo = RateLimitRepository(table)
+rate_limiter = RateLimiter(rate_limit_repo, "login")
+failure_limiter = RateLimiter(rate_limit_repo, "login_failure")
+
+TOO_MANY_ATTEMPTS = "Too many login attempts, please try again later"
+
+
+def _source_ip(event):
+    request_context = event.get("requestContext") or {}
+    return (request_context.get("identity") or {}).get("sourceIp")
 
 
 def login_handler(event, context):
@@ -24,6 +36,17 @@ def login_handler(event, context):
         )
         return send_custom_response(400, formatted)
 
+    # per client, before any password hashing; a caller-supplied email would
+    # let anyone lock its owner out
+    source_ip = _source_ip(event)
+    if source_ip and not rate_limiter.allow(source_ip):
+        return send_custom_response(429, TOO_MANY_ATTEMPTS)
+    # per account, also before hashing, so guesses spread over many clients
+    # run out too; only wrong passwords are counted against it
+    email = request_body.email.lower()
+    if failure_limiter.exhausted(email):
+        return send_custom_response(429, TOO_MANY_ATTEMPTS)
+
     try:
         token = service.login(request_body.email, request_body.password)
         return send_custom_response(
@@ -32,6 +55,7 @@ def login_handler(event, context):
     except ClientError as e:
         return send_custom_response(status_code=500, message=str(e))
     except IncorrectCredentials as e:
+        failure_limiter.allow(email)
         return send_custom_response(status_code=401, message=str(e))
     except NotFoundException as e:
         return send_custom_response(status_code=404, message=str(e))
@@ -0,0 +1,47 @@
+import os
+from boto3 import resource
+
+from common.repository.booking_repo import BookingRepository
+from common.repository.user_repo import UserRepository
+from common.repository.room_repo import RoomRepository
+from common.services.booking_service import BookingService
+from common.utils.custom_response import send_custom_response
+from common.utils.custom_exceptions import NotFoundException
+
+TABLE_NAME = os.environ.get("TABLE_NAME")
+
+dynamodb = resource("dynamodb", region_name="ap-south-1")
+table = dynamodb.Table(TABLE_NAME)
+
+booking_repo = BookingRepository(table)
+user_repo = UserRepository(table)
+room_repo = RoomRepository(table)
+
+booking_service = BookingService(
+    booking_repo=booking_repo,
+    user_repo=user_repo,
+    room_repo=room_repo,
+)
+
+
+def confirm_hold(event, context):
+    hold_id = (event.get("pathParameters") or {}).get("hold_id")
+    if not hold_id:
+        return send_custom_response(400, "hold_id is required")
+    try:
+        user_id = event["requestContext"]["authorizer"]["user_id"]
+    except KeyError:
+        return send_custom_response(401, "Unauthorized")
+
+    try:
+        booking_id = booking_service.confirm_hold(hold_id, user_id)
+        return send_custom_response(
+            201, "Booking created successfully", {"booking_id": booking_id}
+        )
+
+    except NotFoundException as err:
+        return send_custom_response(err.status_code, str(err))
+
+    except Exception as err:
+        print("Unhandled error:", err)
+        return send_custom_response(500, "Internal server error")
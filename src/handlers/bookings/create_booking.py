@@ -5,17 +5,23 @@ from boto3 import resource
 from common.repository.booking_repo import BookingRepository
 from common.repository.user_repo import UserRepository
 from common.repository.room_repo import RoomRepository
+from common.repository.rate_limit_repo import RateLimitRepository
 from common.services.booking_service import BookingService
 from common.models.rooms import Category
-from common.services.schedule_service import SchedulerService
+from common.services.allocation import get_allocation_strategy
+from common.services.rate_limiter import RateLimiter
 from common.schemas.bookings import BookingRequest
 from common.utils.custom_response import send_custom_response
-from common.utils.custom_exceptions import NotFoundException, NoAvailableRooms
+from common.utils.custom_exceptions import (
+    IdempotencyKeyReused,
+    NotFoundException,
+    NoAvailableRooms,
+)
 from pydantic import ValidationError
 
 TABLE_NAME = os.environ.get("TABLE_NAME")
-AUTO_CHECKOUT_LAMBDA_ARN = os.environ.get("AUTO_CHECKOUT_LAMBDA_ARN")
-SCHEDULER_ROLE_ARN = os.environ.get("SCHEDULER_ROLE_ARN")
+ALLOCATION_STRATEGY = os.environ.get("ALLOCATION_STRATEGY", "best_fit")
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
 
 dynamodb = resource("dynamodb", region_name="ap-south-1")
 table = dynamodb.Table(TABLE_NAME)
@@ -23,14 +29,14 @@ table = dynamodb.Table(TABLE_NAME)
 booking_repo = BookingRepository(table)
 user_repo = UserRepository(table)
 room_repo = RoomRepository(table)
-scheduler_service = SchedulerService(AUTO_CHECKOUT_LAMBDA_ARN, SCHEDULER_ROLE_ARN)
 
 booking_service = BookingService(
     booking_repo=booking_repo,
     user_repo=user_repo,
     room_repo=room_repo,
-    schedule_service=scheduler_service,
+    allocation_strategy=get_allocation_strategy(ALLOCATION_STRATEGY),
 )
+rate_limiter = RateLimiter(RateLimitRepository(table), "create_booking")
 
 
 def create_booking(event, context):
@@ -50,10 +56,28 @@ def create_booking(event, context):
     except KeyError:
         return send_custom_response(401, "Unauthorized")
 
+    if not rate_limiter.allow(user_id):
+        return send_custom_response(429, "Too many booking requests, please try again later")
+
+    # API Gateway passes headers in the case the client sent them
+    headers = {k.lower(): v for k, v in (event.get("headers") or {}).items()}
+    idempotency_key = headers.get("idempotency-key")
+    if idempotency_key is not None and not 0 < len(idempotency_key) <= MAX_IDEMPOTENCY_KEY_LENGTH:
+        return send_custom_response(
+            400, f"Idempotency-Key must be 1-{MAX_IDEMPOTENCY_KEY_LENGTH} characters"
+        )
+
     try:
-        booking_service.add_booking(request_body, user_id)
+        booking_id = booking_service.add_booking(
+            request_body, user_id, idempotency_key=idempotency_key
+        )
+
+        return send_custom_response(
+            201, "Booking created successfully", {"booking_id": booking_id}
+        )
 
-        return send_custom_response(201, "Booking created successfully")
+    except IdempotencyKeyReused as err:
+        return send_custom_response(422, str(err))
 
     except ValueError:
         allowed = ", ".join(c.value for c in Category)
@@ -0,0 +1,67 @@
+import os
+from boto3 import resource
+
+from common.repository.booking_repo import BookingRepository
+from common.repository.user_repo import UserRepository
+from common.repository.room_repo import RoomRepository
+from common.services.booking_service import BookingService
+from common.models.rooms import Category
+from common.services.allocation import get_allocation_strategy
+from common.schemas.bookings import BookingRequest
+from common.utils.custom_response import send_custom_response
+from common.utils.custom_exceptions import NotFoundException, NoAvailableRooms
+from pydantic import ValidationError
+
+TABLE_NAME = os.environ.get("TABLE_NAME")
+ALLOCATION_STRATEGY = os.environ.get("ALLOCATION_STRATEGY", "best_fit")
+
+dynamodb = resource("dynamodb", region_name="ap-south-1")
+table = dynamodb.Table(TABLE_NAME)
+
+booking_repo = BookingRepository(table)
+user_repo = UserRepository(table)
+room_repo = RoomRepository(table)
+
+booking_service = BookingService(
+    booking_repo=booking_repo,
+    user_repo=user_repo,
+    room_repo=room_repo,
+    allocation_strategy=get_allocation_strategy(ALLOCATION_STRATEGY),
+)
+
+
+def create_hold(event, context):
+    if not event.get("body"):
+        return send_custom_response(400, "Request body is required")
+
+    try:
+        request_body = BookingRequest.model_validate_json(event["body"])
+    except ValidationError as e:
+        formatted = "; ".join(f"{err['msg']}" for err in e.errors())
+        return send_custom_response(400, formatted)
+
+    except ValueError as e:
+        return send_custom_response(400, str(e))
+    try:
+        user_id = event["requestContext"]["authorizer"]["user_id"]
+    except KeyError:
+        return send_custom_response(401, "Unauthorized")
+
+    try:
+        hold = booking_service.hold_room(request_body, user_id)
+
+        return send_custom_response(201, "Room held", hold)
+
+    except ValueError:
+        allowed = ", ".join(c.value for c in Category)
+        return send_custom_response(400, f"Invalid category. Allowed: {allowed}")
+
+    except NotFoundException as err:
+        return send_custom_response(err.status_code, str(err))
+
+    except NoAvailableRooms as err:
+        return send_custom_response(404, str(err))
+
+    except Exception as err:
+        print("Unhandled error:", err)
+        return send_custom_response(500, "Internal server error")
@@ -0,0 +1,78 @@
+import os
+from boto3 import resource
+
+from common.repository.booking_repo import BookingRepository
+from common.repository.user_repo import UserRepository
+from common.repository.room_repo import RoomRepository
+from common.services.booking_service import BookingService
+from common.models.users import UserRole
+from common.schemas.bookings import ExtendStayRequest
+from common.utils.custom_response import send_custom_response
+from common.utils.custom_exceptions import (
+    InvalidBookingState,
+    InvalidDates,
+    NoAvailableRooms,
+    NotFoundException,
+)
+from pydantic import ValidationError
+
+TABLE_NAME = os.environ.get("TABLE_NAME")
+
+dynamodb = resource("dynamodb", region_name="ap-south-1")
+table = dynamodb.Table(TABLE_NAME)
+
+booking_repo = BookingRepository(table)
+user_repo = UserRepository(table)
+room_repo = RoomRepository(table)
+
+booking_service = BookingService(
+    booking_repo=booking_repo,
+    user_repo=user_repo,
+    room_repo=room_repo,
+)
+
+
+def extend_stay(event, context):
+    try:
+        authorizer = event["requestContext"]["authorizer"]
+        user_id = authorizer["user_id"]
+        role_raw = authorizer.get("role")
+    except KeyError:
+        return send_custom_response(401, "Unauthorized")
+
+    booking_id = (event.get("pathParameters") or {}).get("booking_id")
+    if not booking_id:
+        return send_custom_response(400, "booking_id is required")
+    if not event.get("body"):
+        return send_custom_response(400, "Request body is required")
+
+    try:
+        request_body = ExtendStayRequest.model_validate_json(event["body"])
+    except ValidationError as e:
+        formatted = "; ".join(f"{err['msg']}" for err in e.errors())
+        return send_custom_response(400, formatted)
+
+    is_staff = (role_raw or "").upper() in {UserRole.MANAGER.value, UserRole.ADMIN.value}
+
+    try:
+        booking = booking_service.extend_stay(
+            booking_id, user_id, request_body.checkout, is_staff=is_staff
+        )
+        return send_custom_response(
+            200,
+            "Stay extended",
+            {"booking_id": booking.booking_id, "checkout": booking.checkout.isoformat()},
+        )
+
+    except NotFoundException as err:
+        return send_custom_response(err.status_code, str(err))
+
+    except InvalidDates as err:
+        return send_custom_response(400, str(err))
+
+    except (NoAvailableRooms, InvalidBookingState) as err:
+        return send_custom_response(409, str(err))
+
+    except Exception as err:
+        print("Unhandled error:", err)
+        return send_custom_response(500, "Internal server error")
@@ -1,4 +1,5 @@
 import os
+from datetime import date, datetime, time, timedelta, timezone
 from boto3 import resource
 
 from common.repository.booking_repo import BookingRepository
@@ -6,8 +7,12 @@ from common.repository.user_repo import UserRepository
 from common.repository.room_repo import RoomRepository
 from common.services.booking_service import BookingService
 from common.models.users import UserRole
+from common.models.bookings import BookingStatus
+from common.utils.datetime_normaliser import from_iso_string
 from common.utils.custom_response import send_custom_response
-from common.utils.custom_exceptions import NotFoundException
+from common.utils.custom_exceptions import NotFoundException, InvalidCursor
+from common.utils.constants import DEFAULT_PAGE_SIZE
+from common.utils.cursor import parse_limit
 
 TABLE_NAME = os.environ.get("TABLE_NAME")
 
@@ -25,6 +30,45 @@ booking_service = BookingService(
 )
 
 
+def _parse_checkin(name: str, value: str, end_of_day: bool = False) -> datetime:
+    """A timezone-aware datetime, or a plain date taken as that UTC day."""
+    try:
+        day = date.fromisoformat(value)
+    except ValueError:
+        pass
+    else:
+        start = datetime.combine(day, time(), tzinfo=timezone.utc)
+        # the key range is inclusive, so stop just before the next day
+        return start + timedelta(days=1, microseconds=-1) if end_of_day else start
+    try:
+        return from_iso_string(value)
+    except ValueError:
+        raise ValueError(
+            f"{name} must be a date (YYYY-MM-DD) or a datetime with a timezone offset"
+        )
+
+
+def _parse_filters(params: dict) -> dict:
+    filters = {}
+    checkin_from = params.get("from")
+    checkin_to = params.get("to")
+    status_raw = params.get("status")
+
+    if checkin_from:
+        filters["checkin_from"] = _parse_checkin("from", checkin_from)
+    if checkin_to:
+        filters["checkin_to"] = _parse_checkin("to", checkin_to, end_of_day=True)
+    if checkin_from and checkin_to and filters["checkin_to"] < filters["checkin_from"]:
+        raise ValueError("to must not be before from")
+    if status_raw:
+        try:
+            filters["status"] = BookingStatus(status_raw.upper())
+        except ValueError:
+            allowed = ", ".join(s.value for s in BookingStatus)
+            raise ValueError(f"Invalid status. Allowed: {allowed}")
+    return filters
+
+
 def get_user_bookings(event, context):
     try:
         try:
@@ -51,7 +95,24 @@ def get_user_bookings(event, context):
             else user_id
         )
 
-        bookings = booking_service.get_user_bookings(target_user_id)
+        params = event.get("queryStringParameters") or {}
+        limit_raw = params.get("limit")
+        cursor = params.get("cursor")
+        next_cursor = None
+
+        try:
+            filters = _parse_filters(params)
+            if limit_raw is not None or cursor is not None:
+                limit = parse_limit(limit_raw) if limit_raw is not None else DEFAULT_PAGE_SIZE
+        except ValueError as err:
+            return send_custom_response(400, str(err))
+
+        if limit_raw is None and cursor is None:
+            bookings = booking_service.get_user_bookings(target_user_id, **filters)
+        else:
+            bookings, next_cursor = booking_service.get_user_bookings_page(
+                target_user_id, limit=limit, cursor=cursor, **filters
+            )
 
         result = []
         for b in bookings:
@@ -66,17 +127,24 @@ def get_user_bookings(event, context):
                 "booked_at": b.booked_at.isoformat()
             })
 
+        response_data = {
+            "count": len(result),
+            "bookings": result
+        }
+        if next_cursor:
+            response_data["next_cursor"] = next_cursor
+
         return send_custom_response(
             200,
             "Bookings retrieved successfully",
-            {
-                "count": len(result),
-                "bookings": result
-            }
+            response_data
         )
 
     except NotFoundException as err:
         return send_custom_response(err.status_code, str(err))
 
+    except InvalidCursor as err:
+        return send_custom_response(400, str(err))
+
     except Exception:
         return send_custom_response(500, "Internal server error")
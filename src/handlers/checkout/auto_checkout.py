@@ -30,7 +30,10 @@ def auto_checkout(event, context):
         raise KeyError("Missing booking_id, room_id, or user_id in event")
 
     try:
-        booking_service.update_booking(booking_id=booking_id, room_id=room_id, user_id=user_id)
+        if not booking_service.update_booking(booking_id=booking_id, room_id=room_id, user_id=user_id):
+            # already checked out early or cancelled; nothing left to do
+            print(f"Auto-checkout skipped: booking {booking_id} is already closed")
+            return
         invoice_service.send_invoice(booking_id)
     except NotFoundException as err:
         print(f"Auto-checkout failed: {err}")
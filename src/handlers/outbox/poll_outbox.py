@@ -0,0 +1,47 @@
+import argparse
+import logging
+import os
+import time
+from boto3 import resource
+
+from common.repository.outbox_repo import OutboxRepository
+from common.services.outbox_service import OutboxProcessor, OUTBOX_BATCH_SIZE
+from common.services.schedule_service import SchedulerService
+
+
+def poll(processor: OutboxProcessor, interval: float, batch_size: int, once: bool = False):
+    """Local stand-in for the stream consumer: drain the outbox on a timer."""
+    while True:
+        applied = processor.drain(batch_size)
+        if once:
+            return applied
+        # keep going straight away while there is a backlog
+        if applied < batch_size:
+            time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Apply pending OUTBOX entries when no table stream is available"
+    )
+    parser.add_argument("--table", default=os.environ.get("TABLE_NAME"))
+    parser.add_argument("--region", default="ap-south-1")
+    parser.add_argument("--lambda-arn", default=os.environ.get("AUTO_CHECKOUT_LAMBDA_ARN"))
+    parser.add_argument("--role-arn", default=os.environ.get("SCHEDULER_ROLE_ARN"))
+    parser.add_argument("--interval", type=float, default=2.0)
+    parser.add_argument("--batch-size", type=int, default=OUTBOX_BATCH_SIZE)
+    parser.add_argument("--once", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    table = resource("dynamodb", region_name=args.region).Table(args.table)
+    processor = OutboxProcessor(
+        OutboxRepository(table),
+        SchedulerService(args.lambda_arn, args.role_arn, region=args.region),
+    )
+    applied = poll(processor, args.interval, args.batch_size, once=args.once)
+    print(f"Applied {applied} outbox entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import os
+from boto3 import resource
+from boto3.dynamodb.types import TypeDeserializer
+
+from common.repository.outbox_repo import OutboxRepository, OUTBOX_PK_PREFIX
+from common.services.outbox_service import OutboxProcessor
+from common.services.schedule_service import SchedulerService
+
+TABLE_NAME = os.environ.get("TABLE_NAME")
+AUTO_CHECKOUT_LAMBDA_ARN = os.environ.get("AUTO_CHECKOUT_LAMBDA_ARN")
+SCHEDULER_ROLE_ARN = os.environ.get("SCHEDULER_ROLE_ARN")
+
+dynamodb = resource("dynamodb", region_name="ap-south-1")
+table = dynamodb.Table(TABLE_NAME)
+
+outbox_processor = OutboxProcessor(
+    OutboxRepository(table),
+    SchedulerService(AUTO_CHECKOUT_LAMBDA_ARN, SCHEDULER_ROLE_ARN),
+)
+deserializer = TypeDeserializer()
+
+
+def process_outbox(event, context):
+    """DynamoDB Streams consumer for OUTBOX entries.
+
+    Only the newest record per entry in a batch is applied, since entries
+    are applied concurrently and a later one (e.g. a cancellation) replaces
+    an earlier one. Failed records are reported back so only they are
+    retried.
+    """
+    latest = {}
+    for record in event.get("Records", []):
+        if record.get("eventName") not in ("INSERT", "MODIFY"):
+            continue
+        image = record["dynamodb"].get("NewImage", {})
+        entry = {key: deserializer.deserialize(value) for key, value in image.items()}
+        if not entry.get("pk", "").startswith(OUTBOX_PK_PREFIX):
+            continue
+        latest[entry["sk"]] = (record["dynamodb"]["SequenceNumber"], entry)
+    records = list(latest.values())
+
+    applied = outbox_processor.process([entry for _, entry in records])
+    return {
+        "batchItemFailures": [
+            {"itemIdentifier": sequence_number}
+            for (sequence_number, _), ok in zip(records, applied)
+            if not ok
+        ]
+    }
@@ -52,8 +52,12 @@ def add_room(event,context):
         allowed = ", ".join(c.value for c in Category)
         return send_custom_response(400, f"Invalid category. Allowed: {allowed}")
 
+    floor = body.get("floor")
+    if floor is not None and (type(floor) is not int or floor < 0):
+        return send_custom_response(400, "floor must be a non-negative integer")
+
     try:
-        room_service.add_room(room_id=room_id, category=category)
+        room_service.add_room(room_id=room_id, category=category, floor=floor)
     except RoomAlreadyExists as e:
         return send_custom_response(400, f"Room with id {room_id} already exists")
         
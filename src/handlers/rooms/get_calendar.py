@@ -0,0 +1,79 @@
+import os
+from datetime import date, datetime, timezone
+from boto3 import resource
+from botocore.exceptions import ClientError
+
+from common.repository.room_repo import RoomRepository
+from common.services.room_service import RoomService
+from common.models.rooms import Category
+from common.utils.constants import MAX_CALENDAR_DAYS
+from common.utils.custom_exceptions import InvalidDates
+from common.utils.custom_response import send_custom_response
+
+
+TABLE_NAME = os.environ.get("TABLE_NAME")
+
+dynamodb = resource("dynamodb", region_name="ap-south-1")
+table = dynamodb.Table(TABLE_NAME)
+
+room_repo = RoomRepository(table)
+room_service = RoomService(room_repo=room_repo)
+
+DEFAULT_CALENDAR_DAYS = 60
+
+
+def _parse_days(value) -> int:
+    try:
+        days = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("days must be an integer")
+    if days < 1 or days > MAX_CALENDAR_DAYS:
+        raise ValueError(f"days must be between 1 and {MAX_CALENDAR_DAYS}")
+    return days
+
+
+def get_calendar(event, context):
+    try:
+        params = event.get("queryStringParameters") or {}
+
+        category_raw = params.get("category")
+        if not category_raw:
+            return send_custom_response(400, "category is required")
+
+        try:
+            category = Category(category_raw.upper())
+        except ValueError:
+            allowed = ", ".join(c.value for c in Category)
+            return send_custom_response(400, f"Invalid category. Allowed: {allowed}")
+
+        try:
+            start_raw = params.get("start")
+            start = (
+                date.fromisoformat(start_raw)
+                if start_raw
+                else datetime.now(timezone.utc).date()
+            )
+            days = _parse_days(params.get("days", DEFAULT_CALENDAR_DAYS))
+        except ValueError as e:
+            return send_custom_response(400, str(e))
+
+        calendar = room_service.get_calendar(category, start, days)
+
+        response_data = {
+            "category": category.value,
+            "start": start.isoformat(),
+            "days": days,
+            "nights": calendar,
+        }
+        return send_custom_response(200, "successfully retrieved", response_data)
+
+    except InvalidDates as err:
+        return send_custom_response(400, str(err))
+    except ValueError as err:
+        return send_custom_response(400, str(err))
+    except ClientError as err:
+        print("AWS client error:", err)
+        return send_custom_response(500, "Internal server error")
+    except Exception as err:
+        print("Unhandled error:", err)
+        return send_custom_response(500, "Internal server error")
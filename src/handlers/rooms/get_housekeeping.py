@@ -0,0 +1,68 @@
+import os
+from datetime import date, datetime, timezone
+from boto3 import resource
+from botocore.exceptions import ClientError
+from common.repository.room_repo import RoomRepository
+from common.services.room_service import RoomService
+from common.models.users import UserRole
+from common.utils.custom_response import send_custom_response
+from common.utils.custom_exceptions import InvalidCursor
+from common.utils.constants import DEFAULT_PAGE_SIZE
+from common.utils.cursor import parse_limit
+
+TABLE_NAME = os.environ.get("TABLE_NAME")
+
+dynamodb = resource("dynamodb", region_name="ap-south-1")
+table = dynamodb.Table(TABLE_NAME)
+
+room_repo = RoomRepository(table)
+room_service = RoomService(room_repo=room_repo)
+
+
+def _parse_day(value) -> date:
+    if not value:
+        return datetime.now(timezone.utc).date()
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError("date must be YYYY-MM-DD")
+
+
+def get_housekeeping_queue(event, context):
+    try:
+        role_raw = event["requestContext"]["authorizer"]["role"]
+    except (KeyError, TypeError):
+        return send_custom_response(401, "Unauthorized")
+
+    try:
+        role = UserRole(role_raw.upper())
+    except ValueError:
+        return send_custom_response(403, "Forbidden")
+
+    if role not in (UserRole.MANAGER, UserRole.ADMIN):
+        return send_custom_response(403, "Only managers or admins can view housekeeping")
+
+    params = event.get("queryStringParameters") or {}
+    try:
+        day = _parse_day(params.get("date"))
+        limit = parse_limit(params.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError as err:
+        return send_custom_response(400, str(err))
+
+    try:
+        tasks, next_cursor = room_service.get_housekeeping_queue(
+            day, limit=limit, cursor=params.get("cursor")
+        )
+    except InvalidCursor as err:
+        return send_custom_response(400, str(err))
+    except ClientError as err:
+        print("AWS client error:", err)
+        return send_custom_response(500, "Internal server error")
+    except Exception as err:
+        print("Unhandled error:", err)
+        return send_custom_response(500, "Internal server error")
+
+    data = {"date": day.isoformat(), "rooms": tasks}
+    if next_cursor:
+        data["next_cursor"] = next_cursor
+    return send_custom_response(200, "Housekeeping queue retrieved", data)
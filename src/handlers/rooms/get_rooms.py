@@ -29,6 +29,55 @@ def _parse_iso_datetime(value: str) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
+def _parse_categories(event, params: dict) -> list:
+    # ?category=DELUXE, ?category=DELUXE,SUITE, ?category=a&category=b or ALL
+    multi = (event.get("multiValueQueryStringParameters") or {}).get("category")
+    raw_values = multi or [params.get("category")]
+    names = [
+        name.strip().upper()
+        for raw in raw_values
+        if raw
+        for name in raw.split(",")
+        if name.strip()
+    ]
+    if "ALL" in names:
+        return list(Category)
+    categories = []
+    for name in names:
+        try:
+            category = Category(name)
+        except ValueError:
+            allowed = ", ".join(c.value for c in Category)
+            raise ValueError(f"Invalid category. Allowed: {allowed}, ALL")
+        if category not in categories:
+            categories.append(category)
+    return categories
+
+
+def _multi_category_response(categories, checkin_dt, checkout_dt, role):
+    results = room_service.get_availability(
+        categories=categories, checkin=checkin_dt, checkout=checkout_dt
+    )
+    summaries = []
+    for result in results:
+        summary = {
+            "category": result.category.value,
+            "price_per_night": result.price_per_night,
+            "count": len(result.room_ids),
+        }
+        if role != UserRole.CUSTOMER:
+            summary["available_rooms"] = result.room_ids
+        summaries.append(summary)
+
+    response_data = {
+        "checkin": checkin_dt.isoformat(),
+        "checkout": checkout_dt.isoformat(),
+        "count": sum(summary["count"] for summary in summaries),
+        "categories": summaries,
+    }
+    return send_custom_response(200, "successfully retrieved", response_data)
+
+
 def get_rooms(event, context):
     try:
         params = event.get("queryStringParameters") or {}
@@ -58,10 +107,14 @@ def get_rooms(event, context):
             return send_custom_response(400, str(e))
 
         try:
-            category = Category(category_raw.upper())
-        except ValueError:
-            allowed = ", ".join(c.value for c in Category)
-            return send_custom_response(400, f"Invalid category. Allowed: {allowed}")
+            categories = _parse_categories(event, params)
+        except ValueError as e:
+            return send_custom_response(400, str(e))
+        if not categories:
+            return send_custom_response(400, "category is required")
+        if len(categories) > 1 or category_raw.strip().upper() == "ALL":
+            return _multi_category_response(categories, checkin_dt, checkout_dt, role)
+        category = categories[0]
 
         rooms = room_service.get_available_rooms(
             category=category, checkin=checkin_dt, checkout=checkout_dt
@@ -0,0 +1,134 @@
+import base64
+import csv
+import io
+import json
+import os
+from typing import Optional
+from boto3 import resource
+from botocore.exceptions import ClientError
+from common.repository.room_repo import RoomRepository
+from common.services.room_service import RoomService
+from common.models.rooms import Category, Room
+from common.models.users import UserRole
+from common.utils.constants import MAX_IMPORT_ROOMS
+from common.utils.custom_response import send_custom_response
+
+TABLE_NAME = os.environ.get("TABLE_NAME")
+
+dynamodb = resource("dynamodb", region_name="ap-south-1")
+table = dynamodb.Table(TABLE_NAME)
+
+room_repo = RoomRepository(table)
+room_service = RoomService(room_repo=room_repo)
+
+
+def _content_type(event) -> str:
+    headers = event.get("headers") or {}
+    for name, value in headers.items():
+        if name.lower() == "content-type" and value:
+            return value.split(";", 1)[0].strip().lower()
+    return "application/json"
+
+
+def _parse_rows(event) -> list:
+    body = event["body"]
+    if event.get("isBase64Encoded"):
+        body = base64.b64decode(body).decode("utf-8")
+
+    if _content_type(event) == "text/csv":
+        return list(csv.DictReader(io.StringIO(body)))
+
+    rows = json.loads(body)
+    if isinstance(rows, dict):
+        rows = rows.get("rooms")
+    if not isinstance(rows, list):
+        raise ValueError("Body must be a list of rooms or {\"rooms\": [...]}")
+    return rows
+
+
+def _parse_floor(index: int, value) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    # CSV cells arrive as strings
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    if type(value) is int and value >= 0:
+        return value
+    raise ValueError(f"Row {index}: floor must be a non-negative integer")
+
+
+def _to_room(index: int, row) -> Room:
+    if not isinstance(row, dict):
+        raise ValueError(f"Row {index}: expected an object")
+    room_id = row.get("room_id") or ""
+    category_raw = row.get("category") or ""
+    if not isinstance(room_id, str) or not isinstance(category_raw, str):
+        raise ValueError(f"Row {index}: room_id and category must be strings")
+    room_id = room_id.strip()
+    category_raw = category_raw.strip()
+    if not room_id or not category_raw:
+        raise ValueError(f"Row {index}: room_id and category are required")
+    try:
+        category = Category(category_raw.upper())
+    except ValueError:
+        allowed = ", ".join(c.value for c in Category)
+        raise ValueError(f"Row {index}: invalid category. Allowed: {allowed}")
+    return Room(
+        room_id=room_id, category=category, floor=_parse_floor(index, row.get("floor"))
+    )
+
+
+def import_rooms(event, context):
+    try:
+        role_raw = event["requestContext"]["authorizer"]["role"]
+    except (KeyError, TypeError):
+        return send_custom_response(401, "Unauthorized")
+
+    try:
+        role = UserRole(role_raw.upper())
+    except ValueError:
+        return send_custom_response(403, "Forbidden")
+
+    if role not in (UserRole.MANAGER, UserRole.ADMIN):
+        return send_custom_response(403, "Only managers or admins can add rooms")
+
+    if not event.get("body"):
+        return send_custom_response(400, "Request body is required")
+
+    try:
+        rows = _parse_rows(event)
+    except (json.JSONDecodeError, UnicodeDecodeError, csv.Error):
+        return send_custom_response(400, "Invalid request body")
+    except ValueError as err:
+        return send_custom_response(400, str(err))
+
+    if not rows:
+        return send_custom_response(400, "No rooms to import")
+    if len(rows) > MAX_IMPORT_ROOMS:
+        return send_custom_response(
+            400, f"At most {MAX_IMPORT_ROOMS} rooms can be imported per request"
+        )
+
+    try:
+        rooms = [_to_room(index, row) for index, row in enumerate(rows, start=1)]
+    except ValueError as err:
+        return send_custom_response(400, str(err))
+
+    try:
+        added, conflicts, failed = room_service.add_rooms(rooms)
+    except ClientError as err:
+        return send_custom_response(500, f"Internal server error: {str(err)}")
+    except Exception as e:
+        return send_custom_response(500, f"Internal server error: {str(e)}")
+
+    if failed and not added:
+        status_code = 500
+    elif conflicts or failed:
+        status_code = 207
+    else:
+        status_code = 201
+    return send_custom_response(
+        status_code,
+        f"Imported {len(added)} of {len(rooms)} rooms",
+        {"added": added, "conflicts": conflicts, "failed": failed},
+    )
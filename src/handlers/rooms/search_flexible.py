@@ -0,0 +1,75 @@
+import os
+from datetime import date
+from boto3 import resource
+from botocore.exceptions import ClientError
+
+from common.repository.room_repo import RoomRepository
+from common.services.room_service import RoomService
+from common.models.rooms import Category
+from common.utils.custom_exceptions import InvalidDates
+from common.utils.cursor import parse_limit
+from common.utils.custom_response import send_custom_response
+
+
+TABLE_NAME = os.environ.get("TABLE_NAME")
+
+dynamodb = resource("dynamodb", region_name="ap-south-1")
+table = dynamodb.Table(TABLE_NAME)
+
+room_repo = RoomRepository(table)
+room_service = RoomService(room_repo=room_repo)
+
+DEFAULT_OPTIONS = 10
+
+
+def _parse_int(params: dict, name: str, default=None) -> int:
+    value = params.get(name, default)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an integer")
+
+
+def search_flexible(event, context):
+    try:
+        params = event.get("queryStringParameters") or {}
+
+        category_raw = params.get("category")
+        if not category_raw or not params.get("from") or not params.get("to") or not params.get("nights"):
+            return send_custom_response(400, "category, from, to and nights are required")
+
+        try:
+            category = Category(category_raw.upper())
+        except ValueError:
+            allowed = ", ".join(c.value for c in Category)
+            return send_custom_response(400, f"Invalid category. Allowed: {allowed}")
+
+        try:
+            window_start = date.fromisoformat(params["from"])
+            window_end = date.fromisoformat(params["to"])
+            nights = _parse_int(params, "nights")
+            limit = parse_limit(params.get("limit", DEFAULT_OPTIONS))
+        except ValueError as e:
+            return send_custom_response(400, str(e))
+
+        options = room_service.find_start_dates(
+            category, window_start, window_end, nights, limit=limit
+        )
+
+        response_data = {
+            "category": category.value,
+            "nights": nights,
+            "options": options,
+        }
+        return send_custom_response(200, "successfully retrieved", response_data)
+
+    except InvalidDates as err:
+        return send_custom_response(400, str(err))
+    except ValueError as err:
+        return send_custom_response(400, str(err))
+    except ClientError as err:
+        print("AWS client error:", err)
+        return send_custom_response(500, "Internal server error")
+    except Exception as err:
+        print("Unhandled error:", err)
+        return send_custom_response(500, "Internal server error")
@@ -0,0 +1,90 @@
+import json
+import os
+from boto3 import resource
+from common.repository.room_repo import RoomRepository
+from common.services.room_service import RoomService
+from common.models.rooms import RoomStatus
+from common.utils.custom_response import send_custom_response
+from common.utils.custom_exceptions import NotFoundException
+from botocore.exceptions import ClientError
+from common.models.users import UserRole
+
+TABLE_NAME = os.environ.get("TABLE_NAME")
+
+dynamodb = resource("dynamodb", region_name="ap-south-1")
+table = dynamodb.Table(TABLE_NAME)
+
+room_repo = RoomRepository(table)
+room_service = RoomService(room_repo=room_repo)
+
+
+def _parse_status(value) -> RoomStatus:
+    if not isinstance(value, str):
+        raise ValueError
+    return RoomStatus(value.upper())
+
+
+def update_floor_status(event, context):
+
+    try:
+        role_raw = event["requestContext"]["authorizer"]["role"]
+    except KeyError:
+        return send_custom_response(401, "Unauthorized")
+
+    try:
+        role = UserRole(role_raw.upper())
+    except ValueError:
+        return send_custom_response(403, "Forbidden")
+
+    if role != UserRole.MANAGER:
+        return send_custom_response(403, "Only managers can update room status")
+
+    path_params = event.get("pathParameters") or {}
+    floor_raw = path_params.get("floor")
+
+    if not floor_raw or not floor_raw.isdigit():
+        return send_custom_response(400, "floor must be a non-negative integer")
+    floor = int(floor_raw)
+
+    if not event.get("body"):
+        return send_custom_response(400, "Request body is required")
+
+    try:
+        body = json.loads(event["body"])
+    except json.JSONDecodeError:
+        return send_custom_response(400, "Invalid JSON body")
+    if not isinstance(body, dict):
+        return send_custom_response(400, "Invalid JSON body")
+
+    if not body.get("from_status") or not body.get("status"):
+        return send_custom_response(400, "from_status and status are required")
+
+    try:
+        from_status = _parse_status(body["from_status"])
+        status = _parse_status(body["status"])
+    except ValueError:
+        return send_custom_response(
+            400, f"Invalid status. Allowed: {[s.value for s in RoomStatus]}"
+        )
+    try:
+        updated = room_service.update_floor_status(floor, from_status, status)
+
+        return send_custom_response(
+            200,
+            f"{len(updated)} rooms updated",
+            {
+                "floor": floor,
+                "from_status": from_status.value,
+                "new_status": status.value,
+                "room_ids": updated,
+            },
+        )
+
+    except NotFoundException as err:
+        return send_custom_response(404, str(err))
+    except ClientError as err:
+        print("AWS client error:", err)
+        return send_custom_response(500, "Internal server error")
+    except Exception as err:
+        print("Unhandled error:", err)
+        return send_custom_response(500, "Internal server error")
@@ -0,0 +1,126 @@
+import argparse
+import logging
+from typing import Optional
+from boto3 import resource
+from botocore.exceptions import ClientError
+from common.utils.datetime_normaliser import normalise_timestamp
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types_boto3_dynamodb.service_resource import Table
+    from types_boto3_dynamodb import DynamoDBClient
+else:
+    Table = object
+    DynamoDBClient = object
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_ATTRIBUTES = (
+    "check_in",
+    "check_out",
+    "booked_at",
+    "checkin_date",
+    "checkout_date",
+    "checkout",
+)
+
+
+def _canonical_sk(pk: str, sk: str) -> str:
+    if pk.startswith("USER#") and sk.startswith("BOOKING#") and sk.count("#") >= 2:
+        # BOOKING#<checkin>#<booking_id>
+        checkin, booking_id = sk.removeprefix("BOOKING#").rsplit("#", 1)
+        return f"BOOKING#{normalise_timestamp(checkin)}#{booking_id}"
+    if pk.startswith("ROOM#") and sk.startswith("CHECKIN#"):
+        # CHECKIN#<checkin>
+        return f"CHECKIN#{normalise_timestamp(sk.removeprefix('CHECKIN#'))}"
+    if pk.startswith("CATEGORY#") and sk.startswith("CHECKIN#"):
+        # CHECKIN#<checkin>#ROOM#<room_id>
+        checkin, room_id = sk.removeprefix("CHECKIN#").split("#ROOM#", 1)
+        return f"CHECKIN#{normalise_timestamp(checkin)}#ROOM#{room_id}"
+    return sk
+
+
+def canonical_item(item: dict) -> Optional[dict]:
+    """Return the re-encoded item, or None when it is already canonical."""
+    new_item = dict(item)
+    new_item["sk"] = _canonical_sk(item["pk"], item["sk"])
+    for name in TIMESTAMP_ATTRIBUTES:
+        value = item.get(name)
+        if isinstance(value, str):
+            new_item[name] = normalise_timestamp(value)
+    return None if new_item == item else new_item
+
+
+def _write(table: Table, client: DynamoDBClient, item: dict, new_item: dict):
+    if new_item["sk"] == item["sk"]:
+        table.put_item(
+            Item=new_item, ConditionExpression="attribute_exists(pk)"
+        )
+        return
+    client.transact_write_items(
+        TransactItems=[
+            {
+                "Put": {
+                    "TableName": table.name,
+                    "Item": new_item,
+                    "ConditionExpression": "attribute_not_exists(sk)",
+                }
+            },
+            {
+                "Delete": {
+                    "TableName": table.name,
+                    "Key": {"pk": item["pk"], "sk": item["sk"]},
+                    "ConditionExpression": "attribute_exists(pk)",
+                }
+            },
+        ]
+    )
+
+
+def backfill_canonical_timestamps(
+    table: Table, client: DynamoDBClient = None, dry_run: bool = False
+) -> int:
+    client = client if client else table.meta.client
+    rewritten = 0
+    scan_kwargs = {}
+
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            new_item = canonical_item(item)
+            if new_item is None:
+                continue
+            if dry_run:
+                logger.info(f"Would rewrite {item['pk']} {item['sk']} -> {new_item['sk']}")
+                rewritten += 1
+                continue
+            try:
+                _write(table, client, item, new_item)
+            except ClientError as err:
+                logger.error(f"Error rewriting {item['pk']} {item['sk']}: {err}")
+                raise
+            rewritten += 1
+
+        if "LastEvaluatedKey" not in response:
+            return rewritten
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-encode stored timestamps as fixed-width UTC strings"
+    )
+    parser.add_argument("--table", required=True)
+    parser.add_argument("--region", default="ap-south-1")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    table = resource("dynamodb", region_name=args.region).Table(args.table)
+    count = backfill_canonical_timestamps(table, dry_run=args.dry_run)
+    print(f"{'Would rewrite' if args.dry_run else 'Rewrote'} {count} items")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import logging
+from boto3 import resource
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from common.repository.booking_repo import BookingRepository
+from common.utils.datetime_normaliser import normalise_timestamp
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types_boto3_dynamodb.service_resource import Table
+else:
+    Table = object
+
+logger = logging.getLogger(__name__)
+
+
+def checkout_index_item(item: dict) -> dict:
+    """CATEGORY#<cat>/CHECKOUT#... twin of a CATEGORY#<cat>/CHECKIN#... item."""
+    # sk is CHECKIN#<checkin>#ROOM#<room_id>
+    checkin = item["sk"].removeprefix("CHECKIN#").split("#ROOM#")[0]
+    index_item = {
+        "pk": item["pk"],
+        "sk": BookingRepository.checkout_index_sk(
+            normalise_timestamp(item["checkout"]), item["room_id"]
+        ),
+        "room_id": item["room_id"],
+        "checkin": normalise_timestamp(checkin),
+    }
+    # holds have no booking_id and expire by hold_expires_at
+    for name in ("booking_id", "hold_id", "hold_expires_at", "ttl_attribute"):
+        if item.get(name) is not None:
+            index_item[name] = item[name]
+    return index_item
+
+
+def backfill_checkout_index(table: Table, dry_run: bool = False) -> int:
+    """Write the checkout-keyed twin of every availability item.
+
+    Run before deploying the checkout-ordered availability search; puts are
+    idempotent, so the backfill can be re-run safely.
+    """
+    written = 0
+    scan_kwargs = {
+        "FilterExpression": Attr("pk").begins_with("CATEGORY#")
+        & Attr("sk").begins_with("CHECKIN#"),
+    }
+
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            index_item = checkout_index_item(item)
+            if dry_run:
+                logger.info(f"Would write {index_item['pk']} {index_item['sk']}")
+                written += 1
+                continue
+            try:
+                table.put_item(Item=index_item)
+            except ClientError as err:
+                logger.error(f"Error writing {index_item['pk']} {index_item['sk']}: {err}")
+                raise
+            written += 1
+
+        if "LastEvaluatedKey" not in response:
+            return written
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Add CHECKOUT# index items for existing availability items"
+    )
+    parser.add_argument("--table", required=True)
+    parser.add_argument("--region", default="ap-south-1")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    table = resource("dynamodb", region_name=args.region).Table(args.table)
+    count = backfill_checkout_index(table, dry_run=args.dry_run)
+    print(f"{'Would write' if args.dry_run else 'Wrote'} {count} index items")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import logging
+from boto3 import resource
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from common.repository.booking_repo import BookingRepository
+from common.utils.datetime_normaliser import from_iso_string
+from common.utils.occupancy import stay_nights
+
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from types_boto3_dynamodb.service_resource import Table
+else:
+    Table = object
+
+logger = logging.getLogger(__name__)
+
+COPIED_ATTRIBUTES = ("booking_id", "hold_id", "hold_expires_at", "ttl_attribute")
+
+
+def night_lock_items(item: dict) -> List[dict]:
+    """ROOM#<id>/NIGHT#... locks for a CATEGORY#<cat>/CHECKIN#... item."""
+    # sk is CHECKIN#<checkin>#ROOM#<room_id>
+    checkin = item["sk"].removeprefix("CHECKIN#").split("#ROOM#")[0]
+    attributes = {name: item[name] for name in COPIED_ATTRIBUTES if name in item}
+    return [
+        {
+            "pk": f"ROOM#{item['room_id']}",
+            "sk": BookingRepository.night_sk(night),
+            **attributes,
+        }
+        for night in stay_nights(from_iso_string(checkin), from_iso_string(item["checkout"]))
+    ]
+
+
+def backfill_night_locks(table: Table, dry_run: bool = False) -> int:
+    """Write the night locks of every existing booking and hold.
+
+    Run before deploying the night-locked bookings, otherwise a new booking
+    could overlap a stay booked earlier; puts are idempotent, so the backfill
+    can be re-run safely.
+    """
+    written = 0
+    scan_kwargs = {
+        "FilterExpression": Attr("pk").begins_with("CATEGORY#")
+        & Attr("sk").begins_with("CHECKIN#"),
+    }
+
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            for lock in night_lock_items(item):
+                if dry_run:
+                    logger.info(f"Would write {lock['pk']} {lock['sk']}")
+                    written += 1
+                    continue
+                try:
+                    table.put_item(Item=lock)
+                except ClientError as err:
+                    logger.error(f"Error writing {lock['pk']} {lock['sk']}: {err}")
+                    raise
+                written += 1
+
+        if "LastEvaluatedKey" not in response:
+            return written
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Add NIGHT# lock items for existing bookings and holds"
+    )
+    parser.add_argument("--table", required=True)
+    parser.add_argument("--region", default="ap-south-1")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    table = resource("dynamodb", region_name=args.region).Table(args.table)
+    count = backfill_night_locks(table, dry_run=args.dry_run)
+    print(f"{'Would write' if args.dry_run else 'Wrote'} {count} night locks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import logging
+from boto3 import resource
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+
+from common.repository.outbox_repo import OutboxRepository
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types_boto3_dynamodb.service_resource import Table
+else:
+    Table = object
+
+logger = logging.getLogger(__name__)
+
+# the single partition entries were written to before sharding
+LEGACY_OUTBOX_PK = "OUTBOX"
+
+
+def move_outbox_entries(table: Table, dry_run: bool = False) -> int:
+    """Move pending entries from OUTBOX into their OUTBOX#<n> shard.
+
+    Run right after deploying the sharded outbox; the stream filter and the
+    poller only read the shards. Re-running moves only what is left.
+    """
+    moved = 0
+    query_kwargs = {"KeyConditionExpression": Key("pk").eq(LEGACY_OUTBOX_PK)}
+
+    while True:
+        response = table.query(**query_kwargs)
+        for entry in response.get("Items", []):
+            shard_pk = OutboxRepository.shard_pk(entry["booking_id"])
+            if dry_run:
+                logger.info(f"Would move {entry['sk']} to {shard_pk}")
+                moved += 1
+                continue
+            try:
+                # keep a newer entry already written to the shard
+                table.put_item(
+                    Item={**entry, "pk": shard_pk},
+                    ConditionExpression="attribute_not_exists(pk) OR queued_at < :queued_at",
+                    ExpressionAttributeValues={":queued_at": entry["queued_at"]},
+                )
+            except ClientError as err:
+                if err.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                    logger.error(f"Error moving outbox entry {entry['sk']}: {err}")
+                    raise
+            table.delete_item(Key={"pk": LEGACY_OUTBOX_PK, "sk": entry["sk"]})
+            moved += 1
+
+        if "LastEvaluatedKey" not in response:
+            return moved
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Move pending OUTBOX entries into the sharded outbox partitions"
+    )
+    parser.add_argument("--table", required=True)
+    parser.add_argument("--region", default="ap-south-1")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    table = resource("dynamodb", region_name=args.region).Table(args.table)
+    count = move_outbox_entries(table, dry_run=args.dry_run)
+    print(f"{'Would move' if args.dry_run else 'Moved'} {count} outbox entries")
+
+
+if __name__ == "__main__":
+    main()
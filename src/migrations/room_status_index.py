@@ -0,0 +1,74 @@
+import argparse
+import logging
+from boto3 import resource
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types_boto3_dynamodb.service_resource import Table
+else:
+    Table = object
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_room_status_index(table: Table, dry_run: bool = False) -> int:
+    """Copy room_status from ROOM#<id>/DETAILS onto CATEGORY#<cat>/ROOM#<id>."""
+    copied = 0
+    scan_kwargs = {
+        "FilterExpression": Attr("pk").begins_with("ROOM#") & Attr("sk").eq("DETAILS"),
+        "ProjectionExpression": "pk, category, room_status",
+    }
+
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            room_id = item["pk"].removeprefix("ROOM#")
+            key = {"pk": f"CATEGORY#{item['category']}", "sk": f"ROOM#{room_id}"}
+            if dry_run:
+                logger.info(f"Would set {key['pk']} {key['sk']} to {item['room_status']}")
+                copied += 1
+                continue
+            try:
+                table.update_item(
+                    Key=key,
+                    UpdateExpression="SET #attribute=:value",
+                    ConditionExpression="attribute_exists(pk)",
+                    ExpressionAttributeNames={"#attribute": "room_status"},
+                    ExpressionAttributeValues={":value": item["room_status"]},
+                )
+            except ClientError as err:
+                if (
+                    err.response.get("Error", {}).get("Code")
+                    == "ConditionalCheckFailedException"
+                ):
+                    logger.warning(f"No category index item for room {room_id}")
+                    continue
+                logger.error(f"Error copying room {room_id} status: {err}")
+                raise
+            copied += 1
+
+        if "LastEvaluatedKey" not in response:
+            return copied
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Mirror room_status onto the CATEGORY#/ROOM# index items"
+    )
+    parser.add_argument("--table", required=True)
+    parser.add_argument("--region", default="ap-south-1")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    table = resource("dynamodb", region_name=args.region).Table(args.table)
+    count = backfill_room_status_index(table, dry_run=args.dry_run)
+    print(f"{'Would update' if args.dry_run else 'Updated'} {count} index items")
+
+
+if __name__ == "__main__":
+    main()
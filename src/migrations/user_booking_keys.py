@@ -0,0 +1,100 @@
+import argparse
+import logging
+from boto3 import resource
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+from common.repository.booking_repo import BookingRepository
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types_boto3_dynamodb.service_resource import Table
+    from types_boto3_dynamodb import DynamoDBClient
+else:
+    Table = object
+    DynamoDBClient = object
+
+logger = logging.getLogger(__name__)
+
+
+def _is_legacy_user_booking(item: dict) -> bool:
+    # legacy layout: BOOKING#<id>; current layout: BOOKING#<checkin>#<id>
+    return item["sk"].count("#") == 1
+
+
+def _migrated_item(item: dict) -> dict:
+    booking_id = item["sk"].removeprefix("BOOKING#")
+    new_item = dict(item)
+    new_item["sk"] = BookingRepository.user_booking_sk(
+        BookingRepository._iso(item["check_in"]), booking_id
+    )
+    new_item["booking_id"] = booking_id
+    return new_item
+
+
+def migrate_user_booking_keys(
+    table: Table, client: DynamoDBClient = None, dry_run: bool = False
+) -> int:
+    client = client if client else table.meta.client
+    migrated = 0
+    scan_kwargs = {
+        "FilterExpression": Attr("pk").begins_with("USER#")
+        & Attr("sk").begins_with("BOOKING#")
+    }
+
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            if not _is_legacy_user_booking(item):
+                continue
+            new_item = _migrated_item(item)
+            if dry_run:
+                logger.info(f"Would move {item['pk']} {item['sk']} -> {new_item['sk']}")
+                migrated += 1
+                continue
+            try:
+                client.transact_write_items(
+                    TransactItems=[
+                        {
+                            "Put": {
+                                "TableName": table.name,
+                                "Item": new_item,
+                                "ConditionExpression": "attribute_not_exists(sk)",
+                            }
+                        },
+                        {
+                            "Delete": {
+                                "TableName": table.name,
+                                "Key": {"pk": item["pk"], "sk": item["sk"]},
+                                "ConditionExpression": "attribute_exists(pk)",
+                            }
+                        },
+                    ]
+                )
+            except ClientError as err:
+                logger.error(f"Error migrating {item['pk']} {item['sk']}: {err}")
+                raise
+            migrated += 1
+
+        if "LastEvaluatedKey" not in response:
+            return migrated
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rewrite USER#/BOOKING#<id> items to BOOKING#<checkin>#<id>"
+    )
+    parser.add_argument("--table", required=True)
+    parser.add_argument("--region", default="ap-south-1")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    table = resource("dynamodb", region_name=args.region).Table(args.table)
+    count = migrate_user_booking_keys(table, dry_run=args.dry_run)
+    print(f"{'Would migrate' if args.dry_run else 'Migrated'} {count} user booking items")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+import argparse
+import asyncio
+import base64
+import ipaddress
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from uuid import uuid4
+
+from server.routes import Route, Router, load_cors, load_routes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "deploy", "template.yaml"
+)
+# botocore pools 10 connections per client; more threads would only queue on them
+DEFAULT_WORKERS = 10
+# API Gateway's payload limit
+MAX_BODY_BYTES = 10 * 1024 * 1024
+STAGE = "v1"
+
+
+class HttpError(Exception):
+    def __init__(self, status_code: int, message: str):
+        self.status_code = status_code
+        self.message = message
+
+
+def _gateway_response(status_code: int, message: str) -> dict:
+    # the body API Gateway itself sends for auth failures and unknown routes
+    return {
+        "statusCode": status_code,
+        "headers": {"Content-Type": "application/json"},
+        "body": json.dumps({"message": message}),
+    }
+
+
+class HandlerServer:
+    """Serves the Lambda handlers over HTTP from one long-lived process.
+
+    Each request becomes an API Gateway (REST, proxy) event. The handler and,
+    for authorized routes, the JWT authorizer run on a thread pool; the
+    handler modules are imported once, so their clients are shared by all
+    requests.
+    """
+
+    def __init__(
+        self,
+        router: Router,
+        authorizer: Optional[Callable] = None,
+        workers: int = DEFAULT_WORKERS,
+        cors: Optional[Dict[str, str]] = None,
+        trusted_proxies: Iterable[str] = (),
+    ):
+        self.router = router
+        self.authorizer = authorizer
+        # preflight response headers; API Gateway answers OPTIONS itself
+        self.cors = cors
+        # load balancers whose X-Forwarded-For names the real client
+        self.trusted_proxies = [
+            ipaddress.ip_network(proxy, strict=False) for proxy in trusted_proxies
+        ]
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="handler")
+
+    async def serve(self, host: str, port: int):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        logger.info(f"Serving {len(self.router.routes)} routes on {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info("peername")
+        peer_ip = peer[0] if peer else None
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HttpError as err:
+                    writer.write(self._encode(_gateway_response(err.status_code, err.message), False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, headers, body, keep_alive = request
+                source_ip = self.client_ip(peer_ip, headers)
+                response = await self.dispatch(method, target, headers, body, source_ip)
+                writer.write(self._encode(response, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _is_trusted(self, address: Optional[str]) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+
+    def client_ip(self, peer_ip: Optional[str], headers: Dict[str, str]) -> Optional[str]:
+        """The caller's address, as API Gateway's identity.sourceIp.
+
+        Behind a trusted proxy it is the last X-Forwarded-For hop that is not
+        itself trusted; earlier hops are whatever the client chose to send.
+        """
+        if peer_ip is None or not self._is_trusted(peer_ip):
+            return peer_ip
+        forwarded = ",".join(
+            value for name, value in headers.items() if name.lower() == "x-forwarded-for"
+        )
+        hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not self._is_trusted(hop):
+                return hop
+        return hops[0] if hops else peer_ip
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> Optional[Tuple[str, str, Dict[str, str], bytes, bool]]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as err:
+            if not err.partial:
+                return None  # client closed between requests
+            raise
+        except asyncio.LimitOverrunError:
+            raise HttpError(431, "Request header fields too large")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise HttpError(400, "Bad request")
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip()] = value.strip()
+        lowered = {name.lower(): value for name, value in headers.items()}
+
+        if "transfer-encoding" in lowered:
+            raise HttpError(411, "Length required")
+        try:
+            length = int(lowered.get("content-length", 0))
+        except ValueError:
+            raise HttpError(400, "Bad request")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "Request too long")
+        body = await reader.readexactly(length) if length else b""
+
+        connection = lowered.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+        return method.upper(), target, headers, body, keep_alive
+
+    async def dispatch(
+        self,
+        method: str,
+        target: str,
+        headers: Dict[str, str],
+        body: bytes,
+        source_ip: Optional[str] = None,
+    ) -> dict:
+        url = urlsplit(target)
+        route, params, path_known = self.router.match(method, url.path)
+        if route is None:
+            if path_known and method == "OPTIONS" and self.cors:
+                return {"statusCode": 200, "headers": dict(self.cors), "body": ""}
+            if path_known:
+                return _gateway_response(405, "Method not allowed")
+            return _gateway_response(404, "Not found")
+
+        event = self.build_event(route, method, url.path, url.query, headers, body, params, source_ip)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, self._invoke, route, event)
+        except Exception:
+            logger.exception(f"{route.handler} failed")
+            # what API Gateway returns when the function errors
+            return _gateway_response(502, "Internal server error")
+
+    def build_event(
+        self,
+        route: Route,
+        method: str,
+        path: str,
+        query: str,
+        headers: Dict[str, str],
+        body: bytes,
+        params: Dict[str, str],
+        source_ip: Optional[str] = None,
+    ) -> dict:
+        multi_query = parse_qs(query, keep_blank_values=True)
+        if not body:
+            body_text, is_base64 = None, False
+        else:
+            try:
+                body_text, is_base64 = body.decode("utf-8"), False
+            except UnicodeDecodeError:
+                body_text, is_base64 = base64.b64encode(body).decode(), True
+
+        lowered = {name.lower(): value for name, value in headers.items()}
+        return {
+            "resource": route.path,
+            "path": path,
+            "httpMethod": method,
+            "headers": headers,
+            "multiValueHeaders": {name: [value] for name, value in headers.items()},
+            "queryStringParameters": (
+                {name: values[-1] for name, values in multi_query.items()} or None
+            ),
+            "multiValueQueryStringParameters": multi_query or None,
+            "pathParameters": {name: unquote(value) for name, value in params.items()} or None,
+            "stageVariables": None,
+            "requestContext": {
+                "resourcePath": route.path,
+                "httpMethod": method,
+                "path": f"/{STAGE}{path}",
+                "stage": STAGE,
+                "requestId": str(uuid4()),
+                "requestTimeEpoch": int(time.time() * 1000),
+                "identity": {
+                    "sourceIp": source_ip,
+                    "userAgent": lowered.get("user-agent"),
+                },
+            },
+            "body": body_text,
+            "isBase64Encoded": is_base64,
+        }
+
+    def _invoke(self, route: Route, event: dict) -> dict:
+        if route.authorized:
+            token = next(
+                (value for name, value in event["headers"].items() if name.lower() == "authorization"),
+                None,
+            )
+            if not token:
+                return _gateway_response(401, "Unauthorized")
+            policy = self.authorizer(
+                {
+                    "type": "REQUEST",
+                    "authorizationToken": token,
+                    "methodArn": (
+                        f"arn:aws:execute-api:local:local:server/{STAGE}/{event['httpMethod']}{event['path']}"
+                    ),
+                },
+                None,
+            )
+            statement = policy["policyDocument"]["Statement"][0]
+            if statement["Effect"] != "Allow":
+                return _gateway_response(403, "User is not authorized to access this resource")
+            event["requestContext"]["authorizer"] = {
+                "principalId": policy["principalId"],
+                **policy.get("context", {}),
+            }
+        return self.router.handler(route)(event, None)
+
+    @staticmethod
+    def _encode(response: dict, keep_alive: bool) -> bytes:
+        body = response.get("body") or ""
+        if response.get("isBase64Encoded"):
+            payload = base64.b64decode(body)
+        else:
+            payload = body.encode("utf-8")
+
+        status = response.get("statusCode", 200)
+        try:
+            reason = HTTPStatus(status).phrase
+        except ValueError:
+            reason = ""
+        lines = [f"HTTP/1.1 {status} {reason}"]
+        for name, value in (response.get("headers") or {}).items():
+            if name.lower() not in ("content-length", "connection"):
+                lines.append(f"{name}: {value}")
+        for name, values in (response.get("multiValueHeaders") or {}).items():
+            lines.extend(f"{name}: {value}" for value in values)
+        lines.append(f"Content-Length: {len(payload)}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve the API's Lambda handlers from one long-lived process"
+    )
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument(
+        "--trusted-proxy",
+        action="append",
+        default=[],
+        help="address or CIDR of a load balancer whose X-Forwarded-For is trusted; repeatable",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    router = Router(load_routes(args.template))
+    router.load_handlers()
+    # needs JWT_SECRET and JWT_ALGORITHM like the deployed authorizer
+    from handlers.auth.jwt_authorizer import lambda_handler
+
+    server = HandlerServer(
+        router,
+        authorizer=lambda_handler,
+        workers=args.workers,
+        cors=load_cors(args.template),
+        trusted_proxies=args.trusted_proxy,
+    )
+    asyncio.run(server.serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
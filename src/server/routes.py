@@ -0,0 +1,112 @@
+import re
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+
+@dataclass(slots=True)
+class Route:
+    method: str
+    path: str  # as written in the template, e.g. /bookings/{booking_id}/cancel
+    handler: str  # dotted handler name, e.g. handlers.bookings.create_booking.create_booking
+    authorized: bool = True
+    pattern: re.Pattern = field(init=False, repr=False)
+
+    def __post_init__(self):
+        segments = []
+        for segment in self.path.strip("/").split("/"):
+            if segment.startswith("{") and segment.endswith("}"):
+                segments.append(f"(?P<{segment[1:-1]}>[^/]+)")
+            else:
+                segments.append(re.escape(segment))
+        self.pattern = re.compile("^/" + "/".join(segments) + "$")
+
+
+class _TemplateLoader(yaml.SafeLoader):
+    """Reads the SAM template; short-form intrinsics (!Ref, !GetAtt) load as None."""
+
+
+_TemplateLoader.add_multi_constructor("!", lambda loader, suffix, node: None)
+
+
+def _load_template(template_path: str) -> dict:
+    with open(template_path) as f:
+        return yaml.load(f, Loader=_TemplateLoader)
+
+
+def load_cors(template_path: str) -> Dict[str, str]:
+    """The preflight response headers API Gateway derives from the Api's Cors."""
+    headers = {}
+    for res in _load_template(template_path).get("Resources", {}).values():
+        if res.get("Type") != "AWS::Serverless::Api":
+            continue
+        cors = (res.get("Properties") or {}).get("Cors")
+        if isinstance(cors, str):
+            cors = {"AllowOrigin": cors}
+        for name, value in (cors or {}).items():
+            if name in ("AllowMethods", "AllowHeaders", "AllowOrigin"):
+                # SAM values are quoted string literals, e.g. "'*'"
+                headers[f"Access-Control-{name[:5]}-{name[5:]}"] = value.strip("'")
+    return headers
+
+
+def load_routes(template_path: str) -> List[Route]:
+    """The Api events of every function in the template."""
+    resources = _load_template(template_path).get("Resources", {})
+    default_authorizer = any(
+        ((res.get("Properties") or {}).get("Auth") or {}).get("DefaultAuthorizer")
+        for res in resources.values()
+        if res.get("Type") == "AWS::Serverless::Api"
+    )
+    routes = []
+    for res in resources.values():
+        if res.get("Type") != "AWS::Serverless::Function":
+            continue
+        props = res.get("Properties") or {}
+        for event in (props.get("Events") or {}).values():
+            if event.get("Type") != "Api":
+                continue
+            api = event["Properties"]
+            authorizer = (api.get("Auth") or {}).get("Authorizer")
+            routes.append(
+                Route(
+                    method=api["Method"].upper(),
+                    path=api["Path"],
+                    handler=props["Handler"],
+                    authorized=default_authorizer and authorizer != "NONE",
+                )
+            )
+    return routes
+
+
+class Router:
+    def __init__(self, routes: List[Route]):
+        # like API Gateway, literal segments win over path parameters
+        self.routes = sorted(routes, key=lambda route: route.path.count("{"))
+        self._handlers: Dict[str, Callable] = {}
+
+    def match(self, method: str, path: str) -> Tuple[Optional[Route], Dict[str, str], bool]:
+        """(route, path parameters, whether any route has this path)."""
+        path_known = False
+        for route in self.routes:
+            found = route.pattern.match(path)
+            if not found:
+                continue
+            if route.method == method:
+                return route, found.groupdict(), True
+            path_known = True
+        return None, {}, path_known
+
+    def handler(self, route: Route) -> Callable:
+        fn = self._handlers.get(route.handler)
+        if fn is None:
+            module, _, name = route.handler.rpartition(".")
+            fn = self._handlers[route.handler] = getattr(import_module(module), name)
+        return fn
+
+    def load_handlers(self):
+        """Import every handler module up front instead of on its first request."""
+        for route in self.routes:
+            self.handler(route)
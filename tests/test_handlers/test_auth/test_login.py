@@ -32,17 +32,33 @@ class LoginHandlerTests(unittest.TestCase):
         )
         self.p_validate = patch("handlers.auth.login.LoginRequest.model_validate_json")
         self.p_login = patch.object(self.mod.service, "login")
+        self.p_allow = patch.object(self.mod.rate_limiter, "allow", return_value=True)
+        self.p_fail_allow = patch.object(
+            self.mod.failure_limiter, "allow", return_value=True
+        )
         self.mock_send = self.p_send.start()
         self.mock_validate = self.p_validate.start()
         self.mock_login = self.p_login.start()
+        self.mock_allow = self.p_allow.start()
+        self.mock_fail_allow = self.p_fail_allow.start()
+        self.p_exhausted = patch.object(
+            self.mod.failure_limiter, "exhausted", return_value=False
+        )
+        self.mock_exhausted = self.p_exhausted.start()
 
     def tearDown(self):
         self.p_send.stop()
         self.p_validate.stop()
         self.p_login.stop()
+        self.p_allow.stop()
+        self.p_fail_allow.stop()
+        self.p_exhausted.stop()
 
     def _event(self):
-        return {"body": json.dumps({"email": "u@test.com", "password": "pw"})}
+        return {
+            "body": json.dumps({"email": "u@test.com", "password": "pw"}),
+            "requestContext": {"identity": {"sourceIp": "203.0.113.7"}},
+        }
 
     def test_success(self):
         self.mock_validate.return_value.email = "u@test.com"
@@ -51,6 +67,34 @@ class LoginHandlerTests(unittest.TestCase):
         resp = self.mod.login_handler(self._event(), None)
         self.assertEqual(200, resp["statusCode"])
         self.mock_login.assert_called_once_with("u@test.com", "pw")
+        self.mock_fail_allow.assert_not_called()
+
+    def test_rate_limited_per_ip_before_checking_the_password(self):
+        self.mock_validate.return_value.email = "U@test.com"
+        self.mock_allow.return_value = False
+        resp = self.mod.login_handler(self._event(), None)
+        self.assertEqual(429, resp["statusCode"])
+        self.mock_allow.assert_called_once_with("203.0.113.7")
+        self.mock_login.assert_not_called()
+
+    def test_exhausted_account_rejected_before_checking_the_password(self):
+        self.mock_validate.return_value.email = "U@test.com"
+        self.mock_validate.return_value.password = "pw"
+        self.mock_exhausted.return_value = True
+        resp = self.mod.login_handler(self._event(), None)
+        self.assertEqual(429, resp["statusCode"])
+        self.mock_exhausted.assert_called_once_with("u@test.com")
+        self.mock_login.assert_not_called()
+        self.mock_fail_allow.assert_not_called()
+
+    def test_wrong_password_counts_against_the_account(self):
+        from common.utils.custom_exceptions import IncorrectCredentials
+        self.mock_validate.return_value.email = "U@test.com"
+        self.mock_validate.return_value.password = "pw"
+        self.mock_login.side_effect = IncorrectCredentials("bad")
+        resp = self.mod.login_handler(self._event(), None)
+        self.assertEqual(401, resp["statusCode"])
+        self.mock_fail_allow.assert_called_once_with("u@test.com")
 
     def test_validation_error(self):
         self.mock_validate.side_effect = ValidationError.from_exception_data("LoginRequest", [])
@@ -0,0 +1,76 @@
+import importlib
+import json
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from common.models.bookings import BookingStatus
+from common.utils.custom_exceptions import InvalidBookingState, NotFoundException
+
+
+class CancelBookingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+        cls.resource = patch("handlers.bookings.cancel_booking.resource")
+        mock_res = cls.resource.start()
+        mock_res.return_value.Table.return_value = MagicMock()
+        import handlers.bookings.cancel_booking as mod
+        cls.mod = importlib.reload(mod)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resource.stop()
+        cls.env.stop()
+
+    def setUp(self):
+        self.p_cancel = patch.object(self.mod.booking_service, "cancel_booking")
+        self.mock_cancel = self.p_cancel.start()
+
+    def tearDown(self):
+        self.p_cancel.stop()
+
+    def _event(self, role="CUSTOMER", booking_id="b1"):
+        return {
+            "pathParameters": {"booking_id": booking_id},
+            "requestContext": {"authorizer": {"user_id": "u1", "role": role}},
+        }
+
+    def test_cancel_own_booking(self):
+        booking = MagicMock(booking_id="b1", status=BookingStatus.CANCELLED)
+        self.mock_cancel.return_value = booking
+
+        resp = self.mod.cancel_booking(self._event(), None)
+
+        self.assertEqual(200, resp["statusCode"])
+        self.assertEqual(
+            {"booking_id": "b1", "status": "CANCELLED"}, json.loads(resp["body"])["data"]
+        )
+        self.mock_cancel.assert_called_once_with("b1", "u1", is_staff=False)
+
+    def test_manager_may_cancel_any_booking(self):
+        self.mock_cancel.return_value = MagicMock(booking_id="b1", status=BookingStatus.CANCELLED)
+
+        self.mod.cancel_booking(self._event(role="manager"), None)
+
+        self.mock_cancel.assert_called_once_with("b1", "u1", is_staff=True)
+
+    def test_not_found(self):
+        self.mock_cancel.side_effect = NotFoundException("booking", "b1", 404)
+
+        self.assertEqual(404, self.mod.cancel_booking(self._event(), None)["statusCode"])
+
+    def test_not_upcoming_conflicts(self):
+        self.mock_cancel.side_effect = InvalidBookingState("only upcoming bookings can be cancelled")
+
+        self.assertEqual(409, self.mod.cancel_booking(self._event(), None)["statusCode"])
+
+    def test_unauthorized(self):
+        resp = self.mod.cancel_booking({"pathParameters": {"booking_id": "b1"}}, None)
+
+        self.assertEqual(401, resp["statusCode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
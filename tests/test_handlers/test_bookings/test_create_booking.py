@@ -5,7 +5,11 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from common.models.rooms import Category
-from common.utils.custom_exceptions import NotFoundException, NoAvailableRooms
+from common.utils.custom_exceptions import (
+    IdempotencyKeyReused,
+    NotFoundException,
+    NoAvailableRooms,
+)
 
 
 class CreateBookingTests(unittest.TestCase):
@@ -41,14 +45,17 @@ class CreateBookingTests(unittest.TestCase):
             },
         )
         self.p_add = patch.object(self.mod.booking_service, "add_booking")
+        self.p_allow = patch.object(self.mod.rate_limiter, "allow", return_value=True)
         self.p_validate = patch("handlers.bookings.create_booking.BookingRequest.model_validate_json")
         self.mock_send = self.p_send.start()
         self.mock_add = self.p_add.start()
+        self.mock_allow = self.p_allow.start()
         self.mock_validate = self.p_validate.start()
 
     def tearDown(self):
         self.p_send.stop()
         self.p_add.stop()
+        self.p_allow.stop()
         self.p_validate.stop()
 
     def _event(self, body=None, user_id="u1"):
@@ -103,9 +110,51 @@ class CreateBookingTests(unittest.TestCase):
         req = MagicMock()
         req.category = Category.DELUXE
         self.mock_validate.return_value = req
+        self.mock_add.return_value = "b1"
         resp = self.mod.create_booking(self._event(body="{}"), None)
         self.assertEqual(201, resp["statusCode"])
-        self.mock_add.assert_called_once()
+        self.mock_add.assert_called_once_with(req, "u1", idempotency_key=None)
+
+    def test_rate_limited_user_returns_429(self):
+        self.mock_validate.return_value = MagicMock()
+        self.mock_allow.return_value = False
+        resp = self.mod.create_booking(self._event(body="{}"), None)
+        self.assertEqual(429, resp["statusCode"])
+        self.mock_allow.assert_called_once_with("u1")
+        self.mock_add.assert_not_called()
+
+    def test_idempotency_key_header_is_passed_through(self):
+        req = MagicMock()
+        self.mock_validate.return_value = req
+        self.mock_add.return_value = "b-first"
+        event = self._event(body="{}")
+        event["headers"] = {"idempotency-key": "key-1"}
+
+        resp = self.mod.create_booking(event, None)
+
+        self.assertEqual(201, resp["statusCode"])
+        self.mock_add.assert_called_once_with(req, "u1", idempotency_key="key-1")
+        self.assertEqual({"booking_id": "b-first"}, json.loads(resp["body"])["data"])
+
+    def test_oversized_idempotency_key_returns_400(self):
+        self.mock_validate.return_value = MagicMock()
+        event = self._event(body="{}")
+        event["headers"] = {"Idempotency-Key": "k" * 256}
+
+        resp = self.mod.create_booking(event, None)
+
+        self.assertEqual(400, resp["statusCode"])
+        self.mock_add.assert_not_called()
+
+    def test_reused_idempotency_key_returns_422(self):
+        self.mock_validate.return_value = MagicMock()
+        self.mock_add.side_effect = IdempotencyKeyReused("different request")
+        event = self._event(body="{}")
+        event["headers"] = {"Idempotency-Key": "key-1"}
+
+        resp = self.mod.create_booking(event, None)
+
+        self.assertEqual(422, resp["statusCode"])
 
 
 if __name__ == "__main__":
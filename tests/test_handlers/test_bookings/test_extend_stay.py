@@ -0,0 +1,71 @@
+import importlib
+import json
+import os
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from common.utils.custom_exceptions import InvalidDates, NoAvailableRooms
+
+
+class ExtendStayTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+        cls.resource = patch("handlers.bookings.extend_stay.resource")
+        mock_res = cls.resource.start()
+        mock_res.return_value.Table.return_value = MagicMock()
+        import handlers.bookings.extend_stay as mod
+        cls.mod = importlib.reload(mod)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resource.stop()
+        cls.env.stop()
+
+    def setUp(self):
+        self.p_extend = patch.object(self.mod.booking_service, "extend_stay")
+        self.mock_extend = self.p_extend.start()
+
+    def tearDown(self):
+        self.p_extend.stop()
+
+    def _event(self, body='{"checkout": "2026-03-05T16:30:00+05:30"}'):
+        return {
+            "body": body,
+            "pathParameters": {"booking_id": "b1"},
+            "requestContext": {"authorizer": {"user_id": "u1", "role": "CUSTOMER"}},
+        }
+
+    def test_extends_to_utc_checkout(self):
+        checkout = datetime(2026, 3, 5, 11, tzinfo=timezone.utc)
+        self.mock_extend.return_value = MagicMock(booking_id="b1", checkout=checkout)
+
+        resp = self.mod.extend_stay(self._event(), None)
+
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_extend.assert_called_once_with("b1", "u1", checkout, is_staff=False)
+        self.assertEqual(
+            "2026-03-05T11:00:00+00:00", json.loads(resp["body"])["data"]["checkout"]
+        )
+
+    def test_naive_checkout_rejected(self):
+        resp = self.mod.extend_stay(self._event('{"checkout": "2026-03-05T11:00:00"}'), None)
+
+        self.assertEqual(400, resp["statusCode"])
+        self.mock_extend.assert_not_called()
+
+    def test_invalid_dates(self):
+        self.mock_extend.side_effect = InvalidDates("new checkout must be after the current checkout")
+
+        self.assertEqual(400, self.mod.extend_stay(self._event(), None)["statusCode"])
+
+    def test_room_taken_conflicts(self):
+        self.mock_extend.side_effect = NoAvailableRooms("the room is not free for the extra nights")
+
+        self.assertEqual(409, self.mod.extend_stay(self._event(), None)["statusCode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import os
 import unittest
 from unittest.mock import MagicMock, patch
 from common.models.users import UserRole
-from common.utils.custom_exceptions import NotFoundException
+from common.utils.custom_exceptions import NotFoundException, InvalidCursor
 
 class GetUserBookingsTests(unittest.TestCase):
     @classmethod
@@ -30,16 +30,19 @@ class GetUserBookingsTests(unittest.TestCase):
             },
         )
         self.p_get = patch.object(self.mod.booking_service, "get_user_bookings")
+        self.p_page = patch.object(self.mod.booking_service, "get_user_bookings_page")
         self.mock_send = self.p_send.start()
         self.mock_get = self.p_get.start()
+        self.mock_page = self.p_page.start()
 
     def tearDown(self):
-        self.p_send.stop(); self.p_get.stop()
+        self.p_send.stop(); self.p_get.stop(); self.p_page.stop()
 
-    def _event(self, user_id="u1", role=UserRole.CUSTOMER.value, path_user_id=None):
+    def _event(self, user_id="u1", role=UserRole.CUSTOMER.value, path_user_id=None, query=None):
         event = {
             "requestContext": {"authorizer": {"user_id": user_id, "role": role}},
             "pathParameters": {"user_id": path_user_id} if path_user_id else {},
+            "queryStringParameters": query,
         }
         return event
 
@@ -92,6 +95,89 @@ class GetUserBookingsTests(unittest.TestCase):
         self.assertEqual(1, body["data"]["count"])
         self.assertEqual("b1", body["data"]["bookings"][0]["booking_id"])
 
+    def test_limit_returns_page_with_next_cursor(self):
+        self.mock_page.return_value = ([], "next-token")
+        resp = self.mod.get_user_bookings(self._event(query={"limit": "10"}), None)
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_page.assert_called_once_with("u1", limit=10, cursor=None)
+        self.mock_get.assert_not_called()
+        body = json.loads(resp["body"])
+        self.assertEqual("next-token", body["data"]["next_cursor"])
+
+    def test_cursor_without_limit_uses_default_page_size(self):
+        from common.utils.constants import DEFAULT_PAGE_SIZE
+        self.mock_page.return_value = ([], None)
+        resp = self.mod.get_user_bookings(self._event(query={"cursor": "abc"}), None)
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_page.assert_called_once_with("u1", limit=DEFAULT_PAGE_SIZE, cursor="abc")
+        body = json.loads(resp["body"])
+        self.assertNotIn("next_cursor", body["data"])
+
+    def test_invalid_limit_returns_400(self):
+        for limit in ("abc", "0", "1000"):
+            resp = self.mod.get_user_bookings(self._event(query={"limit": limit}), None)
+            self.assertEqual(400, resp["statusCode"])
+        self.mock_page.assert_not_called()
+
+    def test_invalid_cursor_returns_400(self):
+        self.mock_page.side_effect = InvalidCursor("invalid cursor")
+        resp = self.mod.get_user_bookings(self._event(query={"cursor": "bad"}), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_date_and_status_filters_passed_to_service(self):
+        from datetime import datetime, timezone
+        from common.models.bookings import BookingStatus
+        self.mock_get.return_value = []
+        query = {"from": "2026-03-01T00:00:00+05:30", "to": "2026-03-31T00:00:00+00:00", "status": "upcoming"}
+        resp = self.mod.get_user_bookings(self._event(query=query), None)
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_get.assert_called_once_with(
+            "u1",
+            checkin_from=datetime(2026, 2, 28, 18, 30, tzinfo=timezone.utc),
+            checkin_to=datetime(2026, 3, 31, tzinfo=timezone.utc),
+            status=BookingStatus.UPCOMING,
+        )
+
+    def test_plain_dates_cover_whole_utc_days(self):
+        from datetime import datetime, timezone
+        self.mock_get.return_value = []
+        query = {"from": "2026-03-01", "to": "2026-03-31"}
+        resp = self.mod.get_user_bookings(self._event(query=query), None)
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_get.assert_called_once_with(
+            "u1",
+            checkin_from=datetime(2026, 3, 1, tzinfo=timezone.utc),
+            checkin_to=datetime(2026, 3, 31, 23, 59, 59, 999999, tzinfo=timezone.utc),
+        )
+
+    def test_naive_datetime_gets_a_client_message(self):
+        resp = self.mod.get_user_bookings(
+            self._event(query={"from": "2026-03-01T00:00:00"}), None
+        )
+        self.assertEqual(400, resp["statusCode"])
+        self.assertNotIn("Stored", json.loads(resp["body"])["message"])
+        self.assertIn("from must be a date", json.loads(resp["body"])["message"])
+
+    def test_filters_combine_with_pagination(self):
+        from common.models.bookings import BookingStatus
+        self.mock_page.return_value = ([], None)
+        resp = self.mod.get_user_bookings(self._event(query={"limit": "5", "status": "CHECKED_OUT"}), None)
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_page.assert_called_once_with(
+            "u1", limit=5, cursor=None, status=BookingStatus.CHECKED_OUT
+        )
+
+    def test_invalid_filters_return_400(self):
+        for query in (
+            {"from": "not-a-date"},
+            {"to": "2026-03-01T00:00:00"},
+            {"from": "2026-03-02T00:00:00+00:00", "to": "2026-03-01T00:00:00+00:00"},
+            {"status": "bad"},
+        ):
+            resp = self.mod.get_user_bookings(self._event(query=query), None)
+            self.assertEqual(400, resp["statusCode"])
+        self.mock_get.assert_not_called()
+
     def test_not_found_exception_returns_status(self):
         self.mock_get.side_effect = NotFoundException("user", "u1", 404)
         resp = self.mod.get_user_bookings(self._event(), None)
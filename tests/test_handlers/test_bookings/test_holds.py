@@ -0,0 +1,89 @@
+import importlib
+import json
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from common.utils.custom_exceptions import NotFoundException, NoAvailableRooms
+
+
+def _load(module_name):
+    with patch(f"{module_name}.resource") as mock_res:
+        mock_res.return_value.Table.return_value = MagicMock()
+        return importlib.reload(importlib.import_module(module_name))
+
+
+class HoldHandlerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+        cls.create_mod = _load("handlers.bookings.create_hold")
+        cls.confirm_mod = _load("handlers.bookings.confirm_hold")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.env.stop()
+
+    def _event(self, body=None, hold_id=None, user_id="u1"):
+        return {
+            "body": body,
+            "pathParameters": {"hold_id": hold_id} if hold_id else None,
+            "requestContext": {"authorizer": {"user_id": user_id} if user_id else {}},
+        }
+
+    def _body(self):
+        return json.dumps({
+            "category": "deluxe",
+            "checkin": "2099-03-01T14:00:00Z",
+            "checkout": "2099-03-03T11:00:00Z",
+        })
+
+    def test_create_hold_returns_the_hold(self):
+        with patch.object(self.create_mod.booking_service, "hold_room") as hold_room:
+            hold_room.return_value = {"hold_id": "h1", "room_id": "r1"}
+            resp = self.create_mod.create_hold(self._event(self._body()), None)
+
+        self.assertEqual(201, resp["statusCode"])
+        self.assertEqual("h1", json.loads(resp["body"])["data"]["hold_id"])
+        self.assertEqual("u1", hold_room.call_args.args[1])
+
+    def test_create_hold_no_rooms(self):
+        with patch.object(
+            self.create_mod.booking_service, "hold_room", side_effect=NoAvailableRooms("none")
+        ):
+            resp = self.create_mod.create_hold(self._event(self._body()), None)
+
+        self.assertEqual(404, resp["statusCode"])
+
+    def test_create_hold_requires_body(self):
+        self.assertEqual(400, self.create_mod.create_hold(self._event(), None)["statusCode"])
+
+    def test_confirm_hold_creates_booking(self):
+        with patch.object(
+            self.confirm_mod.booking_service, "confirm_hold", return_value="b1"
+        ) as confirm:
+            resp = self.confirm_mod.confirm_hold(self._event(hold_id="h1"), None)
+
+        self.assertEqual(201, resp["statusCode"])
+        self.assertEqual({"booking_id": "b1"}, json.loads(resp["body"])["data"])
+        confirm.assert_called_once_with("h1", "u1")
+
+    def test_confirm_hold_expired(self):
+        with patch.object(
+            self.confirm_mod.booking_service,
+            "confirm_hold",
+            side_effect=NotFoundException("hold", "h1", 404),
+        ):
+            resp = self.confirm_mod.confirm_hold(self._event(hold_id="h1"), None)
+
+        self.assertEqual(404, resp["statusCode"])
+
+    def test_confirm_hold_unauthorized(self):
+        resp = self.confirm_mod.confirm_hold(self._event(hold_id="h1", user_id=None), None)
+
+        self.assertEqual(401, resp["statusCode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -60,6 +60,14 @@ class TestAutoCheckout(unittest.TestCase):
 
         self.mock_invoice.send_invoice.assert_called_once_with("b1")
 
+    def test_schedule_after_early_checkout_sends_no_invoice(self):
+        self.mock_booking.update_booking.return_value = False
+
+        self.mod.auto_checkout(self._event(), None)
+
+        self.mock_booking.update_booking.assert_called_once()
+        self.mock_invoice.send_invoice.assert_not_called()
+
     def test_missing_booking_id(self):
         with self.assertRaises(KeyError):
             self.mod.auto_checkout(
@@ -0,0 +1,79 @@
+import importlib
+import json
+import os
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from common.utils.custom_exceptions import InvalidBookingState, NotFoundException
+
+
+class EarlyCheckoutTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+        cls.resource = patch("handlers.checkout.early_checkout.resource")
+        mock_res = cls.resource.start()
+        mock_res.return_value.Table.return_value = MagicMock()
+        import handlers.checkout.early_checkout as mod
+        cls.mod = importlib.reload(mod)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resource.stop()
+        cls.env.stop()
+
+    def setUp(self):
+        self.p_checkout = patch.object(self.mod.booking_service, "early_checkout")
+        self.p_invoice = patch.object(self.mod, "invoice_service")
+        self.mock_checkout = self.p_checkout.start()
+        self.mock_invoice = self.p_invoice.start()
+        self.mock_checkout.return_value = MagicMock(
+            booking_id="b1", checkout=datetime(2026, 3, 3, 9, tzinfo=timezone.utc)
+        )
+
+    def tearDown(self):
+        self.p_checkout.stop()
+        self.p_invoice.stop()
+
+    def _event(self, role="CUSTOMER"):
+        return {
+            "pathParameters": {"booking_id": "b1"},
+            "requestContext": {"authorizer": {"user_id": "u1", "role": role}},
+        }
+
+    def test_checks_out_and_sends_invoice(self):
+        resp = self.mod.early_checkout(self._event(), None)
+
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_checkout.assert_called_once_with("b1", "u1", is_staff=False)
+        self.mock_invoice.send_invoice.assert_called_once_with("b1")
+        self.assertEqual(
+            "2026-03-03T09:00:00+00:00", json.loads(resp["body"])["data"]["checkout"]
+        )
+
+    def test_staff_may_check_out_any_guest(self):
+        self.mod.early_checkout(self._event(role="admin"), None)
+
+        self.mock_checkout.assert_called_once_with("b1", "u1", is_staff=True)
+
+    def test_failed_invoice_does_not_fail_checkout(self):
+        self.mock_invoice.send_invoice.side_effect = RuntimeError("ses down")
+
+        self.assertEqual(200, self.mod.early_checkout(self._event(), None)["statusCode"])
+
+    def test_stay_not_in_progress(self):
+        self.mock_checkout.side_effect = InvalidBookingState("the stay is not in progress")
+
+        self.assertEqual(409, self.mod.early_checkout(self._event(), None)["statusCode"])
+        self.mock_invoice.send_invoice.assert_not_called()
+
+    def test_not_found(self):
+        self.mock_checkout.side_effect = NotFoundException("booking", "b1", 404)
+
+        self.assertEqual(404, self.mod.early_checkout(self._event(), None)["statusCode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
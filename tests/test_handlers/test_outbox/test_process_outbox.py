@@ -0,0 +1,83 @@
+import importlib
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+def stream_record(sequence_number, event_name="INSERT", pk="OUTBOX#3"):
+    return {
+        "eventName": event_name,
+        "dynamodb": {
+            "SequenceNumber": sequence_number,
+            "NewImage": {
+                "pk": {"S": pk},
+                "sk": {"S": f"BOOKING#{sequence_number}"},
+                "action": {"S": "SCHEDULE_CHECKOUT"},
+                "booking_id": {"S": sequence_number},
+            },
+        },
+    }
+
+
+class TestProcessOutbox(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+
+        cls.resource = patch("handlers.outbox.process_outbox.resource")
+        mock_res = cls.resource.start()
+        mock_res.return_value.Table.return_value = MagicMock()
+
+        import handlers.outbox.process_outbox as mod
+        cls.mod = importlib.reload(mod)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resource.stop()
+        cls.env.stop()
+
+    def setUp(self):
+        self.p_processor = patch.object(self.mod, "outbox_processor")
+        self.mock_processor = self.p_processor.start()
+
+    def tearDown(self):
+        self.p_processor.stop()
+
+    def test_reports_only_failed_records(self):
+        self.mock_processor.process.return_value = [True, False]
+
+        result = self.mod.process_outbox(
+            {"Records": [stream_record("1"), stream_record("2", "MODIFY")]}, None
+        )
+
+        self.assertEqual({"batchItemFailures": [{"itemIdentifier": "2"}]}, result)
+        entries = self.mock_processor.process.call_args.args[0]
+        self.assertEqual(["1", "2"], [entry["booking_id"] for entry in entries])
+
+    def test_only_the_newest_record_per_entry_is_applied(self):
+        self.mock_processor.process.return_value = [True]
+        newer = stream_record("1", "MODIFY")
+        newer["dynamodb"]["SequenceNumber"] = "2"
+        newer["dynamodb"]["NewImage"]["action"] = {"S": "CANCEL_CHECKOUT"}
+
+        result = self.mod.process_outbox({"Records": [stream_record("1"), newer]}, None)
+
+        self.assertEqual({"batchItemFailures": []}, result)
+        entries = self.mock_processor.process.call_args.args[0]
+        self.assertEqual(["CANCEL_CHECKOUT"], [entry["action"] for entry in entries])
+
+    def test_ignores_removals_and_other_items(self):
+        self.mock_processor.process.return_value = []
+
+        result = self.mod.process_outbox(
+            {"Records": [stream_record("1", "REMOVE"), stream_record("2", pk="ROOM#r1")]},
+            None,
+        )
+
+        self.assertEqual({"batchItemFailures": []}, result)
+        self.mock_processor.process.assert_called_once_with([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -100,7 +100,7 @@ class AddRoomTests(unittest.TestCase):
 	def test_success_adds_and_returns_201(self):
 		resp = self.mod.add_room(self._event(), None)
 		self.assertEqual(201, resp["statusCode"])
-		self.mock_add.assert_called_once_with(room_id="room1", category=Category.DELUXE)
+		self.mock_add.assert_called_once_with(room_id="room1", category=Category.DELUXE, floor=None)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,90 @@
+import importlib
+import json
+import os
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from common.models.rooms import Category, NightAvailability
+from common.utils.custom_exceptions import InvalidDates
+
+
+class GetCalendarTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+        cls.resource = patch("handlers.rooms.get_calendar.resource")
+        mock_res = cls.resource.start()
+        mock_res.return_value.Table.return_value = MagicMock()
+        import handlers.rooms.get_calendar as mod
+        cls.mod = importlib.reload(mod)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resource.stop()
+        cls.env.stop()
+
+    def setUp(self):
+        self.p_calendar = patch.object(self.mod.room_service, "get_calendar")
+        self.mock_calendar = self.p_calendar.start()
+        self.mock_calendar.return_value = [
+            NightAvailability(date(2026, 3, 1), 4),
+            NightAvailability(date(2026, 3, 2), 0),
+        ]
+
+    def tearDown(self):
+        self.p_calendar.stop()
+
+    def _event(self, params):
+        return {"queryStringParameters": params, "requestContext": {}}
+
+    def test_success(self):
+        resp = self.mod.get_calendar(
+            self._event({"category": "deluxe", "start": "2026-03-01", "days": "2"}), None
+        )
+
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_calendar.assert_called_once_with(Category.DELUXE, date(2026, 3, 1), 2)
+        data = json.loads(resp["body"])["data"]
+        self.assertEqual(
+            [{"night": "2026-03-01", "free_rooms": 4}, {"night": "2026-03-02", "free_rooms": 0}],
+            data["nights"],
+        )
+
+    def test_defaults_to_today_and_sixty_days(self):
+        self.mod.get_calendar(self._event({"category": "SUITE"}), None)
+
+        self.mock_calendar.assert_called_once_with(
+            Category.SUITE, datetime.now(timezone.utc).date(), 60
+        )
+
+    def test_missing_category(self):
+        resp = self.mod.get_calendar(self._event({}), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_invalid_category(self):
+        resp = self.mod.get_calendar(self._event({"category": "penthouse"}), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_invalid_days(self):
+        resp = self.mod.get_calendar(self._event({"category": "SUITE", "days": "365"}), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_invalid_start(self):
+        resp = self.mod.get_calendar(self._event({"category": "SUITE", "start": "tomorrow"}), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_past_start(self):
+        self.mock_calendar.side_effect = InvalidDates("calendar cannot start in the past")
+        resp = self.mod.get_calendar(self._event({"category": "SUITE", "start": "2020-01-01"}), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_generic_error(self):
+        self.mock_calendar.side_effect = RuntimeError("boom")
+        resp = self.mod.get_calendar(self._event({"category": "SUITE"}), None)
+        self.assertEqual(500, resp["statusCode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import importlib
+import json
+import os
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+from common.models.users import UserRole
+from common.models.rooms import HousekeepingTask
+from common.utils.custom_exceptions import InvalidCursor
+
+
+class GetHousekeepingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+        cls.resource = patch("handlers.rooms.get_housekeeping.resource")
+        mock_res = cls.resource.start()
+        mock_res.return_value.Table.return_value = MagicMock()
+        import handlers.rooms.get_housekeeping as mod
+        cls.mod = importlib.reload(mod)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resource.stop()
+        cls.env.stop()
+
+    def setUp(self):
+        self.p_queue = patch.object(self.mod.room_service, "get_housekeeping_queue")
+        self.mock_queue = self.p_queue.start()
+        self.task = HousekeepingTask(
+            room_id="301",
+            booking_id="b1",
+            checked_out_at=datetime(2026, 3, 2, 6, tzinfo=timezone.utc),
+        )
+        self.mock_queue.return_value = ([self.task], "next")
+
+    def tearDown(self):
+        self.p_queue.stop()
+
+    def _event(self, role=UserRole.MANAGER.value, params=None):
+        return {
+            "requestContext": {"authorizer": {"role": role}},
+            "queryStringParameters": params,
+        }
+
+    def test_returns_page_in_queue_order(self):
+        resp = self.mod.get_housekeeping_queue(
+            self._event(params={"date": "2026-03-02", "limit": "5", "cursor": "abc"}), None
+        )
+
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_queue.assert_called_once_with(date(2026, 3, 2), limit=5, cursor="abc")
+        data = json.loads(resp["body"])["data"]
+        self.assertEqual("next", data["next_cursor"])
+        self.assertEqual(
+            [{"room_id": "301", "booking_id": "b1", "checked_out_at": "2026-03-02T06:00:00Z"}],
+            data["rooms"],
+        )
+
+    def test_defaults_to_today(self):
+        self.mock_queue.return_value = ([], None)
+
+        resp = self.mod.get_housekeeping_queue(self._event(), None)
+
+        self.assertEqual(200, resp["statusCode"])
+        day = self.mock_queue.call_args[0][0]
+        self.assertEqual(datetime.now(timezone.utc).date(), day)
+        self.assertNotIn("next_cursor", json.loads(resp["body"])["data"])
+
+    def test_customer_forbidden(self):
+        resp = self.mod.get_housekeeping_queue(self._event(role=UserRole.CUSTOMER.value), None)
+        self.assertEqual(403, resp["statusCode"])
+
+    def test_missing_authorizer_returns_401(self):
+        resp = self.mod.get_housekeeping_queue({"requestContext": {}}, None)
+        self.assertEqual(401, resp["statusCode"])
+
+    def test_invalid_date_returns_400(self):
+        resp = self.mod.get_housekeeping_queue(self._event(params={"date": "03/02/2026"}), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_invalid_limit_returns_400(self):
+        resp = self.mod.get_housekeeping_queue(self._event(params={"limit": "0"}), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_invalid_cursor_returns_400(self):
+        self.mock_queue.side_effect = InvalidCursor("invalid cursor")
+        resp = self.mod.get_housekeeping_queue(self._event(params={"cursor": "bad"}), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_client_error_returns_500(self):
+        self.mock_queue.side_effect = ClientError({"Error": {"Code": "X"}}, "Query")
+        resp = self.mod.get_housekeeping_queue(self._event(), None)
+        self.assertEqual(500, resp["statusCode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -92,6 +92,64 @@ class GetRoomsTests(unittest.TestCase):
         self.assertEqual(["r1", "r2"], body["data"]["available_rooms"])
         self.assertEqual(2, body["data"]["count"])
 
+    def _availability(self):
+        from common.models.rooms import Category, CategoryAvailability
+        return [
+            CategoryAvailability(Category.DELUXE, 1500.0, ["r1", "r2"]),
+            CategoryAvailability(Category.SUITE, 4000.0, []),
+        ]
+
+    def test_multiple_categories_combined(self):
+        from common.models.rooms import Category
+        with patch.object(self.mod.room_service, "get_availability") as mock_avail:
+            mock_avail.return_value = self._availability()
+            resp = self.mod.get_rooms(
+                self._event(category="deluxe,SUITE", role=UserRole.MANAGER.value), None
+            )
+
+        self.assertEqual(200, resp["statusCode"])
+        self.assertEqual(
+            [Category.DELUXE, Category.SUITE], mock_avail.call_args.kwargs["categories"]
+        )
+        data = json.loads(resp["body"])["data"]
+        self.assertEqual(2, data["count"])
+        self.assertEqual(
+            {"category": "DELUXE", "price_per_night": 1500.0, "count": 2,
+             "available_rooms": ["r1", "r2"]},
+            data["categories"][0],
+        )
+        self.assertEqual(0, data["categories"][1]["count"])
+        self.mock_get.assert_not_called()
+
+    def test_all_categories_hides_rooms_from_customer(self):
+        from common.models.rooms import Category
+        with patch.object(self.mod.room_service, "get_availability") as mock_avail:
+            mock_avail.return_value = self._availability()
+            resp = self.mod.get_rooms(
+                self._event(category="all", role=UserRole.CUSTOMER.value), None
+            )
+
+        self.assertEqual(list(Category), mock_avail.call_args.kwargs["categories"])
+        data = json.loads(resp["body"])["data"]
+        self.assertNotIn("available_rooms", data["categories"][0])
+
+    def test_repeated_category_parameter(self):
+        from common.models.rooms import Category
+        event = self._event(category="SUITE")
+        event["multiValueQueryStringParameters"] = {"category": ["DELUXE", "SUITE"]}
+        with patch.object(self.mod.room_service, "get_availability") as mock_avail:
+            mock_avail.return_value = self._availability()
+            resp = self.mod.get_rooms(event, None)
+
+        self.assertEqual(200, resp["statusCode"])
+        self.assertEqual(
+            [Category.DELUXE, Category.SUITE], mock_avail.call_args.kwargs["categories"]
+        )
+
+    def test_invalid_category_in_list(self):
+        resp = self.mod.get_rooms(self._event(category="DELUXE,PENTHOUSE"), None)
+        self.assertEqual(400, resp["statusCode"])
+
     def test_generic_error(self):
         self.mock_get.side_effect = RuntimeError("boom")
         resp = self.mod.get_rooms(self._event(), None)
@@ -0,0 +1,194 @@
+import base64
+import importlib
+import json
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+from common.models.users import UserRole
+from common.models.rooms import Category
+
+
+class ImportRoomsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+        cls.resource = patch("handlers.rooms.import_rooms.resource")
+        mock_res = cls.resource.start()
+        mock_res.return_value.Table.return_value = MagicMock()
+        import handlers.rooms.import_rooms as mod
+        cls.mod = importlib.reload(mod)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resource.stop()
+        cls.env.stop()
+
+    def setUp(self):
+        self.p_send = patch(
+            "handlers.rooms.import_rooms.send_custom_response",
+            side_effect=lambda status_code, message=None, data=None: {
+                "statusCode": status_code,
+                "body": json.dumps({"message": message, "data": data}),
+            },
+        )
+        self.p_add = patch.object(self.mod.room_service, "add_rooms")
+        self.mock_send = self.p_send.start()
+        self.mock_add = self.p_add.start()
+        self.mock_add.side_effect = lambda rooms: ([r.room_id for r in rooms], [], [])
+
+    def tearDown(self):
+        self.p_send.stop()
+        self.p_add.stop()
+
+    def _event(self, body, role=UserRole.MANAGER.value, headers=None):
+        return {
+            "requestContext": {"authorizer": {"role": role}},
+            "headers": headers or {},
+            "body": body,
+        }
+
+    def test_customer_forbidden(self):
+        resp = self.mod.import_rooms(self._event("[]", role=UserRole.CUSTOMER.value), None)
+        self.assertEqual(403, resp["statusCode"])
+        self.mock_add.assert_not_called()
+
+    def test_json_list_imported(self):
+        body = json.dumps([
+            {"room_id": "101", "category": "deluxe"},
+            {"room_id": "102", "category": "SUITE"},
+        ])
+
+        resp = self.mod.import_rooms(self._event(body), None)
+
+        self.assertEqual(201, resp["statusCode"])
+        rooms = self.mock_add.call_args[0][0]
+        self.assertEqual(["101", "102"], [r.room_id for r in rooms])
+        self.assertEqual([Category.DELUXE, Category.SUITE], [r.category for r in rooms])
+
+    def test_json_object_wrapper_accepted(self):
+        body = json.dumps({"rooms": [{"room_id": "101", "category": "DELUXE"}]})
+        resp = self.mod.import_rooms(self._event(body), None)
+        self.assertEqual(201, resp["statusCode"])
+
+    def test_csv_imported(self):
+        body = "room_id,category\n101,DELUXE\n102,standard\n"
+        headers = {"content-type": "text/csv; charset=utf-8"}
+
+        resp = self.mod.import_rooms(self._event(body, headers=headers), None)
+
+        self.assertEqual(201, resp["statusCode"])
+        rooms = self.mock_add.call_args[0][0]
+        self.assertEqual(["101", "102"], [r.room_id for r in rooms])
+
+    def test_floor_column_parsed(self):
+        body = "room_id,category,floor\n101,DELUXE,1\n102,DELUXE,\n"
+        headers = {"Content-Type": "text/csv"}
+
+        resp = self.mod.import_rooms(self._event(body, headers=headers), None)
+
+        self.assertEqual(201, resp["statusCode"])
+        rooms = self.mock_add.call_args[0][0]
+        self.assertEqual([1, None], [r.floor for r in rooms])
+
+    def test_invalid_floor_returns_400(self):
+        body = json.dumps([{"room_id": "101", "category": "DELUXE", "floor": "first"}])
+        resp = self.mod.import_rooms(self._event(body), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_base64_csv_imported(self):
+        body = base64.b64encode(b"room_id,category\n101,DELUXE\n").decode()
+        event = self._event(body, headers={"Content-Type": "text/csv"})
+        event["isBase64Encoded"] = True
+
+        resp = self.mod.import_rooms(event, None)
+
+        self.assertEqual(201, resp["statusCode"])
+
+    def test_conflicts_reported_without_failing(self):
+        self.mock_add.side_effect = None
+        self.mock_add.return_value = (["102"], ["101"], [])
+        body = json.dumps([
+            {"room_id": "101", "category": "DELUXE"},
+            {"room_id": "102", "category": "DELUXE"},
+        ])
+
+        resp = self.mod.import_rooms(self._event(body), None)
+
+        self.assertEqual(207, resp["statusCode"])
+        data = json.loads(resp["body"])["data"]
+        self.assertEqual({"added": ["102"], "conflicts": ["101"], "failed": []}, data)
+
+    def test_failed_rooms_reported_with_the_written_ones(self):
+        self.mock_add.side_effect = None
+        self.mock_add.return_value = (["101"], [], ["102"])
+        body = json.dumps([
+            {"room_id": "101", "category": "DELUXE"},
+            {"room_id": "102", "category": "DELUXE"},
+        ])
+
+        resp = self.mod.import_rooms(self._event(body), None)
+
+        self.assertEqual(207, resp["statusCode"])
+        data = json.loads(resp["body"])["data"]
+        self.assertEqual({"added": ["101"], "conflicts": [], "failed": ["102"]}, data)
+
+    def test_nothing_written_is_500_with_the_failed_rooms(self):
+        self.mock_add.side_effect = None
+        self.mock_add.return_value = ([], [], ["101"])
+        body = json.dumps([{"room_id": "101", "category": "DELUXE"}])
+
+        resp = self.mod.import_rooms(self._event(body), None)
+
+        self.assertEqual(500, resp["statusCode"])
+        self.assertEqual(["101"], json.loads(resp["body"])["data"]["failed"])
+
+    def test_invalid_row_rejects_import(self):
+        body = json.dumps([
+            {"room_id": "101", "category": "DELUXE"},
+            {"room_id": "102", "category": "PENTHOUSE"},
+        ])
+
+        resp = self.mod.import_rooms(self._event(body), None)
+
+        self.assertEqual(400, resp["statusCode"])
+        self.assertIn("Row 2", json.loads(resp["body"])["message"])
+        self.mock_add.assert_not_called()
+
+    def test_non_string_room_id_returns_400(self):
+        body = json.dumps([{"room_id": 101, "category": "DELUXE"}])
+
+        resp = self.mod.import_rooms(self._event(body), None)
+
+        self.assertEqual(400, resp["statusCode"])
+        self.assertIn("Row 1", json.loads(resp["body"])["message"])
+        self.mock_add.assert_not_called()
+
+    def test_non_string_category_returns_400(self):
+        body = json.dumps([{"room_id": "101", "category": ["DELUXE"]}])
+
+        resp = self.mod.import_rooms(self._event(body), None)
+
+        self.assertEqual(400, resp["statusCode"])
+        self.mock_add.assert_not_called()
+
+    def test_invalid_json_returns_400(self):
+        resp = self.mod.import_rooms(self._event("{bad"), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_too_many_rows_returns_400(self):
+        body = json.dumps([{"room_id": str(i), "category": "DELUXE"} for i in range(1001)])
+        resp = self.mod.import_rooms(self._event(body), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_client_error_returns_500(self):
+        self.mock_add.side_effect = ClientError({"Error": {"Code": "X"}}, "TransactWriteItems")
+        body = json.dumps([{"room_id": "101", "category": "DELUXE"}])
+        resp = self.mod.import_rooms(self._event(body), None)
+        self.assertEqual(500, resp["statusCode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
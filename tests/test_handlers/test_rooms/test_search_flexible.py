@@ -0,0 +1,78 @@
+import importlib
+import json
+import os
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from common.models.rooms import Category, StayOption
+from common.utils.custom_exceptions import InvalidDates
+
+
+class SearchFlexibleTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+        cls.resource = patch("handlers.rooms.search_flexible.resource")
+        mock_res = cls.resource.start()
+        mock_res.return_value.Table.return_value = MagicMock()
+        import handlers.rooms.search_flexible as mod
+        cls.mod = importlib.reload(mod)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resource.stop()
+        cls.env.stop()
+
+    def setUp(self):
+        self.p_find = patch.object(self.mod.room_service, "find_start_dates")
+        self.mock_find = self.p_find.start()
+        self.mock_find.return_value = [
+            StayOption(date(2026, 3, 4), date(2026, 3, 7), 5),
+        ]
+
+    def tearDown(self):
+        self.p_find.stop()
+
+    def _event(self, **params):
+        base = {"category": "deluxe", "from": "2026-03-01", "to": "2026-03-14", "nights": "3"}
+        base.update(params)
+        return {"queryStringParameters": base, "requestContext": {}}
+
+    def test_success(self):
+        resp = self.mod.search_flexible(self._event(), None)
+
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_find.assert_called_once_with(
+            Category.DELUXE, date(2026, 3, 1), date(2026, 3, 14), 3, limit=10
+        )
+        data = json.loads(resp["body"])["data"]
+        self.assertEqual(
+            [{"checkin": "2026-03-04", "checkout": "2026-03-07", "free_rooms": 5}],
+            data["options"],
+        )
+
+    def test_missing_params(self):
+        resp = self.mod.search_flexible({"queryStringParameters": {"category": "SUITE"}}, None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_invalid_values(self):
+        for params in ({"category": "x"}, {"from": "soon"}, {"nights": "three"}, {"limit": "0"}, {"limit": "ten"}):
+            with self.subTest(params=params):
+                resp = self.mod.search_flexible(self._event(**params), None)
+                self.assertEqual(400, resp["statusCode"])
+
+    def test_service_validation_errors(self):
+        self.mock_find.side_effect = InvalidDates("window cannot start in the past")
+        resp = self.mod.search_flexible(self._event(), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_generic_error(self):
+        self.mock_find.side_effect = RuntimeError("boom")
+        resp = self.mod.search_flexible(self._event(), None)
+        self.assertEqual(500, resp["statusCode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import importlib
+import json
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+from common.models.users import UserRole
+from common.models.rooms import RoomStatus
+from common.utils.custom_exceptions import NotFoundException
+
+
+class UpdateFloorStatusTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.env = patch.dict(os.environ, {"TABLE_NAME": "test-table"}, clear=False)
+        cls.env.start()
+        cls.resource = patch("handlers.rooms.update_floor_status.resource")
+        mock_res = cls.resource.start()
+        mock_res.return_value.Table.return_value = MagicMock()
+        import handlers.rooms.update_floor_status as mod
+        cls.mod = importlib.reload(mod)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resource.stop()
+        cls.env.stop()
+
+    def setUp(self):
+        self.p_send = patch(
+            "handlers.rooms.update_floor_status.send_custom_response",
+            side_effect=lambda status_code, message=None, data=None: {
+                "statusCode": status_code,
+                "body": json.dumps({"message": message, "data": data}),
+            },
+        )
+        self.p_update = patch.object(self.mod.room_service, "update_floor_status")
+        self.mock_send = self.p_send.start()
+        self.mock_update = self.p_update.start()
+        self.mock_update.return_value = ["301", "305"]
+
+    def tearDown(self):
+        self.p_send.stop()
+        self.p_update.stop()
+
+    def _event(self, role=UserRole.MANAGER.value, floor="3", body=None):
+        return {
+            "requestContext": {"authorizer": {"role": role}},
+            "pathParameters": {"floor": floor},
+            "body": body if body is not None else json.dumps(
+                {"from_status": "housekeeping", "status": "available"}
+            ),
+        }
+
+    def test_success(self):
+        resp = self.mod.update_floor_status(self._event(), None)
+
+        self.assertEqual(200, resp["statusCode"])
+        self.mock_update.assert_called_once_with(
+            3, RoomStatus.HOUSEKEEPING, RoomStatus.AVAILABLE
+        )
+        data = json.loads(resp["body"])["data"]
+        self.assertEqual(["301", "305"], data["room_ids"])
+
+    def test_non_manager_forbidden(self):
+        resp = self.mod.update_floor_status(self._event(role=UserRole.CUSTOMER.value), None)
+        self.assertEqual(403, resp["statusCode"])
+        self.mock_update.assert_not_called()
+
+    def test_invalid_floor_returns_400(self):
+        resp = self.mod.update_floor_status(self._event(floor="-1"), None)
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_missing_statuses_returns_400(self):
+        resp = self.mod.update_floor_status(
+            self._event(body=json.dumps({"status": "AVAILABLE"})), None
+        )
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_non_object_body_returns_400(self):
+        for body in ("[]", '"AVAILABLE"', "null"):
+            with self.subTest(body=body):
+                resp = self.mod.update_floor_status(self._event(body=body), None)
+                self.assertEqual(400, resp["statusCode"])
+                self.assertEqual("Invalid JSON body", json.loads(resp["body"])["message"])
+        self.mock_update.assert_not_called()
+
+    def test_invalid_status_returns_400(self):
+        resp = self.mod.update_floor_status(
+            self._event(body=json.dumps({"from_status": "DIRTY", "status": "AVAILABLE"})), None
+        )
+        self.assertEqual(400, resp["statusCode"])
+
+    def test_unknown_floor_returns_404(self):
+        self.mock_update.side_effect = NotFoundException("floor", "3", 404)
+        resp = self.mod.update_floor_status(self._event(), None)
+        self.assertEqual(404, resp["statusCode"])
+
+    def test_client_error_returns_500(self):
+        self.mock_update.side_effect = ClientError({"Error": {"Code": "X"}}, "UpdateItem")
+        resp = self.mod.update_floor_status(self._event(), None)
+        self.assertEqual(500, resp["statusCode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
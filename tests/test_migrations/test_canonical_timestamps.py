@@ -0,0 +1,97 @@
+import unittest
+from unittest.mock import MagicMock
+from decimal import Decimal
+
+from migrations.canonical_timestamps import (
+    backfill_canonical_timestamps,
+    canonical_item,
+)
+
+
+LEGACY = "2026-03-01T00:00:00+00:00"
+CANONICAL = "2026-03-01T00:00:00.000000Z"
+
+
+class TestCanonicalTimestamps(unittest.TestCase):
+    def setUp(self):
+        self.table = MagicMock()
+        self.table.name = "test-table"
+        self.client = MagicMock()
+
+    def test_booking_details_attributes_re_encoded(self):
+        item = {
+            "pk": "BOOKING#b1",
+            "sk": "DETAILS",
+            "check_in": LEGACY,
+            "check_out": "2026-03-02T05:30:00+05:30",
+            "booked_at": LEGACY,
+            "price_per_night": Decimal("1500"),
+        }
+
+        new_item = canonical_item(item)
+
+        self.assertEqual(CANONICAL, new_item["check_in"])
+        self.assertEqual("2026-03-02T00:00:00.000000Z", new_item["check_out"])
+        self.assertEqual("DETAILS", new_item["sk"])
+        self.assertEqual(Decimal("1500"), new_item["price_per_night"])
+
+    def test_sort_keys_re_encoded(self):
+        cases = [
+            ("USER#u1", f"BOOKING#{LEGACY}#b1", f"BOOKING#{CANONICAL}#b1"),
+            ("ROOM#r1", f"CHECKIN#{LEGACY}", f"CHECKIN#{CANONICAL}"),
+            ("CATEGORY#DELUXE", f"CHECKIN#{LEGACY}#ROOM#r1", f"CHECKIN#{CANONICAL}#ROOM#r1"),
+        ]
+        for pk, sk, expected in cases:
+            with self.subTest(pk=pk):
+                self.assertEqual(expected, canonical_item({"pk": pk, "sk": sk})["sk"])
+
+    def test_canonical_and_untimed_items_skipped(self):
+        self.assertIsNone(canonical_item(
+            {"pk": "ROOM#r1", "sk": f"CHECKIN#{CANONICAL}", "checkout_date": CANONICAL}
+        ))
+        self.assertIsNone(canonical_item({"pk": "ROOM#r1", "sk": "DETAILS"}))
+        self.assertIsNone(canonical_item({"pk": "CATEGORY#DELUXE", "sk": "ROOM#r1"}))
+
+    def test_moved_keys_use_put_and_delete(self):
+        self.table.scan.return_value = {
+            "Items": [{"pk": "ROOM#r1", "sk": f"CHECKIN#{LEGACY}", "checkout_date": LEGACY}]
+        }
+
+        count = backfill_canonical_timestamps(self.table, self.client)
+
+        self.assertEqual(1, count)
+        _, kwargs = self.client.transact_write_items.call_args
+        put, delete = kwargs["TransactItems"]
+        self.assertEqual(f"CHECKIN#{CANONICAL}", put["Put"]["Item"]["sk"])
+        self.assertEqual(CANONICAL, put["Put"]["Item"]["checkout_date"])
+        self.assertEqual({"pk": "ROOM#r1", "sk": f"CHECKIN#{LEGACY}"}, delete["Delete"]["Key"])
+        self.table.put_item.assert_not_called()
+
+    def test_attribute_only_changes_put_in_place(self):
+        self.table.scan.side_effect = [
+            {"Items": [{"pk": "BOOKING#b1", "sk": "DETAILS", "check_in": LEGACY}],
+             "LastEvaluatedKey": {"pk": "x"}},
+            {"Items": []},
+        ]
+
+        count = backfill_canonical_timestamps(self.table, self.client)
+
+        self.assertEqual(1, count)
+        _, kwargs = self.table.put_item.call_args
+        self.assertEqual(CANONICAL, kwargs["Item"]["check_in"])
+        self.client.transact_write_items.assert_not_called()
+
+    def test_dry_run_writes_nothing(self):
+        self.table.scan.return_value = {
+            "Items": [{"pk": "BOOKING#b1", "sk": "DETAILS", "check_in": LEGACY}]
+        }
+
+        count = backfill_canonical_timestamps(self.table, self.client, dry_run=True)
+
+        self.assertEqual(1, count)
+        self.table.put_item.assert_not_called()
+        self.client.transact_write_items.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import MagicMock
+
+from migrations.checkout_index import backfill_checkout_index, checkout_index_item
+
+
+class TestBackfillCheckoutIndex(unittest.TestCase):
+    def setUp(self):
+        self.item = {
+            "pk": "CATEGORY#DELUXE",
+            "sk": "CHECKIN#2026-03-01T14:00:00+00:00#ROOM#r1",
+            "room_id": "r1",
+            "checkout": "2026-03-03T11:00:00.000000Z",
+            "booking_id": "b1",
+            "ttl_attribute": 1772535600,
+        }
+        self.table = MagicMock()
+        self.table.scan.return_value = {"Items": [self.item]}
+
+    def test_checkout_index_item(self):
+        self.assertEqual(
+            {
+                "pk": "CATEGORY#DELUXE",
+                "sk": "CHECKOUT#2026-03-03T11:00:00.000000Z#ROOM#r1",
+                "room_id": "r1",
+                "checkin": "2026-03-01T14:00:00.000000Z",
+                "booking_id": "b1",
+                "ttl_attribute": 1772535600,
+            },
+            checkout_index_item(self.item),
+        )
+
+    def test_hold_item_keeps_the_hold_and_has_no_booking(self):
+        hold = {**self.item, "hold_id": "h1", "hold_expires_at": 1772374200}
+        del hold["booking_id"]
+
+        index_item = checkout_index_item(hold)
+
+        self.assertNotIn("booking_id", index_item)
+        self.assertEqual(("h1", 1772374200), (index_item["hold_id"], index_item["hold_expires_at"]))
+
+    def test_writes_index_items(self):
+        self.assertEqual(1, backfill_checkout_index(self.table))
+        self.table.put_item.assert_called_once_with(Item=checkout_index_item(self.item))
+
+    def test_dry_run_writes_nothing(self):
+        self.assertEqual(1, backfill_checkout_index(self.table, dry_run=True))
+        self.table.put_item.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
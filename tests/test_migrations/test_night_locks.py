@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import MagicMock
+
+from migrations.night_locks import backfill_night_locks, night_lock_items
+
+
+class TestBackfillNightLocks(unittest.TestCase):
+    def setUp(self):
+        self.item = {
+            "pk": "CATEGORY#DELUXE",
+            "sk": "CHECKIN#2026-03-01T14:00:00.000000Z#ROOM#r1",
+            "room_id": "r1",
+            "checkout": "2026-03-03T11:00:00.000000Z",
+            "booking_id": "b1",
+            "ttl_attribute": 1772535600,
+        }
+        self.table = MagicMock()
+        self.table.scan.return_value = {"Items": [self.item]}
+
+    def test_night_lock_items(self):
+        self.assertEqual(
+            [
+                {"pk": "ROOM#r1", "sk": "NIGHT#2026-03-01", "booking_id": "b1", "ttl_attribute": 1772535600},
+                {"pk": "ROOM#r1", "sk": "NIGHT#2026-03-02", "booking_id": "b1", "ttl_attribute": 1772535600},
+            ],
+            night_lock_items(self.item),
+        )
+
+    def test_hold_locks_keep_the_expiry(self):
+        hold = {**self.item, "hold_id": "h1", "hold_expires_at": 1772374200}
+        del hold["booking_id"]
+
+        lock = night_lock_items(hold)[0]
+
+        self.assertNotIn("booking_id", lock)
+        self.assertEqual(("h1", 1772374200), (lock["hold_id"], lock["hold_expires_at"]))
+
+    def test_writes_locks(self):
+        self.assertEqual(2, backfill_night_locks(self.table))
+        self.assertEqual(2, self.table.put_item.call_count)
+
+    def test_dry_run_writes_nothing(self):
+        self.assertEqual(2, backfill_night_locks(self.table, dry_run=True))
+        self.table.put_item.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from common.repository.outbox_repo import OutboxRepository
+from migrations.outbox_shards import move_outbox_entries
+
+
+class TestMoveOutboxEntries(unittest.TestCase):
+    def setUp(self):
+        self.entry = {
+            **OutboxRepository.cancel_checkout_item("b1"),
+            "pk": "OUTBOX",
+        }
+        self.table = MagicMock()
+        self.table.query.return_value = {"Items": [self.entry]}
+
+    def test_moves_entry_to_its_shard(self):
+        self.assertEqual(1, move_outbox_entries(self.table))
+
+        item = self.table.put_item.call_args.kwargs["Item"]
+        self.assertEqual(OutboxRepository.shard_pk("b1"), item["pk"])
+        self.table.delete_item.assert_called_once_with(Key={"pk": "OUTBOX", "sk": "BOOKING#b1"})
+
+    def test_newer_shard_entry_is_kept(self):
+        self.table.put_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "PutItem"
+        )
+
+        self.assertEqual(1, move_outbox_entries(self.table))
+        self.table.delete_item.assert_called_once()
+
+    def test_dry_run_writes_nothing(self):
+        self.assertEqual(1, move_outbox_entries(self.table, dry_run=True))
+        self.table.put_item.assert_not_called()
+        self.table.delete_item.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from migrations.room_status_index import backfill_room_status_index
+
+
+class TestBackfillRoomStatusIndex(unittest.TestCase):
+    def setUp(self):
+        self.table = MagicMock()
+        self.table.scan.return_value = {
+            "Items": [
+                {"pk": "ROOM#r1", "category": "DELUXE", "room_status": "MAINTENANCE"},
+                {"pk": "ROOM#r2", "category": "SUITE", "room_status": "AVAILABLE"},
+            ]
+        }
+
+    def test_copies_status_to_index_items(self):
+        count = backfill_room_status_index(self.table)
+
+        self.assertEqual(2, count)
+        first = self.table.update_item.call_args_list[0].kwargs
+        self.assertEqual({"pk": "CATEGORY#DELUXE", "sk": "ROOM#r1"}, first["Key"])
+        self.assertEqual({":value": "MAINTENANCE"}, first["ExpressionAttributeValues"])
+
+    def test_missing_index_item_skipped(self):
+        self.table.update_item.side_effect = [
+            ClientError({"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"),
+            {},
+        ]
+
+        self.assertEqual(1, backfill_room_status_index(self.table))
+
+    def test_dry_run_writes_nothing(self):
+        self.assertEqual(2, backfill_room_status_index(self.table, dry_run=True))
+        self.table.update_item.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import MagicMock
+from decimal import Decimal
+
+from migrations.user_booking_keys import migrate_user_booking_keys
+
+
+class TestMigrateUserBookingKeys(unittest.TestCase):
+    def setUp(self):
+        self.table = MagicMock()
+        self.table.name = "test-table"
+        self.client = MagicMock()
+
+    def _item(self, sk):
+        return {
+            "pk": "USER#u1",
+            "sk": sk,
+            "check_in": "2026-03-01T00:00:00+00:00",
+            "check_out": "2026-03-02T00:00:00+00:00",
+            "price_per_night": Decimal("1500"),
+        }
+
+    def test_rewrites_legacy_items(self):
+        self.table.scan.return_value = {"Items": [self._item("BOOKING#b1")]}
+
+        count = migrate_user_booking_keys(self.table, self.client)
+
+        self.assertEqual(1, count)
+        _, kwargs = self.client.transact_write_items.call_args
+        put, delete = kwargs["TransactItems"]
+        self.assertEqual(
+            "BOOKING#2026-03-01T00:00:00.000000Z#b1", put["Put"]["Item"]["sk"]
+        )
+        self.assertEqual("b1", put["Put"]["Item"]["booking_id"])
+        self.assertEqual(Decimal("1500"), put["Put"]["Item"]["price_per_night"])
+        self.assertEqual({"pk": "USER#u1", "sk": "BOOKING#b1"}, delete["Delete"]["Key"])
+
+    def test_skips_already_migrated_items(self):
+        self.table.scan.return_value = {
+            "Items": [self._item("BOOKING#2026-03-01T00:00:00+00:00#b1")]
+        }
+
+        count = migrate_user_booking_keys(self.table, self.client)
+
+        self.assertEqual(0, count)
+        self.client.transact_write_items.assert_not_called()
+
+    def test_follows_scan_pages(self):
+        self.table.scan.side_effect = [
+            {"Items": [self._item("BOOKING#b1")], "LastEvaluatedKey": {"pk": "x"}},
+            {"Items": [self._item("BOOKING#b2")]},
+        ]
+
+        count = migrate_user_booking_keys(self.table, self.client)
+
+        self.assertEqual(2, count)
+        _, kwargs = self.table.scan.call_args
+        self.assertEqual({"pk": "x"}, kwargs["ExclusiveStartKey"])
+
+    def test_dry_run_writes_nothing(self):
+        self.table.scan.return_value = {"Items": [self._item("BOOKING#b1")]}
+
+        count = migrate_user_booking_keys(self.table, self.client, dry_run=True)
+
+        self.assertEqual(1, count)
+        self.client.transact_write_items.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,8 +5,11 @@ from decimal import Decimal
 from botocore.exceptions import ClientError
 
 from common.repository.booking_repo import BookingRepository
-from common.models.bookings import Booking, BookingStatus
+from common.repository.decoders import decode_booking
+from common.repository.outbox_repo import OutboxRepository
+from common.models.bookings import Booking, BookingStatus, Hold
 from common.models.rooms import Category, RoomStatus
+from common.utils.custom_exceptions import InvalidCursor, RoomTaken
 
 
 class TestBookingRepository(unittest.TestCase):
@@ -61,12 +64,14 @@ class TestBookingRepository(unittest.TestCase):
         _, kwargs = self.client.transact_write_items.call_args
 
         items = kwargs["TransactItems"]
-        self.assertEqual(len(items), 4)
+        self.assertEqual(len(items), 7)
 
         booking_put = items[0]["Put"]["Item"]
         user_put = items[1]["Put"]["Item"]
         room_put = items[2]["Put"]["Item"]
         avail_put = items[3]["Put"]["Item"]
+        checkout_put = items[4]["Put"]["Item"]
+        outbox_put = items[5]["Put"]["Item"]
 
         self.assertEqual(booking_put["pk"], "BOOKING#b1")
         self.assertEqual(booking_put["sk"], "DETAILS")
@@ -79,7 +84,11 @@ class TestBookingRepository(unittest.TestCase):
         )
 
         self.assertEqual(user_put["pk"], "USER#u1")
-        self.assertEqual(user_put["sk"], "BOOKING#b1")
+        self.assertEqual(
+            user_put["sk"],
+            f"BOOKING#{BookingRepository._iso(self.booking.checkin)}#b1"
+        )
+        self.assertEqual(user_put["booking_id"], "b1")
 
         self.assertEqual(room_put["pk"], "ROOM#r1")
         self.assertTrue(room_put["sk"].startswith("CHECKIN#"))
@@ -89,8 +98,313 @@ class TestBookingRepository(unittest.TestCase):
         self.assertEqual(avail_put["room_id"], self.booking.room_id)
         self.assertEqual(avail_put["booking_id"], self.booking.booking_id)
         self.assertIn("ttl_attribute", avail_put)
+
+        self.assertEqual(checkout_put["pk"], avail_put["pk"])
+        self.assertEqual(
+            checkout_put["sk"],
+            f"CHECKOUT#{BookingRepository._iso(self.booking.checkout)}#ROOM#r1",
+        )
+        self.assertEqual(
+            checkout_put["checkin"], BookingRepository._iso(self.booking.checkin)
+        )
+
+        self.assertEqual(outbox_put["pk"], OutboxRepository.shard_pk("b1"))
+        self.assertEqual(outbox_put["sk"], "BOOKING#b1")
+        self.assertEqual(outbox_put["action"], "SCHEDULE_CHECKOUT")
+        self.assertEqual(
+            outbox_put["checkout"], BookingRepository._iso(self.booking.checkout)
+        )
         self.assertEqual(avail_put["ttl_attribute"], int(self.booking.checkout.timestamp()))
 
+    def _hold(self, expires_in=timedelta(minutes=10)):
+        return Hold(
+            hold_id="h1",
+            user_id="u1",
+            room_id="r1",
+            category=Category.DELUXE,
+            checkin=self.booking.checkin,
+            checkout=self.booking.checkout,
+            price_per_night=1500.0,
+            expires_at=datetime.now(timezone.utc) + expires_in,
+        )
+
+    def test_add_booking_may_take_a_slot_from_an_expired_hold(self):
+        self.repo.add_booking(self.booking)
+
+        avail = self.client.transact_write_items.call_args.kwargs["TransactItems"][3]["Put"]
+        self.assertEqual(
+            "attribute_not_exists(sk) OR hold_expires_at < :now",
+            avail["ConditionExpression"],
+        )
+
+    def test_add_hold_writes_expiring_availability_items(self):
+        hold = self._hold()
+
+        self.assertTrue(self.repo.add_hold(hold))
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(
+            ["HOLD#h1", "ROOM#r1", "CATEGORY#DELUXE", "CATEGORY#DELUXE", "ROOM#r1"],
+            [item["Put"]["Item"]["pk"] for item in items],
+        )
+        expires_at = int(hold.expires_at.timestamp())
+        for item in items[1:]:
+            self.assertEqual("h1", item["Put"]["Item"]["hold_id"])
+            self.assertEqual(expires_at, item["Put"]["Item"]["hold_expires_at"])
+            self.assertEqual(expires_at, item["Put"]["Item"]["ttl_attribute"])
+        self.assertTrue(items[2]["Put"]["Item"]["sk"].startswith("CHECKIN#"))
+        self.assertTrue(items[3]["Put"]["Item"]["sk"].startswith("CHECKOUT#"))
+        self.assertTrue(items[4]["Put"]["Item"]["sk"].startswith("NIGHT#"))
+
+    def test_add_hold_slot_taken(self):
+        self.client.transact_write_items.side_effect = ClientError(
+            {
+                "Error": {"Code": "TransactionCanceledException"},
+                "CancellationReasons": [
+                    {"Code": "None"}, {"Code": "None"}, {"Code": "ConditionalCheckFailed"}, {"Code": "None"}
+                ],
+            },
+            "TransactWriteItems",
+        )
+
+        self.assertFalse(self.repo.add_hold(self._hold()))
+
+    def test_get_hold(self):
+        self.table.get_item.return_value = {
+            "Item": {
+                "pk": "HOLD#h1",
+                "sk": "DETAILS",
+                "user_id": "u1",
+                "room_id": "r1",
+                "category": "DELUXE",
+                "check_in": "2026-03-01T14:00:00.000000Z",
+                "check_out": "2026-03-03T11:00:00.000000Z",
+                "price_per_night": Decimal("1500"),
+                "expires_at": Decimal("1772374200"),
+            }
+        }
+
+        hold = self.repo.get_hold("h1")
+
+        self.assertEqual("h1", hold.hold_id)
+        self.assertEqual(datetime(2026, 3, 1, 14, 10, tzinfo=timezone.utc), hold.expires_at)
+
+    def test_convert_hold_replaces_hold_with_booking(self):
+        self.assertTrue(self.repo.convert_hold(self._hold(), self.booking))
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(8, len(items))
+        avail = items[3]["Put"]
+        self.assertEqual("b1", avail["Item"]["booking_id"])
+        self.assertNotIn("hold_id", avail["Item"])
+        self.assertEqual(
+            "hold_id = :hold_id AND hold_expires_at >= :now", avail["ConditionExpression"]
+        )
+        self.assertEqual("h1", avail["ExpressionAttributeValues"][":hold_id"])
+        night = items[6]["Put"]
+        self.assertEqual(("ROOM#r1", "b1"), (night["Item"]["pk"], night["Item"]["booking_id"]))
+        self.assertEqual(avail["ConditionExpression"], night["ConditionExpression"])
+        self.assertEqual({"pk": "HOLD#h1", "sk": "DETAILS"}, items[7]["Delete"]["Key"])
+        self.assertEqual(
+            "u1", items[7]["Delete"]["ExpressionAttributeValues"][":user_id"]
+        )
+
+    def test_convert_hold_expired(self):
+        self.client.transact_write_items.side_effect = ClientError(
+            {
+                "Error": {"Code": "TransactionCanceledException"},
+                "CancellationReasons": [{"Code": "None"}] * 3
+                + [{"Code": "ConditionalCheckFailed"}]
+                + [{"Code": "None"}] * 3,
+            },
+            "TransactWriteItems",
+        )
+
+        self.assertFalse(self.repo.convert_hold(self._hold(), self.booking))
+
+    def test_cancel_booking_frees_the_room_in_one_transaction(self):
+        self.assertTrue(self.repo.cancel_booking(self.booking))
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        checkin_iso = BookingRepository._iso(self.booking.checkin)
+        checkout_iso = BookingRepository._iso(self.booking.checkout)
+        self.assertEqual(
+            [
+                ("Update", "BOOKING#b1", "DETAILS"),
+                ("Update", "USER#u1", f"BOOKING#{checkin_iso}#b1"),
+                ("Delete", "ROOM#r1", f"CHECKIN#{checkin_iso}"),
+                ("Delete", "CATEGORY#DELUXE", f"CHECKIN#{checkin_iso}#ROOM#r1"),
+                ("Delete", "CATEGORY#DELUXE", f"CHECKOUT#{checkout_iso}#ROOM#r1"),
+            ],
+            [
+                (op, body["Key"]["pk"], body["Key"]["sk"])
+                for item in items[:5]
+                for op, body in item.items()
+            ],
+        )
+        self.assertEqual(
+            "CANCELLED", items[0]["Update"]["ExpressionAttributeValues"][":new_value"]
+        )
+        self.assertEqual(
+            {"pk": OutboxRepository.shard_pk("b1"), "sk": "BOOKING#b1"},
+            {k: items[5]["Put"]["Item"][k] for k in ("pk", "sk")},
+        )
+        self.assertEqual("CANCEL_CHECKOUT", items[5]["Put"]["Item"]["action"])
+
+    def test_cancel_booking_only_before_checkin(self):
+        self.repo.cancel_booking(self.booking)
+
+        details = self.client.transact_write_items.call_args.kwargs["TransactItems"][0]["Update"]
+        self.assertIn("check_in > :now", details["ConditionExpression"])
+        self.assertLess(
+            details["ExpressionAttributeValues"][":now"],
+            BookingRepository._iso(self.booking.checkin),
+        )
+
+    def test_cancel_booking_releases_the_nights(self):
+        self.repo.cancel_booking(self.booking)
+
+        night = self.client.transact_write_items.call_args.kwargs["TransactItems"][6]["Delete"]
+        self.assertEqual("ROOM#r1", night["Key"]["pk"])
+        self.assertTrue(night["Key"]["sk"].startswith("NIGHT#"))
+        self.assertEqual({":booking_id": "b1"}, night["ExpressionAttributeValues"])
+
+    def test_cancel_booking_no_longer_upcoming(self):
+        self.client.transact_write_items.side_effect = ClientError(
+            {
+                "Error": {"Code": "TransactionCanceledException"},
+                "CancellationReasons": [{"Code": "ConditionalCheckFailed"}]
+                + [{"Code": "None"}] * 5,
+            },
+            "TransactWriteItems",
+        )
+
+        self.assertFalse(self.repo.cancel_booking(self.booking))
+
+    def test_extend_booking_moves_checkout_everywhere(self):
+        new_checkout = self.booking.checkout + timedelta(days=2)
+
+        self.assertTrue(self.repo.extend_booking(self.booking, new_checkout))
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        new_iso = BookingRepository._iso(new_checkout)
+        old_iso = BookingRepository._iso(self.booking.checkout)
+        self.assertEqual(
+            old_iso, items[0]["Update"]["ExpressionAttributeValues"][":old_checkout"]
+        )
+        for item in items[:4]:
+            self.assertIn(new_iso, item["Update"]["ExpressionAttributeValues"].values())
+        self.assertEqual(
+            int(new_checkout.timestamp()),
+            items[3]["Update"]["ExpressionAttributeValues"][":ttl"],
+        )
+        self.assertEqual(f"CHECKOUT#{old_iso}#ROOM#r1", items[4]["Delete"]["Key"]["sk"])
+        self.assertEqual(f"CHECKOUT#{new_iso}#ROOM#r1", items[5]["Put"]["Item"]["sk"])
+        outbox = items[6]["Put"]["Item"]
+        self.assertEqual(("SCHEDULE_CHECKOUT", new_iso), (outbox["action"], outbox["checkout"]))
+
+    def test_extend_booking_changed_meanwhile(self):
+        self.client.transact_write_items.side_effect = ClientError(
+            {
+                "Error": {"Code": "TransactionCanceledException"},
+                "CancellationReasons": [{"Code": "ConditionalCheckFailed"}]
+                + [{"Code": "None"}] * 6,
+            },
+            "TransactWriteItems",
+        )
+
+        self.assertFalse(
+            self.repo.extend_booking(self.booking, self.booking.checkout + timedelta(days=1))
+        )
+
+    def test_shorten_booking_cancels_the_schedule(self):
+        new_checkout = self.booking.checkout - timedelta(days=1)
+
+        self.assertTrue(self.repo.shorten_booking(self.booking, new_checkout))
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        new_iso = BookingRepository._iso(new_checkout)
+        self.assertEqual(11, len(items))
+        self.assertEqual(new_iso, items[0]["Update"]["ExpressionAttributeValues"][":new_checkout"])
+        self.assertEqual(f"CHECKOUT#{new_iso}#ROOM#r1", items[5]["Put"]["Item"]["sk"])
+        self.assertEqual("CANCEL_CHECKOUT", items[6]["Put"]["Item"]["action"])
+
+    def test_shorten_booking_checks_out_in_the_same_transaction(self):
+        self.repo.shorten_booking(self.booking, self.booking.checkout - timedelta(days=1))
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        for booking_item in items[:2]:
+            update = booking_item["Update"]
+            self.assertIn("booking_status = :status", update["UpdateExpression"])
+            self.assertEqual("CHECKED_OUT", update["ExpressionAttributeValues"][":status"])
+        room_update = items[7]["Update"]
+        self.assertEqual({"pk": "ROOM#r1", "sk": "DETAILS"}, room_update["Key"])
+        self.assertEqual(
+            RoomStatus.HOUSEKEEPING.value,
+            room_update["ExpressionAttributeValues"][":new_value"],
+        )
+        self.assertEqual({"pk": "CATEGORY#DELUXE", "sk": "ROOM#r1"}, items[8]["Update"]["Key"])
+        self.assertTrue(items[9]["Put"]["Item"]["pk"].startswith("HK#"))
+
+    def test_extend_booking_locks_the_added_nights(self):
+        self.booking.checkin = datetime(2026, 3, 1, 14, tzinfo=timezone.utc)
+        self.booking.checkout = datetime(2026, 3, 3, 11, tzinfo=timezone.utc)
+
+        self.repo.extend_booking(self.booking, datetime(2026, 3, 5, 11, tzinfo=timezone.utc))
+
+        nights = self.client.transact_write_items.call_args.kwargs["TransactItems"][7:]
+        self.assertEqual(
+            ["NIGHT#2026-03-03", "NIGHT#2026-03-04"],
+            [night["Put"]["Item"]["sk"] for night in nights],
+        )
+
+    def test_shorten_booking_releases_the_remaining_nights(self):
+        self.booking.checkin = datetime(2026, 3, 1, 14, tzinfo=timezone.utc)
+        self.booking.checkout = datetime(2026, 3, 5, 11, tzinfo=timezone.utc)
+
+        self.repo.shorten_booking(self.booking, datetime(2026, 3, 2, 9, tzinfo=timezone.utc))
+
+        nights = self.client.transact_write_items.call_args.kwargs["TransactItems"][10:]
+        self.assertEqual(
+            ["NIGHT#2026-03-02", "NIGHT#2026-03-03", "NIGHT#2026-03-04"],
+            [night["Delete"]["Key"]["sk"] for night in nights],
+        )
+
+    def test_extend_booking_leaves_status_and_room_alone(self):
+        self.repo.extend_booking(self.booking, self.booking.checkout + timedelta(days=1))
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(8, len(items))
+        self.assertNotIn(":status", items[0]["Update"]["ExpressionAttributeValues"])
+
+    def test_add_booking_locks_each_night_of_the_room(self):
+        self.booking.checkin = datetime(2026, 3, 1, 14, tzinfo=timezone.utc)
+        self.booking.checkout = datetime(2026, 3, 4, 11, tzinfo=timezone.utc)
+
+        self.repo.add_booking(self.booking)
+
+        nights = self.client.transact_write_items.call_args.kwargs["TransactItems"][6:]
+        self.assertEqual(
+            ["NIGHT#2026-03-01", "NIGHT#2026-03-02", "NIGHT#2026-03-03"],
+            [night["Put"]["Item"]["sk"] for night in nights],
+        )
+        for night in nights:
+            put = night["Put"]
+            self.assertEqual(("ROOM#r1", "b1"), (put["Item"]["pk"], put["Item"]["booking_id"]))
+            self.assertEqual(int(self.booking.checkout.timestamp()), put["Item"]["ttl_attribute"])
+            self.assertEqual(
+                "attribute_not_exists(sk) OR hold_expires_at < :now", put["ConditionExpression"]
+            )
+
+    def test_add_booking_overlapping_stay_is_room_taken(self):
+        # an overlapping stay with another check-in time only collides on a night
+        self.client.transact_write_items.side_effect = self._cancelled(
+            ["None"] * 6 + ["ConditionalCheckFailed"]
+        )
+
+        with self.assertRaises(RoomTaken):
+            self.repo.add_booking(self.booking)
+
     def test_add_booking_client_error(self):
         self.client.transact_write_items.side_effect = ClientError(
             error_response={"Error": {"Message": "Write failed"}},
@@ -100,6 +414,66 @@ class TestBookingRepository(unittest.TestCase):
         with self.assertRaises(ClientError):
             self.repo.add_booking(self.booking)
 
+    def _cancelled(self, reasons):
+        return ClientError(
+            {
+                "Error": {"Code": "TransactionCanceledException"},
+                "CancellationReasons": [{"Code": code} for code in reasons],
+            },
+            "TransactWriteItems",
+        )
+
+    def test_add_booking_records_idempotency_key_in_the_transaction(self):
+        self.assertTrue(self.repo.add_booking(self.booking, "key-1", "hash-1"))
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(8, len(items))
+        record = items[7]["Put"]["Item"]
+        self.assertEqual(("IDEMPOTENCY#key-1", "USER#u1"), (record["pk"], record["sk"]))
+        self.assertEqual(("b1", "hash-1"), (record["booking_id"], record["request_hash"]))
+        self.assertIn("attribute_not_exists(pk)", items[7]["Put"]["ConditionExpression"])
+
+    def test_add_booking_key_already_used(self):
+        self.client.transact_write_items.side_effect = self._cancelled(
+            ["None"] * 7 + ["ConditionalCheckFailed"]
+        )
+
+        self.assertFalse(self.repo.add_booking(self.booking, "key-1", "hash-1"))
+
+    def test_add_booking_slot_taken_with_key_is_room_taken(self):
+        self.client.transact_write_items.side_effect = self._cancelled(
+            ["None"] * 3 + ["ConditionalCheckFailed"] + ["None"] * 3
+        )
+
+        with self.assertRaises(RoomTaken):
+            self.repo.add_booking(self.booking, "key-1", "hash-1")
+
+    def test_add_booking_concurrent_writer_is_room_taken(self):
+        self.client.transact_write_items.side_effect = self._cancelled(
+            ["None"] * 3 + ["TransactionConflict"] + ["None"] * 2
+        )
+
+        with self.assertRaises(RoomTaken):
+            self.repo.add_booking(self.booking)
+
+    def test_get_idempotency_record(self):
+        live = int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp())
+        self.table.get_item.return_value = {
+            "Item": {"booking_id": "b1", "request_hash": "h", "ttl_attribute": live}
+        }
+
+        self.assertEqual("b1", self.repo.get_idempotency_record("u1", "key-1")["booking_id"])
+        self.table.get_item.assert_called_once_with(
+            Key={"pk": "IDEMPOTENCY#key-1", "sk": "USER#u1"}
+        )
+
+    def test_get_idempotency_record_expired(self):
+        self.table.get_item.return_value = {
+            "Item": {"booking_id": "b1", "request_hash": "h", "ttl_attribute": 1}
+        }
+
+        self.assertIsNone(self.repo.get_idempotency_record("u1", "key-1"))
+
     def test_get_user_bookings_success(self):
         now = datetime.now(timezone.utc)
 
@@ -148,6 +522,77 @@ class TestBookingRepository(unittest.TestCase):
         with self.assertRaises(ClientError):
             self.repo.get_user_bookings("u1")
 
+    def _user_booking_item(self, booking_id):
+        now = datetime.now(timezone.utc)
+        return {
+            "pk": "USER#u1",
+            "sk": f"BOOKING#{now.isoformat()}#{booking_id}",
+            "room_id": "r1",
+            "category": "DELUXE",
+            "booking_status": "UPCOMING",
+            "check_in": now.isoformat(),
+            "check_out": (now + timedelta(days=1)).isoformat(),
+            "price_per_night": Decimal("1500.0"),
+            "booked_at": now.isoformat(),
+            "user_email": "test@example.com"
+        }
+
+    def test_get_user_bookings_follows_last_evaluated_key(self):
+        self.table.query.side_effect = [
+            {
+                "Items": [self._user_booking_item("b1")],
+                "LastEvaluatedKey": {"pk": "USER#u1", "sk": "BOOKING#b1"},
+            },
+            {"Items": [self._user_booking_item("b2")]},
+        ]
+
+        bookings = self.repo.get_user_bookings("u1")
+
+        self.assertEqual(["b1", "b2"], [b.booking_id for b in bookings])
+        self.assertEqual(2, self.table.query.call_count)
+        _, kwargs = self.table.query.call_args
+        self.assertEqual(
+            {"pk": "USER#u1", "sk": "BOOKING#b1"}, kwargs["ExclusiveStartKey"]
+        )
+
+    def test_iter_user_bookings_is_lazy(self):
+        self.table.query.side_effect = [
+            {
+                "Items": [self._user_booking_item("b1")],
+                "LastEvaluatedKey": {"pk": "USER#u1", "sk": "BOOKING#b1"},
+            },
+            {"Items": [self._user_booking_item("b2")]},
+        ]
+
+        bookings = self.repo.iter_user_bookings("u1")
+
+        self.assertEqual("b1", next(bookings).booking_id)
+        self.assertEqual(1, self.table.query.call_count)
+
+    def test_get_user_bookings_page_passes_limit_and_start_key(self):
+        start_key = {"pk": "USER#u1", "sk": "BOOKING#b0"}
+        self.table.query.return_value = {
+            "Items": [self._user_booking_item("b1")],
+            "LastEvaluatedKey": {"pk": "USER#u1", "sk": "BOOKING#b1"},
+        }
+
+        bookings, last_key = self.repo.get_user_bookings_page(
+            "u1", limit=1, exclusive_start_key=start_key
+        )
+
+        _, kwargs = self.table.query.call_args
+        self.assertEqual(1, kwargs["Limit"])
+        self.assertEqual(start_key, kwargs["ExclusiveStartKey"])
+        self.assertEqual(1, len(bookings))
+        self.assertEqual({"pk": "USER#u1", "sk": "BOOKING#b1"}, last_key)
+
+    def test_get_user_bookings_page_rejects_foreign_start_key(self):
+        with self.assertRaises(InvalidCursor):
+            self.repo.get_user_bookings_page(
+                "u1", limit=1, exclusive_start_key={"pk": "USER#u2", "sk": "BOOKING#b1"}
+            )
+        self.table.query.assert_not_called()
+
     def test_get_booking_by_id_success(self):
         now = datetime.now(timezone.utc)
 
@@ -216,6 +661,54 @@ class TestBookingRepository(unittest.TestCase):
             RoomStatus.HOUSEKEEPING.value
         )
 
+    def test_checkout_writes_housekeeping_queue_item(self):
+        self.repo.update_booking_status(
+            booking_id="b1",
+            user_id="u1",
+            room_id="r1",
+            status=BookingStatus.CHECKED_OUT,
+            checkin=datetime(2026, 3, 1, tzinfo=timezone.utc),
+            category=Category.DELUXE,
+        )
+
+        _, kwargs = self.client.transact_write_items.call_args
+        items = kwargs["TransactItems"]
+        self.assertEqual(5, len(items))
+        queue_item = items[4]["Put"]["Item"]
+        checked_out_at = queue_item["checked_out_at"]
+        self.assertEqual(f"HK#{checked_out_at[:10]}", queue_item["pk"])
+        self.assertEqual(f"{checked_out_at}#ROOM#r1", queue_item["sk"])
+        self.assertEqual("b1", queue_item["booking_id"])
+        values = items[0]["Update"]["ExpressionAttributeValues"]
+        self.assertEqual(queue_item["pk"], values[":hk_pk"])
+        self.assertEqual(queue_item["sk"], values[":hk_sk"])
+
+    def test_second_checkout_replaces_the_uncleaned_queue_item(self):
+        self.client.get_item.return_value = {
+            "Item": {"hk_pk": "HK#2026-03-01", "hk_sk": "2026-03-01T10:00:00.000000Z#ROOM#r1"}
+        }
+
+        self.repo.update_booking_status(
+            booking_id="b2",
+            user_id="u1",
+            room_id="r1",
+            status=BookingStatus.CHECKED_OUT,
+            checkin=datetime(2026, 3, 1, tzinfo=timezone.utc),
+            category=Category.DELUXE,
+        )
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(6, len(items))
+        self.assertEqual("b2", items[4]["Put"]["Item"]["booking_id"])
+        self.assertEqual(
+            {"pk": "HK#2026-03-01", "sk": "2026-03-01T10:00:00.000000Z#ROOM#r1"},
+            items[5]["Delete"]["Key"],
+        )
+        self.assertEqual(
+            {"pk": "ROOM#r1", "sk": "DETAILS"},
+            self.client.get_item.call_args.kwargs["Key"],
+        )
+
     def test_update_booking_status_other_sets_occupied(self):
         self.client.transact_write_items.return_value = {}
 
@@ -235,6 +728,136 @@ class TestBookingRepository(unittest.TestCase):
             RoomStatus.OCCUPIED.value
         )
 
+    def test_user_bookings_date_range_uses_key_condition(self):
+        self.table.query.return_value = {"Items": []}
+        checkin_from = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        checkin_to = datetime(2026, 3, 31, tzinfo=timezone.utc)
+
+        self.repo.get_user_bookings(
+            "u1", checkin_from=checkin_from, checkin_to=checkin_to
+        )
+
+        _, kwargs = self.table.query.call_args
+        sk_condition = kwargs["KeyConditionExpression"].get_expression()["values"][1]
+        self.assertEqual("BETWEEN", sk_condition.expression_operator)
+        _, lower, upper = sk_condition.get_expression()["values"]
+        self.assertEqual("BOOKING#2026-03-01T00:00:00.000000Z", lower)
+        self.assertEqual("BOOKING#2026-03-31T00:00:00.000000Z$", upper)
+        self.assertNotIn("FilterExpression", kwargs)
+
+    def test_user_bookings_open_ended_range(self):
+        self.table.query.return_value = {"Items": []}
+
+        self.repo.get_user_bookings(
+            "u1", checkin_from=datetime(2026, 3, 1, tzinfo=timezone.utc)
+        )
+
+        _, kwargs = self.table.query.call_args
+        sk_condition = kwargs["KeyConditionExpression"].get_expression()["values"][1]
+        _, lower, upper = sk_condition.get_expression()["values"]
+        self.assertEqual("BOOKING#2026-03-01T00:00:00.000000Z", lower)
+        self.assertEqual("BOOKING$", upper)
+
+    def test_user_bookings_status_filter(self):
+        self.table.query.return_value = {"Items": []}
+
+        self.repo.get_user_bookings("u1", status=BookingStatus.UPCOMING)
+
+        _, kwargs = self.table.query.call_args
+        self.assertIn("FilterExpression", kwargs)
+
+    def test_user_booking_id_parsed_from_dated_sort_key(self):
+        item = self._user_booking_item("b9")
+        booking = decode_booking(item, user_id="u1")
+        self.assertEqual("b9", booking.booking_id)
+
+    def test_update_booking_status_mirrors_room_status_on_category(self):
+        self.repo.update_booking_status(
+            booking_id="b1",
+            user_id="u1",
+            room_id="r1",
+            status=BookingStatus.CHECKED_IN,
+            checkin=datetime(2026, 3, 1, tzinfo=timezone.utc),
+            category=Category.DELUXE,
+        )
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        mirror = items[3]["Update"]
+        self.assertEqual({"pk": "CATEGORY#DELUXE", "sk": "ROOM#r1"}, mirror["Key"])
+        self.assertEqual(
+            RoomStatus.OCCUPIED.value, mirror["ExpressionAttributeValues"][":new_value"]
+        )
+
+    def test_update_booking_status_looks_up_checkin_for_user_item(self):
+        self.table.get_item.return_value = {
+            "Item": {"check_in": "2026-03-01T00:00:00+00:00", "category": "DELUXE"}
+        }
+
+        self.repo.update_booking_status(
+            booking_id="b1",
+            user_id="u1",
+            room_id="r1",
+            status=BookingStatus.CHECKED_OUT
+        )
+
+        _, kwargs = self.client.transact_write_items.call_args
+        user_update = kwargs["TransactItems"][2]["Update"]
+        self.assertEqual(
+            {"pk": "USER#u1", "sk": "BOOKING#2026-03-01T00:00:00+00:00#b1"},
+            user_update["Key"]
+        )
+
+    def test_update_booking_status_with_known_checkin_skips_lookup(self):
+        self.repo.update_booking_status(
+            booking_id="b1",
+            user_id="u1",
+            room_id="r1",
+            status=BookingStatus.CHECKED_OUT,
+            checkin=datetime(2026, 3, 1, tzinfo=timezone.utc),
+            category=Category.DELUXE,
+        )
+
+        self.table.get_item.assert_not_called()
+
+    def test_update_booking_status_missing_booking(self):
+        from common.utils.custom_exceptions import NotFoundException
+        self.table.get_item.return_value = {}
+
+        with self.assertRaises(NotFoundException):
+            self.repo.update_booking_status(
+                booking_id="b1",
+                user_id="u1",
+                room_id="r1",
+                status=BookingStatus.CHECKED_OUT
+            )
+        self.client.transact_write_items.assert_not_called()
+
+    def test_update_booking_status_skips_closed_booking(self):
+        self.client.transact_write_items.side_effect = self._cancelled(
+            ["None", "ConditionalCheckFailed", "None", "None", "None"]
+        )
+
+        result = self.repo.update_booking_status(
+            booking_id="b1",
+            user_id="u1",
+            room_id="r1",
+            status=BookingStatus.CHECKED_OUT,
+            checkin=datetime(2026, 3, 1, tzinfo=timezone.utc),
+            category=Category.DELUXE,
+        )
+
+        self.assertFalse(result)
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        details = items[1]["Update"]
+        self.assertIn(
+            "NOT #booking_status IN (:cancelled, :checked_out)",
+            details["ConditionExpression"],
+        )
+        self.assertEqual(
+            BookingStatus.CHECKED_OUT.value,
+            details["ExpressionAttributeValues"][":checked_out"],
+        )
+
     def test_update_booking_status_client_error(self):
         self.client.transact_write_items.side_effect = ClientError(
             error_response={"Error": {"Message": "Update failed"}},
@@ -0,0 +1,106 @@
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from common.models.bookings import Booking, BookingStatus
+from common.models.rooms import Category, RoomStatus
+from common.models.users import UserRole
+from common.repository.decoders import (
+    decode_booking,
+    decode_room,
+    decode_user,
+    parse_timestamp,
+)
+
+
+class TestDecoders(unittest.TestCase):
+    def _booking_details_item(self):
+        return {
+            "pk": "BOOKING#b1",
+            "sk": "DETAILS",
+            "user_id": "u1",
+            "room_id": "r1",
+            "category": "DELUXE",
+            "booking_status": "UPCOMING",
+            "check_in": "2026-03-01T14:00:00+05:30",
+            "check_out": "2026-03-02T00:00:00+00:00",
+            "price_per_night": Decimal("1500.0"),
+            "booked_at": "2026-02-01T00:00:00+00:00",
+            "user_email": "test@example.com",
+        }
+
+    def test_decode_booking_details_item(self):
+        booking = decode_booking(self._booking_details_item())
+
+        self.assertIsInstance(booking, Booking)
+        self.assertEqual("b1", booking.booking_id)
+        self.assertEqual("u1", booking.user_id)
+        self.assertIs(Category.DELUXE, booking.category)
+        self.assertIs(BookingStatus.UPCOMING, booking.status)
+        self.assertEqual(datetime(2026, 3, 1, 8, 30, tzinfo=timezone.utc), booking.checkin)
+        self.assertEqual(timezone.utc, booking.checkin.tzinfo)
+        self.assertEqual(1500.0, booking.price_per_night)
+
+    def test_decode_user_booking_item(self):
+        item = self._booking_details_item()
+        item.pop("user_id")
+        item["pk"] = "USER#u1"
+        item["sk"] = "BOOKING#2026-03-01T08:30:00+00:00#b1"
+
+        booking = decode_booking(item)
+
+        self.assertEqual("b1", booking.booking_id)
+        self.assertEqual("u1", booking.user_id)
+
+    def test_decode_booking_unknown_enum_raises(self):
+        item = self._booking_details_item()
+        item["category"] = "PENTHOUSE"
+
+        with self.assertRaises(ValueError):
+            decode_booking(item)
+
+    def test_parse_timestamp_requires_timezone(self):
+        with self.assertRaises(ValueError):
+            parse_timestamp("2026-03-01T00:00:00")
+
+    def test_parse_timestamp_reuses_results(self):
+        first = parse_timestamp("2026-03-01T00:00:00+00:00")
+        self.assertIs(first, parse_timestamp("2026-03-01T00:00:00+00:00"))
+
+    def test_decode_room(self):
+        room = decode_room({"pk": "ROOM#r1", "sk": "DETAILS", "category": "SUITE", "room_status": "MAINTENANCE"})
+
+        self.assertEqual("r1", room.room_id)
+        self.assertIs(Category.SUITE, room.category)
+        self.assertIs(RoomStatus.MAINTENANCE, room.status)
+        self.assertIsNone(room.floor)
+
+    def test_decode_room_floor(self):
+        room = decode_room({
+            "pk": "ROOM#r1", "sk": "DETAILS", "category": "SUITE",
+            "room_status": "AVAILABLE", "floor": Decimal("3"),
+        })
+
+        self.assertEqual(3, room.floor)
+
+    def test_decode_user(self):
+        user = decode_user({
+            "pk": "USER#u1",
+            "sk": "DETAILS",
+            "username": "alice",
+            "email": "alice@example.com",
+            "phone_number": "9999999999",
+            "password": "pw",
+            "role": "MANAGER",
+        })
+
+        self.assertEqual("u1", user.user_id)
+        self.assertIs(UserRole.MANAGER, user.role)
+
+    def test_models_are_slotted(self):
+        booking = decode_booking(self._booking_details_item())
+        self.assertFalse(hasattr(booking, "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
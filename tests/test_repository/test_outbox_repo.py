@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from common.repository.outbox_repo import OUTBOX_SHARDS, OutboxRepository
+
+
+class TestOutboxRepository(unittest.TestCase):
+    def setUp(self):
+        self.table = MagicMock()
+        self.repo = OutboxRepository(self.table)
+        self.entry = OutboxRepository.schedule_checkout_item(
+            "b1", "u1", "r1", "2026-03-03T11:00:00.000000Z"
+        )
+
+    def test_schedule_checkout_item_is_keyed_by_booking(self):
+        self.assertEqual(OutboxRepository.shard_pk("b1"), self.entry["pk"])
+        self.assertEqual("BOOKING#b1", self.entry["sk"])
+        self.assertEqual("SCHEDULE_CHECKOUT", self.entry["action"])
+        self.assertIn("queued_at", self.entry)
+
+    def test_shard_is_stable_and_in_range(self):
+        shards = {OutboxRepository.shard_pk(f"b{n}") for n in range(200)}
+
+        self.assertEqual({f"OUTBOX#{n}" for n in range(OUTBOX_SHARDS)}, shards)
+        self.assertEqual(self.entry["pk"], OutboxRepository.cancel_checkout_item("b1")["pk"])
+
+    def test_get_pending_queries_every_shard(self):
+        self.table.query.return_value = {"Items": []}
+
+        self.assertEqual([], self.repo.get_pending(limit=25))
+
+        self.assertEqual(OUTBOX_SHARDS, self.table.query.call_count)
+
+    def test_get_pending_limits_the_batch_across_shards(self):
+        self.table.query.side_effect = [
+            {"Items": [self.entry] * 20},
+            {"Items": [self.entry] * 5},
+        ]
+
+        self.assertEqual(25, len(self.repo.get_pending(limit=25)))
+
+        limits = [call.kwargs["Limit"] for call in self.table.query.call_args_list]
+        self.assertEqual([25, 5], limits)
+
+    def test_get_pending_starts_from_the_next_shard_each_run(self):
+        self.table.query.return_value = {"Items": [self.entry]}
+
+        self.repo.get_pending(limit=1)
+        self.repo.get_pending(limit=1)
+
+        first, second = self.table.query.call_args_list
+        self.assertNotEqual(
+            first.kwargs["KeyConditionExpression"], second.kwargs["KeyConditionExpression"]
+        )
+
+    def test_delete_only_the_applied_version(self):
+        self.assertTrue(self.repo.delete(self.entry))
+
+        kwargs = self.table.delete_item.call_args.kwargs
+        self.assertEqual({"pk": self.entry["pk"], "sk": "BOOKING#b1"}, kwargs["Key"])
+        self.assertEqual(
+            {":queued_at": self.entry["queued_at"]}, kwargs["ExpressionAttributeValues"]
+        )
+
+    def test_delete_superseded_entry_is_left(self):
+        self.table.delete_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "DeleteItem"
+        )
+
+        self.assertFalse(self.repo.delete(self.entry))
+
+
+if __name__ == "__main__":
+    unittest.main()
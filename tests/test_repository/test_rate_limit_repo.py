@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from common.repository.rate_limit_repo import RateLimitRepository
+
+
+class TestRateLimitRepository(unittest.TestCase):
+    def setUp(self):
+        self.table = MagicMock()
+        self.repo = RateLimitRepository(self.table)
+
+    def test_take_counts_atomically_up_to_capacity(self):
+        self.assertTrue(self.repo.take("login#u@test.com", 7, 5, 480))
+
+        kwargs = self.table.update_item.call_args.kwargs
+        self.assertEqual(
+            {"pk": "RATELIMIT#login#u@test.com", "sk": "WINDOW#7"}, kwargs["Key"]
+        )
+        self.assertIn("ADD hits :one", kwargs["UpdateExpression"])
+        self.assertIn("hits < :capacity", kwargs["ConditionExpression"])
+        self.assertEqual(
+            {":one": 1, ":capacity": 5, ":ttl": 480}, kwargs["ExpressionAttributeValues"]
+        )
+
+    def test_take_from_empty_bucket(self):
+        self.table.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+        )
+
+        self.assertFalse(self.repo.take("login#u@test.com", 7, 5, 480))
+
+    def test_take_other_errors_raise(self):
+        self.table.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ProvisionedThroughputExceededException"}}, "UpdateItem"
+        )
+
+        with self.assertRaises(ClientError):
+            self.repo.take("login#u@test.com", 7, 5, 480)
+
+    def test_count_reads_the_current_window(self):
+        self.table.get_item.return_value = {"Item": {"hits": 3}}
+
+        self.assertEqual(3, self.repo.count("login_failure#u@test.com", 7))
+
+        self.assertEqual(
+            {"pk": "RATELIMIT#login_failure#u@test.com", "sk": "WINDOW#7"},
+            self.table.get_item.call_args.kwargs["Key"],
+        )
+
+    def test_count_of_untouched_window(self):
+        self.table.get_item.return_value = {}
+
+        self.assertEqual(0, self.repo.count("login_failure#u@test.com", 7))
+
+
+if __name__ == "__main__":
+    unittest.main()
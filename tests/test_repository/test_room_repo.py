@@ -4,11 +4,146 @@ from datetime import datetime, timezone, timedelta
 from botocore.exceptions import ClientError
 
 from common.repository.room_repo import RoomRepository
-from common.models.rooms import Category, RoomStatus, Room
+from common.models.rooms import Category, FreeRoom, RoomStatus, Room
 from common.utils.custom_exceptions import NotFoundException
 
 
 class TestRoomRepository(unittest.TestCase):
+    def _cancelled(self, codes):
+        from botocore.exceptions import ClientError
+        return ClientError(
+            {
+                "Error": {"Code": "TransactionCanceledException"},
+                "CancellationReasons": [{"Code": code} for code in codes],
+            },
+            "TransactWriteItems",
+        )
+
+    def test_add_rooms_packs_full_transactions(self):
+        rooms = [Room(room_id=f"r{i}", category=Category.DELUXE) for i in range(120)]
+
+        conflicts, failed = self.repo.add_rooms(rooms)
+
+        self.assertEqual(([], []), (conflicts, failed))
+        sizes = sorted(
+            len(call.kwargs["TransactItems"])
+            for call in self.client.transact_write_items.call_args_list
+        )
+        self.assertEqual([40, 100, 100], sizes)
+
+    def test_add_rooms_reports_conflicts_and_retries_rest(self):
+        rooms = [Room(room_id=f"r{i}", category=Category.DELUXE) for i in range(3)]
+        self.client.transact_write_items.side_effect = [
+            self._cancelled(["None", "None", "ConditionalCheckFailed", "None", "None", "None"]),
+            {},
+        ]
+
+        conflicts, failed = self.repo.add_rooms(rooms)
+
+        self.assertEqual(["r1"], conflicts)
+        self.assertEqual([], failed)
+        retry = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(
+            ["ROOM#r0", "CATEGORY#DELUXE", "ROOM#r2", "CATEGORY#DELUXE"],
+            [item["Put"]["Item"]["pk"] for item in retry],
+        )
+
+    def test_add_rooms_other_errors_fail_only_their_chunk(self):
+        rooms = [Room(room_id=f"r{i}", category=Category.DELUXE) for i in range(60)]
+
+        def write(TransactItems):
+            if TransactItems[0]["Put"]["Item"]["pk"] == "ROOM#r50":
+                raise self._cancelled(["None", "ThrottlingError"])
+            return {}
+
+        self.client.transact_write_items.side_effect = write
+
+        conflicts, failed = self.repo.add_rooms(rooms)
+
+        self.assertEqual([], conflicts)
+        self.assertEqual([f"r{i}" for i in range(50, 60)], failed)
+        self.assertEqual(2, self.client.transact_write_items.call_count)
+
+    def test_add_rooms_throttled_request_is_reported_failed(self):
+        from botocore.exceptions import ClientError
+        self.client.transact_write_items.side_effect = ClientError(
+            {"Error": {"Code": "ThrottlingException"}}, "TransactWriteItems"
+        )
+
+        self.assertEqual(
+            ([], ["r1"]),
+            self.repo.add_rooms([Room(room_id="r1", category=Category.DELUXE)]),
+        )
+
+    def test_add_room_with_floor_writes_floor_index(self):
+        self.repo.add_room(Room(room_id="r1", category=Category.DELUXE, floor=3))
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(3, items[0]["Put"]["Item"]["floor"])
+        self.assertEqual(
+            {"pk": "FLOOR#3", "sk": "ROOM#r1"}, items[2]["Put"]["Item"]
+        )
+
+    def test_add_rooms_conflict_mapped_with_floor_items(self):
+        rooms = [
+            Room(room_id="r0", category=Category.DELUXE, floor=1),
+            Room(room_id="r1", category=Category.DELUXE),
+        ]
+        self.client.transact_write_items.side_effect = [
+            self._cancelled(["None", "None", "None", "ConditionalCheckFailed", "None"]),
+            {},
+        ]
+
+        self.assertEqual((["r1"], []), self.repo.add_rooms(rooms))
+
+    def test_get_room_ids_by_floor_pages(self):
+        self.table.query.side_effect = [
+            {"Items": [{"sk": "ROOM#r1"}], "LastEvaluatedKey": {"pk": "x"}},
+            {"Items": [{"sk": "ROOM#r2"}]},
+        ]
+
+        self.assertEqual(["r1", "r2"], self.repo.get_room_ids_by_floor(3))
+        self.assertEqual({"pk": "x"}, self.table.query.call_args.kwargs["ExclusiveStartKey"])
+
+    def test_update_rooms_status_skips_rooms_in_other_status(self):
+        self.client.get_item.return_value = {"Item": {"category": "DELUXE"}}
+
+        def transact_write_items(**kwargs):
+            if kwargs["TransactItems"][0]["Update"]["Key"]["pk"] == "ROOM#r2":
+                raise self._cancelled(["ConditionalCheckFailed", "None"])
+            return {}
+
+        self.client.transact_write_items.side_effect = transact_write_items
+
+        updated = self.repo.update_rooms_status(
+            ["r1", "r2", "r3"], RoomStatus.HOUSEKEEPING, RoomStatus.MAINTENANCE
+        )
+
+        self.assertEqual(["r1", "r3"], updated)
+        update, index_update = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(
+            {":value": "MAINTENANCE", ":expected": "HOUSEKEEPING"},
+            update["Update"]["ExpressionAttributeValues"],
+        )
+        self.assertEqual(
+            {"pk": "CATEGORY#DELUXE", "sk": "ROOM#r3"}, index_update["Update"]["Key"]
+        )
+
+    def test_update_rooms_status_other_errors_raise(self):
+        self.client.get_item.return_value = {"Item": {"category": "DELUXE"}}
+        self.client.transact_write_items.side_effect = ClientError(
+            {"Error": {"Code": "InternalError"}}, "TransactWriteItems"
+        )
+
+        with self.assertRaises(ClientError):
+            self.repo.update_rooms_status(
+                ["r1"], RoomStatus.HOUSEKEEPING, RoomStatus.AVAILABLE
+            )
+
+    def test_add_rooms_empty(self):
+        self.assertEqual(([], []), self.repo.add_rooms([]))
+        self.client.transact_write_items.assert_not_called()
+
     def setUp(self):
         self.table = MagicMock()
         self.client = MagicMock()
@@ -91,35 +226,6 @@ class TestRoomRepository(unittest.TestCase):
         with self.assertRaises(ClientError):
             self.repo.get_room_by_id("r1")
 
-    def test_get_rooms_ids_by_category_success(self):
-        self.table.query.return_value = {
-            "Items": [
-                {"pk": "CATEGORY#DELUXE", "sk": "ROOM#r1"},
-                {"pk": "CATEGORY#DELUXE", "sk": "ROOM#r2"},
-            ]
-        }
-
-        result = self.repo.get_rooms_ids_by_category(Category.DELUXE)
-
-        self.table.query.assert_called_once()
-        self.assertEqual(result, ["r1", "r2"])
-
-    def test_get_rooms_ids_by_category_empty(self):
-        self.table.query.return_value = {"Items": []}
-
-        result = self.repo.get_rooms_ids_by_category(Category.DELUXE)
-
-        self.assertEqual(result, [])
-
-    def test_get_rooms_ids_by_category_client_error(self):
-        self.table.query.side_effect = ClientError(
-            error_response={"Error": {"Message": "Query failed"}},
-            operation_name="Query"
-        )
-
-        with self.assertRaises(ClientError):
-            self.repo.get_rooms_ids_by_category(Category.DELUXE)
-
     def test_get_category_price_success(self):
         self.table.get_item.return_value = {
             "Item": {
@@ -150,32 +256,223 @@ class TestRoomRepository(unittest.TestCase):
             self.repo.get_category_price(Category.DELUXE)
 
     def test_update_room_status_success(self):
-        self.table.update_item.return_value = {}
+        self.client.get_item.return_value = {"Item": {"category": "DELUXE"}}
 
         self.repo.update_room_status("r1", RoomStatus.HOUSEKEEPING)
 
-        self.table.update_item.assert_called_once()
+        update, index_update = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual({"pk": "ROOM#r1", "sk": "DETAILS"}, update["Update"]["Key"])
+        self.assertEqual(
+            {":value": "HOUSEKEEPING"}, index_update["Update"]["ExpressionAttributeValues"]
+        )
 
     def test_update_room_status_not_found(self):
-        error = ClientError(
-            error_response={"Error": {"Code": "ConditionalCheckFailedException"}},
-            operation_name="UpdateItem"
-        )
-        self.table.update_item.side_effect = error
+        self.client.get_item.return_value = {}
 
         with self.assertRaises(NotFoundException):
             self.repo.update_room_status("r1", RoomStatus.HOUSEKEEPING)
+        self.client.transact_write_items.assert_not_called()
 
     def test_update_room_status_other_error(self):
-        error = ClientError(
+        self.client.get_item.return_value = {"Item": {"category": "DELUXE"}}
+        self.client.transact_write_items.side_effect = ClientError(
             error_response={"Error": {"Code": "InternalError"}},
-            operation_name="UpdateItem"
+            operation_name="TransactWriteItems"
         )
-        self.table.update_item.side_effect = error
 
         with self.assertRaises(ClientError):
             self.repo.update_room_status("r1", RoomStatus.HOUSEKEEPING)
 
+    def test_update_room_status_available_drops_housekeeping_entry(self):
+        self.client.get_item.return_value = {
+            "Item": {
+                "category": "DELUXE",
+                "hk_pk": "HK#2026-03-02",
+                "hk_sk": "2026-03-02T06:00:00.000000Z#ROOM#r1",
+            }
+        }
+
+        self.repo.update_room_status("r1", RoomStatus.AVAILABLE)
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        update, _, delete = items
+        self.assertIn("REMOVE hk_pk, hk_sk", update["Update"]["UpdateExpression"])
+        self.assertEqual(
+            {"pk": "HK#2026-03-02", "sk": "2026-03-02T06:00:00.000000Z#ROOM#r1"},
+            delete["Delete"]["Key"],
+        )
+
+    def test_update_room_status_available_without_queue_entry(self):
+        self.client.get_item.return_value = {"Item": {"category": "DELUXE"}}
+
+        self.repo.update_room_status("r1", RoomStatus.AVAILABLE)
+
+        items = self.client.transact_write_items.call_args.kwargs["TransactItems"]
+        self.assertEqual(2, len(items))
+
+    def test_bulk_available_skips_rooms_not_in_expected_status(self):
+        self.client.get_item.return_value = {
+            "Item": {"category": "DELUXE", "hk_pk": "HK#2026-03-02", "hk_sk": "x#ROOM#r1"}
+        }
+        self.client.transact_write_items.side_effect = self._cancelled(
+            ["ConditionalCheckFailed", "None", "None"]
+        )
+
+        updated = self.repo.update_rooms_status(
+            ["r1"], RoomStatus.HOUSEKEEPING, RoomStatus.AVAILABLE
+        )
+
+        self.assertEqual([], updated)
+        update = self.client.transact_write_items.call_args.kwargs["TransactItems"][0]["Update"]
+        self.assertEqual(
+            "#attribute=:expected AND hk_sk=:hk_sk", update["ConditionExpression"]
+        )
+
+    def test_room_status_map_loaded_once_and_cached(self):
+        self.table.query.return_value = {
+            "Items": [
+                {"sk": "ROOM#r1", "room_status": "MAINTENANCE"},
+                {"sk": "ROOM#r2"},
+            ]
+        }
+
+        first = self.repo.get_room_status_map(Category.DELUXE)
+        second = self.repo.get_room_status_map(Category.DELUXE)
+
+        self.assertEqual(
+            {"r1": RoomStatus.MAINTENANCE, "r2": RoomStatus.AVAILABLE}, first
+        )
+        self.assertIs(first, second)
+        self.table.query.assert_called_once()
+
+    def test_room_status_map_invalidated_by_status_update(self):
+        self.table.query.return_value = {"Items": [{"sk": "ROOM#r1"}]}
+        self.client.get_item.return_value = {"Item": {"category": "DELUXE"}}
+
+        self.repo.get_room_status_map(Category.DELUXE)
+        self.repo.update_room_status("r1", RoomStatus.MAINTENANCE)
+        self.repo.get_room_status_map(Category.DELUXE)
+
+        self.assertEqual(2, self.table.query.call_count)
+
+    def test_room_status_map_expires(self):
+        self.table.query.return_value = {"Items": []}
+
+        with unittest.mock.patch("common.repository.room_repo.time.monotonic", side_effect=[0, 31, 31]):
+            self.repo.get_room_status_map(Category.DELUXE)
+            self.repo.get_room_status_map(Category.DELUXE)
+
+        self.assertEqual(2, self.table.query.call_count)
+
+    def test_get_available_rooms_excludes_out_of_service_rooms(self):
+        self.repo.get_room_status_map = MagicMock(return_value={
+            "r1": RoomStatus.MAINTENANCE,
+            "r2": RoomStatus.HOUSEKEEPING,
+            "r3": RoomStatus.AVAILABLE,
+        })
+        self.table.query.return_value = {"Items": []}
+        checkin = datetime.now(timezone.utc) + timedelta(days=1)
+
+        available = self.repo.get_available_rooms(
+            Category.DELUXE, checkin, checkin + timedelta(days=1)
+        )
+
+        self.assertEqual({"r2", "r3"}, set(available))
+
+    @unittest.mock.patch("common.repository.room_repo.QUERY_SLICES", 1)
+    def test_get_stays_returns_overlapping_stays_from_one_window(self):
+        self.table.query.side_effect = [
+            {
+                "Items": [
+                    {
+                        "room_id": "r1",
+                        "sk": "CHECKIN#2026-02-27T14:00:00.000000Z#ROOM#r1",
+                        "checkout": "2026-03-01T11:00:00.000000Z",
+                    },
+                    {
+                        "room_id": "r2",
+                        "sk": "CHECKIN#2026-02-20T14:00:00.000000Z#ROOM#r2",
+                        "checkout": "2026-02-25T11:00:00.000000Z",
+                    },
+                ],
+                "LastEvaluatedKey": {"pk": "x"},
+            },
+            {
+                "Items": [
+                    {
+                        "room_id": "r3",
+                        "sk": "CHECKIN#2026-03-05T14:00:00+00:00#ROOM#r3",
+                        "checkout": "2026-03-07T11:00:00+00:00",
+                    }
+                ]
+            },
+        ]
+
+        stays = self.repo.get_stays(
+            Category.DELUXE,
+            datetime(2026, 3, 1, tzinfo=timezone.utc),
+            datetime(2026, 3, 10, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(
+            [
+                ("r1", "2026-02-27T14:00:00.000000Z", "2026-03-01T11:00:00.000000Z"),
+                ("r3", "2026-03-05T14:00:00.000000Z", "2026-03-07T11:00:00.000000Z"),
+            ],
+            stays,
+        )
+        self.assertEqual(2, self.table.query.call_count)
+
+    def test_get_stays_queries_time_slices_concurrently(self):
+        seen = []
+
+        def query(**kwargs):
+            seen.append(kwargs)
+            bounds = kwargs["KeyConditionExpression"].get_expression()["values"][1]
+            upper = bounds.get_expression()["values"][2]
+            if "ExclusiveStartKey" in kwargs:
+                return {"Items": []}
+            if upper == "CHECKIN#2026-03-05T00:00:00.000000Z":
+                # stay inside the last slice, with a second page
+                return {
+                    "Items": [{
+                        "room_id": "r1",
+                        "sk": "CHECKIN#2026-03-02T14:00:00.000000Z#ROOM#r1",
+                        "checkout": "2026-03-04T11:00:00.000000Z",
+                    }],
+                    "LastEvaluatedKey": {"pk": "x"},
+                }
+            return {"Items": []}
+
+        self.table.query.side_effect = query
+
+        stays = self.repo.get_stays(
+            Category.DELUXE,
+            datetime(2026, 3, 3, tzinfo=timezone.utc),
+            datetime(2026, 3, 5, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(
+            [("r1", "2026-03-02T14:00:00.000000Z", "2026-03-04T11:00:00.000000Z")], stays
+        )
+        self.assertEqual(5, len(seen))
+        self.assertTrue(all(
+            call["ProjectionExpression"] == "sk, room_id, checkout, hold_expires_at"
+            for call in seen
+        ))
+
+    def test_slice_bounds_are_contiguous(self):
+        bounds = self.repo._slice_bounds(
+            datetime(2026, 2, 1, tzinfo=timezone.utc),
+            datetime(2026, 3, 3, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(4, len(bounds))
+        self.assertEqual("2026-02-01T00:00:00.000000Z", bounds[0][0])
+        self.assertEqual("2026-03-03T00:00:00.000000Z", bounds[-1][1])
+        for (_, upper), (lower, _) in zip(bounds, bounds[1:]):
+            self.assertEqual(upper, lower)
+
     def test_to_utc_success(self):
         dt = datetime.now(timezone.utc)
 
@@ -198,78 +495,248 @@ class TestRoomRepository(unittest.TestCase):
 
 
     def test_get_available_rooms_blocks_overlapping(self):
-        now = datetime.now(timezone.utc)
-        checkin = now + timedelta(days=1)
-        checkout = now + timedelta(days=2)
-        self.repo.get_rooms_ids_by_category = MagicMock(return_value=["r1", "r2"])
-        def fake_from_iso(s):
-            if "r1" in s:
-                if "checkout" in s:
-                    return checkin + timedelta(hours=1)
-                else:
-                    return checkin
-            return datetime.fromisoformat(s)
-        patcher = unittest.mock.patch("common.utils.datetime_normaliser.from_iso_string", side_effect=fake_from_iso)
-        patcher.start()
-        self.addCleanup(patcher.stop)
+        self.repo.get_room_status_map = MagicMock(return_value={"r1": RoomStatus.AVAILABLE, "r2": RoomStatus.AVAILABLE})
         self.table.query.return_value = {
             "Items": [
                 {
                     "room_id": "r1",
-                    "checkout": (checkin + timedelta(hours=1)).isoformat(),
-                    "sk": f"CHECKIN#{checkin.isoformat()}#ROOM#r1"
+                    "sk": "CHECKOUT#2026-03-02T11:00:00.000000Z#ROOM#r1",
+                    "checkin": "2026-03-01T14:00:00.000000Z",
                 }
             ]
         }
-        available = self.repo.get_available_rooms(Category.DELUXE, checkin, checkout)
+
+        available = self.repo.get_available_rooms(
+            Category.DELUXE,
+            datetime(2026, 3, 1, 14, tzinfo=timezone.utc),
+            datetime(2026, 3, 2, 11, tzinfo=timezone.utc),
+        )
+
         self.assertEqual(set(available), {"r2"})
+        bounds = self.table.query.call_args.kwargs["KeyConditionExpression"]
+        lower, upper = bounds.get_expression()["values"][1].get_expression()["values"][1:]
+        # only stays checking out after the requested check-in are read
+        self.assertEqual("CHECKOUT#2026-03-01T14:00:00.000000Z$", lower)
+        self.assertEqual("CHECKOUT#2026-04-01T11:00:00.000000Z", upper)
 
     def test_get_available_rooms_pagination(self):
-        now = datetime.now(timezone.utc)
-        checkin = now + timedelta(days=1)
-        checkout = now + timedelta(days=2)
-        self.repo.get_rooms_ids_by_category = MagicMock(return_value=["r1", "r2", "r3"])
-        def fake_from_iso(s):
-            if "r1" in s:
-                if "checkout" in s:
-                    return checkin + timedelta(hours=1)
-                else:
-                    return checkin
-            if "r2" in s:
-                if "checkout" in s:
-                    return checkin + timedelta(hours=2)
-                else:
-                    return checkin
-            return datetime.fromisoformat(s)
-        patcher = unittest.mock.patch("common.utils.datetime_normaliser.from_iso_string", side_effect=fake_from_iso)
-        patcher.start()
-        self.addCleanup(patcher.stop)
+        self.repo.get_room_status_map = MagicMock(return_value={"r1": RoomStatus.AVAILABLE, "r2": RoomStatus.AVAILABLE, "r3": RoomStatus.AVAILABLE})
         self.table.query.side_effect = [
             {
                 "Items": [
                     {
                         "room_id": "r1",
-                        "checkout": (checkin + timedelta(hours=1)).isoformat(),
-                        "sk": f"CHECKIN#{checkin.isoformat()}#ROOM#r1"
+                        "sk": "CHECKOUT#2026-03-01T20:00:00.000000Z#ROOM#r1",
+                        "checkin": "2026-02-28T14:00:00.000000Z",
                     }
                 ],
-                "LastEvaluatedKey": True
+                "LastEvaluatedKey": {"pk": "CATEGORY#DELUXE", "sk": "x"},
             },
             {
                 "Items": [
                     {
                         "room_id": "r2",
-                        "checkout": (checkin + timedelta(hours=2)).isoformat(),
-                        "sk": f"CHECKIN#{checkin.isoformat()}#ROOM#r2"
+                        "sk": "CHECKOUT#2026-03-04T11:00:00.000000Z#ROOM#r2",
+                        "checkin": "2026-03-01T16:00:00.000000Z",
                     }
                 ]
-            }
+            },
         ]
-        available = self.repo.get_available_rooms(Category.DELUXE, checkin, checkout)
+
+        available = self.repo.get_available_rooms(
+            Category.DELUXE,
+            datetime(2026, 3, 1, 14, tzinfo=timezone.utc),
+            datetime(2026, 3, 2, 11, tzinfo=timezone.utc),
+        )
+
         self.assertEqual(set(available), {"r3"})
+        self.assertEqual(
+            {"pk": "CATEGORY#DELUXE", "sk": "x"},
+            self.table.query.call_args.kwargs["ExclusiveStartKey"],
+        )
+
+    def test_get_available_rooms_stops_once_every_room_is_blocked(self):
+        self.repo.get_room_status_map = MagicMock(return_value={
+            "r1": RoomStatus.AVAILABLE,
+            "r2": RoomStatus.AVAILABLE,
+        })
+        self.table.query.return_value = {
+            "Items": [
+                {
+                    "room_id": "r1",
+                    "sk": "CHECKOUT#2026-03-03T11:00:00.000000Z#ROOM#r1",
+                    "checkin": "2026-02-28T14:00:00.000000Z",
+                },
+                {
+                    "room_id": "r2",
+                    "sk": "CHECKOUT#2026-03-04T11:00:00.000000Z#ROOM#r2",
+                    "checkin": "2026-03-02T14:00:00.000000Z",
+                },
+            ],
+            "LastEvaluatedKey": {"pk": "CATEGORY#DELUXE", "sk": "x"},
+        }
+
+        available = self.repo.get_available_rooms(
+            Category.DELUXE,
+            datetime(2026, 3, 1, 14, tzinfo=timezone.utc),
+            datetime(2026, 3, 3, 11, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual([], available)
+        self.table.query.assert_called_once()
+
+    def test_get_available_rooms_first_stay_decides_and_limit_stops(self):
+        self.repo.get_room_status_map = MagicMock(return_value={
+            "r1": RoomStatus.AVAILABLE,
+            "r2": RoomStatus.AVAILABLE,
+            "r3": RoomStatus.AVAILABLE,
+        })
+        self.table.query.return_value = {
+            "Items": [
+                # r1's next stay starts at the requested checkout: later r1
+                # stays start later still, so r1 is confirmed free
+                {
+                    "room_id": "r1",
+                    "sk": "CHECKOUT#2026-03-05T11:00:00.000000Z#ROOM#r1",
+                    "checkin": "2026-03-03T11:00:00.000000Z",
+                },
+                {
+                    "room_id": "r1",
+                    "sk": "CHECKOUT#2026-03-09T11:00:00.000000Z#ROOM#r1",
+                    "checkin": "2026-03-06T14:00:00.000000Z",
+                },
+            ],
+            "LastEvaluatedKey": {"pk": "CATEGORY#DELUXE", "sk": "x"},
+        }
+
+        available = self.repo.get_available_rooms(
+            Category.DELUXE,
+            datetime(2026, 3, 1, 14, tzinfo=timezone.utc),
+            datetime(2026, 3, 3, 11, tzinfo=timezone.utc),
+            limit=1,
+        )
+
+        self.assertEqual(["r1"], available)
+        self.table.query.assert_called_once()
+
+    def test_get_free_rooms_reports_neighbouring_stays(self):
+        self.repo.get_room_status_map = MagicMock(return_value={
+            "r1": RoomStatus.AVAILABLE,
+            "r2": RoomStatus.AVAILABLE,
+            "r3": RoomStatus.AVAILABLE,
+        })
+        self.table.query.return_value = {
+            "Items": [
+                {
+                    "room_id": "r1",
+                    "sk": "CHECKOUT#2026-03-01T11:00:00.000000Z#ROOM#r1",
+                    "checkin": "2026-02-27T14:00:00.000000Z",
+                },
+                {
+                    "room_id": "r2",
+                    "sk": "CHECKOUT#2026-03-01T12:00:00.000000Z#ROOM#r2",
+                    "checkin": "2026-02-28T14:00:00.000000Z",
+                },
+                {
+                    "room_id": "r1",
+                    "sk": "CHECKOUT#2026-03-06T11:00:00.000000Z#ROOM#r1",
+                    "checkin": "2026-03-04T14:00:00.000000Z",
+                },
+            ]
+        }
+        checkin = datetime(2026, 3, 1, 14, tzinfo=timezone.utc)
+
+        rooms = self.repo.get_free_rooms(
+            Category.DELUXE,
+            checkin,
+            datetime(2026, 3, 3, 11, tzinfo=timezone.utc),
+            lookbehind=timedelta(days=7),
+        )
+
+        by_id = {room.room_id: room for room in rooms}
+        self.assertEqual({"r1", "r2", "r3"}, set(by_id))
+        self.assertEqual(
+            datetime(2026, 3, 1, 11, tzinfo=timezone.utc), by_id["r1"].previous_checkout
+        )
+        self.assertEqual(
+            datetime(2026, 3, 4, 14, tzinfo=timezone.utc), by_id["r1"].next_checkin
+        )
+        self.assertEqual(
+            datetime(2026, 3, 1, 12, tzinfo=timezone.utc), by_id["r2"].previous_checkout
+        )
+        self.assertIsNone(by_id["r2"].next_checkin)
+        self.assertEqual(FreeRoom("r3"), by_id["r3"])
+        lower = self.table.query.call_args.kwargs["KeyConditionExpression"]
+        self.assertEqual(
+            "CHECKOUT#2026-02-22T14:00:00.000000Z$",
+            lower.get_expression()["values"][1].get_expression()["values"][1],
+        )
+
+    def test_get_available_rooms_blocks_unexpired_holds_only(self):
+        self.repo.get_room_status_map = MagicMock(return_value={
+            "r1": RoomStatus.AVAILABLE,
+            "r2": RoomStatus.AVAILABLE,
+        })
+        now = int(datetime.now(timezone.utc).timestamp())
+        self.table.query.return_value = {
+            "Items": [
+                {
+                    "room_id": "r1",
+                    "sk": "CHECKOUT#2026-03-03T11:00:00.000000Z#ROOM#r1",
+                    "checkin": "2026-03-01T14:00:00.000000Z",
+                    "hold_expires_at": now + 600,
+                },
+                {
+                    "room_id": "r2",
+                    "sk": "CHECKOUT#2026-03-03T11:00:00.000000Z#ROOM#r2",
+                    "checkin": "2026-03-01T14:00:00.000000Z",
+                    "hold_expires_at": now - 60,
+                },
+            ]
+        }
+
+        available = self.repo.get_available_rooms(
+            Category.DELUXE,
+            datetime(2026, 3, 1, 14, tzinfo=timezone.utc),
+            datetime(2026, 3, 3, 11, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(["r2"], available)
+
+    def test_is_room_free_checks_only_the_added_nights_of_one_room(self):
+        self.table.query.return_value = {
+            "Items": [{"sk": "CHECKIN#2026-03-05T14:00:00.000000Z"}]
+        }
+        start = datetime(2026, 3, 3, 11, tzinfo=timezone.utc)
+
+        self.assertFalse(
+            self.repo.is_room_free("r1", start, datetime(2026, 3, 6, 11, tzinfo=timezone.utc))
+        )
+        # a stay starting exactly at the new checkout does not overlap
+        self.assertTrue(
+            self.repo.is_room_free("r1", start, datetime(2026, 3, 5, 14, tzinfo=timezone.utc))
+        )
+        condition = self.table.query.call_args.kwargs["KeyConditionExpression"]
+        pk, sk = condition.get_expression()["values"]
+        self.assertEqual("ROOM#r1", pk.get_expression()["values"][1])
+        self.assertEqual(
+            ("CHECKIN#2026-03-03T11:00:00.000000Z", "CHECKIN#2026-03-05T14:00:00.000000Z"),
+            sk.get_expression()["values"][1:],
+        )
+
+    def test_is_room_free_ignores_expired_holds(self):
+        self.table.query.return_value = {
+            "Items": [{"sk": "CHECKIN#2026-03-04T14:00:00.000000Z", "hold_expires_at": 1}]
+        }
+
+        self.assertTrue(self.repo.is_room_free(
+            "r1",
+            datetime(2026, 3, 3, 11, tzinfo=timezone.utc),
+            datetime(2026, 3, 6, 11, tzinfo=timezone.utc),
+        ))
 
     def test_get_available_rooms_no_rooms_in_category(self):
-        self.repo.get_rooms_ids_by_category = MagicMock(return_value=[])
+        self.repo.get_room_status_map = MagicMock(return_value={})
         now = datetime.now(timezone.utc)
         import sys
         sys.modules["common.utils.constants"].MAX_STAY = 30
@@ -284,7 +751,7 @@ class TestRoomRepository(unittest.TestCase):
         now = datetime.now(timezone.utc)
         checkin = now + timedelta(days=1)
         checkout = now + timedelta(days=2)
-        self.repo.get_rooms_ids_by_category = MagicMock(return_value=["r1"])
+        self.repo.get_room_status_map = MagicMock(return_value={"r1": RoomStatus.AVAILABLE})
         self.table.query.side_effect = ClientError(
             error_response={"Error": {"Message": "Query failed"}},
             operation_name="Query"
@@ -295,9 +762,7 @@ class TestRoomRepository(unittest.TestCase):
             self.repo.get_available_rooms(Category.DELUXE, checkin, checkout)
 
     def test_get_available_rooms_no_rooms_in_category(self):
-        self.repo.get_rooms_ids_by_category = MagicMock(
-            return_value=[]
-        )
+        self.table.query.return_value = {"Items": []}
 
         now = datetime.now(timezone.utc)
 
@@ -313,7 +778,7 @@ class TestRoomRepository(unittest.TestCase):
         now = datetime.now(timezone.utc)
         checkin = now + timedelta(days=1)
         checkout = now + timedelta(days=2)
-        self.repo.get_rooms_ids_by_category = MagicMock(return_value=["r1"])
+        self.repo.get_room_status_map = MagicMock(return_value={"r1": RoomStatus.AVAILABLE})
         self.table.query.side_effect = ClientError(
             error_response={"Error": {"Message": "Query failed"}},
             operation_name="Query"
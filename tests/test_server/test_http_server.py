@@ -0,0 +1,202 @@
+import asyncio
+import json
+import unittest
+
+from server.http_server import HandlerServer
+from server.routes import Route, Router
+
+
+def echo(event, context):
+    return {
+        "statusCode": 200,
+        "headers": {"Content-Type": "application/json"},
+        "body": json.dumps(
+            {
+                "resource": event["resource"],
+                "pathParameters": event["pathParameters"],
+                "queryStringParameters": event["queryStringParameters"],
+                "multiValueQueryStringParameters": event["multiValueQueryStringParameters"],
+                "body": event["body"],
+                "authorizer": event["requestContext"].get("authorizer"),
+                "sourceIp": event["requestContext"]["identity"]["sourceIp"],
+            }
+        ),
+    }
+
+
+def fail(event, context):
+    raise RuntimeError("boom")
+
+
+def authorizer(event, context):
+    allowed = event["authorizationToken"] == "Bearer good"
+    policy = {
+        "principalId": "u1" if allowed else "unauthorized",
+        "policyDocument": {
+            "Version": "2012-10-17",
+            "Statement": [{"Action": "execute-api:Invoke", "Effect": "Allow" if allowed else "Deny"}],
+        },
+    }
+    if allowed:
+        policy["context"] = {"user_id": "u1", "role": "CUSTOMER"}
+    return policy
+
+
+class TestHandlerServer(unittest.TestCase):
+    def setUp(self):
+        router = Router(
+            [
+                Route("POST", "/bookings/{booking_id}/cancel", f"{__name__}.echo"),
+                Route("POST", "/login", f"{__name__}.echo", authorized=False),
+                Route("GET", "/boom", f"{__name__}.fail", authorized=False),
+            ]
+        )
+        self.server = HandlerServer(
+            router,
+            authorizer=authorizer,
+            workers=2,
+            cors={
+                "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
+                "Access-Control-Allow-Headers": "Content-Type,Authorization,Idempotency-Key",
+                "Access-Control-Allow-Origin": "*",
+            },
+            trusted_proxies=["127.0.0.1", "10.0.0.0/8"],
+        )
+
+    def tearDown(self):
+        self.server.executor.shutdown()
+
+    def _exchange(self, *raw_requests):
+        """Send the requests on one connection; returns the parsed responses."""
+
+        async def run():
+            listener = await asyncio.start_server(self.server.handle_connection, "127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = []
+            for raw in raw_requests:
+                writer.write(raw)
+                await writer.drain()
+                head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+                lines = head.split("\r\n")
+                headers = dict(line.split(": ", 1) for line in lines[1:] if line)
+                body = await reader.readexactly(int(headers["Content-Length"]))
+                responses.append((int(lines[0].split(" ")[1]), headers, body))
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+            return responses
+
+        return asyncio.run(run())
+
+    def _request(self, method, target, body=b"", headers=()):
+        lines = [f"{method} {target} HTTP/1.1", "Host: localhost", *headers]
+        lines.append(f"Content-Length: {len(body)}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+    def test_builds_a_gateway_event_for_the_handler(self):
+        [(status, headers, body)] = self._exchange(
+            self._request(
+                "POST",
+                "/bookings/b%201/cancel?reason=late&tag=a&tag=b",
+                b'{"x": 1}',
+                ["Authorization: Bearer good"],
+            )
+        )
+
+        self.assertEqual(200, status)
+        self.assertEqual("application/json", headers["Content-Type"])
+        event = json.loads(body)
+        self.assertEqual("/bookings/{booking_id}/cancel", event["resource"])
+        self.assertEqual({"booking_id": "b 1"}, event["pathParameters"])
+        self.assertEqual({"reason": "late", "tag": "b"}, event["queryStringParameters"])
+        self.assertEqual(["a", "b"], event["multiValueQueryStringParameters"]["tag"])
+        self.assertEqual('{"x": 1}', event["body"])
+        self.assertEqual(
+            {"principalId": "u1", "user_id": "u1", "role": "CUSTOMER"}, event["authorizer"]
+        )
+        self.assertEqual("127.0.0.1", event["sourceIp"])
+
+    def test_client_ip_from_a_trusted_proxy(self):
+        [(status, _, body)] = self._exchange(
+            self._request(
+                "POST", "/login", headers=["X-Forwarded-For: 1.2.3.4, 203.0.113.7, 10.0.0.5"]
+            )
+        )
+
+        self.assertEqual(200, status)
+        # the spoofable first hop is ignored, as are the trusted ones
+        self.assertEqual("203.0.113.7", json.loads(body)["sourceIp"])
+
+    def test_forwarded_for_from_an_untrusted_peer_is_ignored(self):
+        server = HandlerServer(self.server.router, workers=1, trusted_proxies=["10.0.0.0/8"])
+        self.addCleanup(server.executor.shutdown)
+
+        self.assertEqual(
+            "198.51.100.2",
+            server.client_ip("198.51.100.2", {"X-Forwarded-For": "203.0.113.7"}),
+        )
+        self.assertEqual("10.0.0.5", server.client_ip("10.0.0.5", {}))
+
+    def test_missing_token_is_401_and_denied_token_403(self):
+        responses = self._exchange(
+            self._request("POST", "/bookings/b1/cancel"),
+            self._request("POST", "/bookings/b1/cancel", headers=["Authorization: Bearer bad"]),
+        )
+
+        self.assertEqual([401, 403], [status for status, _, _ in responses])
+
+    def test_open_route_skips_the_authorizer(self):
+        [(status, _, body)] = self._exchange(self._request("POST", "/login", b"{}"))
+
+        self.assertEqual(200, status)
+        self.assertIsNone(json.loads(body)["authorizer"])
+
+    def test_keeps_the_connection_for_further_requests(self):
+        responses = self._exchange(
+            self._request("POST", "/login"),
+            self._request("POST", "/login"),
+        )
+
+        self.assertEqual([200, 200], [status for status, _, _ in responses])
+        self.assertEqual("keep-alive", responses[0][1]["Connection"])
+
+    def test_unknown_route_and_method(self):
+        responses = self._exchange(
+            self._request("GET", "/nowhere"),
+            self._request("GET", "/login"),
+        )
+
+        self.assertEqual([404, 405], [status for status, _, _ in responses])
+
+    def test_preflight_on_known_path_without_authorization(self):
+        responses = self._exchange(
+            self._request("OPTIONS", "/bookings/b1/cancel"),
+            self._request("OPTIONS", "/nowhere"),
+        )
+
+        (status, headers, body), (missing, _, _) = responses
+        self.assertEqual(200, status)
+        self.assertEqual("*", headers["Access-Control-Allow-Origin"])
+        self.assertIn("Idempotency-Key", headers["Access-Control-Allow-Headers"])
+        self.assertEqual(b"", body)
+        self.assertEqual(404, missing)
+
+    def test_failing_handler_is_502(self):
+        with self.assertLogs("server.http_server", level="ERROR"):
+            [(status, _, body)] = self._exchange(self._request("GET", "/boom"))
+
+        self.assertEqual(502, status)
+        self.assertEqual({"message": "Internal server error"}, json.loads(body))
+
+    def test_chunked_body_is_refused(self):
+        raw = b"POST /login HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n\r\n"
+
+        [(status, headers, _)] = self._exchange(raw)
+
+        self.assertEqual(411, status)
+        self.assertEqual("close", headers["Connection"])
+
+
+if __name__ == "__main__":
+    unittest.main()
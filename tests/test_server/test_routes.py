@@ -0,0 +1,77 @@
+import os
+import unittest
+
+from server.routes import Route, Router, load_cors, load_routes
+
+TEMPLATE = os.path.join(os.path.dirname(__file__), "..", "..", "deploy", "template.yaml")
+
+
+def ping(event, context):
+    return {"statusCode": 200, "body": "pong"}
+
+
+class TestLoadRoutes(unittest.TestCase):
+    def setUp(self):
+        self.routes = {(r.method, r.path): r for r in load_routes(TEMPLATE)}
+
+    def test_api_events_map_to_their_handlers(self):
+        route = self.routes[("POST", "/bookings")]
+
+        self.assertEqual("handlers.bookings.create_booking.create_booking", route.handler)
+        self.assertTrue(route.authorized)
+
+    def test_routes_without_authorizer(self):
+        self.assertFalse(self.routes[("POST", "/login")].authorized)
+        self.assertFalse(self.routes[("POST", "/signup")].authorized)
+
+    def test_only_api_events_are_routes(self):
+        handlers = {route.handler for route in self.routes.values()}
+
+        self.assertNotIn("handlers.checkout.auto_checkout.auto_checkout", handlers)
+        self.assertNotIn("handlers.outbox.process_outbox.process_outbox", handlers)
+
+
+class TestLoadCors(unittest.TestCase):
+    def test_preflight_headers_from_the_api(self):
+        headers = load_cors(TEMPLATE)
+
+        self.assertEqual("*", headers["Access-Control-Allow-Origin"])
+        self.assertIn("OPTIONS", headers["Access-Control-Allow-Methods"].split(","))
+        self.assertIn("Idempotency-Key", headers["Access-Control-Allow-Headers"].split(","))
+
+
+class TestRouter(unittest.TestCase):
+    def setUp(self):
+        self.router = Router(
+            [
+                Route("PUT", "/rooms/{room_id}", f"{__name__}.ping"),
+                Route("GET", "/rooms/calendar", f"{__name__}.ping"),
+                Route("POST", "/bookings/{booking_id}/cancel", f"{__name__}.ping"),
+            ]
+        )
+
+    def test_path_parameters(self):
+        route, params, _ = self.router.match("POST", "/bookings/b1/cancel")
+
+        self.assertEqual("/bookings/{booking_id}/cancel", route.path)
+        self.assertEqual({"booking_id": "b1"}, params)
+
+    def test_literal_segment_wins_over_parameter(self):
+        route, params, _ = self.router.match("GET", "/rooms/calendar")
+
+        self.assertEqual("/rooms/calendar", route.path)
+        self.assertEqual({}, params)
+
+    def test_wrong_method_on_known_path(self):
+        self.assertEqual((None, {}, True), self.router.match("GET", "/bookings/b1/cancel"))
+        self.assertEqual((None, {}, False), self.router.match("GET", "/nowhere"))
+
+    def test_handler_is_imported_once(self):
+        route, _, _ = self.router.match("PUT", "/rooms/r1")
+
+        self.assertIs(ping, self.router.handler(route))
+        self.assertIs(ping, self.router.handler(route))
+
+
+if __name__ == "__main__":
+    unittest.main()
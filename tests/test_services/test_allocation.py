@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
+
+from common.models.rooms import FreeRoom
+from common.services.allocation import (
+    BestFitStrategy,
+    FirstFitStrategy,
+    get_allocation_strategy,
+)
+
+
+class TestAllocationStrategies(unittest.TestCase):
+    def setUp(self):
+        self.checkin = datetime(2026, 3, 10, 14, tzinfo=timezone.utc)
+        self.checkout = datetime(2026, 3, 12, 11, tzinfo=timezone.utc)
+
+    def test_best_fit_prefers_the_smallest_surrounding_gaps(self):
+        rooms = [
+            FreeRoom("open"),
+            FreeRoom("after", next_checkin=self.checkout + timedelta(days=3)),
+            FreeRoom(
+                "between",
+                previous_checkout=self.checkin - timedelta(hours=3),
+                next_checkin=self.checkout + timedelta(hours=3),
+            ),
+        ]
+
+        self.assertEqual(
+            ["between", "after", "open"],
+            BestFitStrategy().rank(rooms, self.checkin, self.checkout),
+        )
+
+    def test_best_fit_caps_gaps_at_the_horizon_and_breaks_ties_randomly(self):
+        rooms = [
+            FreeRoom("r2", next_checkin=self.checkout + timedelta(days=30)),
+            FreeRoom("r1"),
+        ]
+
+        with patch("common.services.allocation.random.random", side_effect=[0.9, 0.1]):
+            ranked = BestFitStrategy().rank(rooms, self.checkin, self.checkout)
+
+        self.assertEqual(["r1", "r2"], ranked)
+
+    def test_equal_rooms_are_spread_over_concurrent_requests(self):
+        rooms = [FreeRoom(f"r{i}") for i in range(5)]
+
+        firsts = {
+            BestFitStrategy().rank(rooms, self.checkin, self.checkout)[0]
+            for _ in range(50)
+        }
+
+        self.assertGreater(len(firsts), 1)
+
+    def test_first_fit_keeps_only_the_rooms_it_read(self):
+        rooms = [FreeRoom("r2"), FreeRoom("r1")]
+
+        self.assertEqual(
+            {"r1", "r2"}, set(FirstFitStrategy().rank(rooms, self.checkin, self.checkout))
+        )
+
+    def test_get_allocation_strategy(self):
+        self.assertIsInstance(get_allocation_strategy("best_fit"), BestFitStrategy)
+        with self.assertRaises(ValueError):
+            get_allocation_strategy("worst_fit")
+
+
+if __name__ == "__main__":
+    unittest.main()
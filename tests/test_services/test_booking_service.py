@@ -1,12 +1,21 @@
 import unittest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone, timedelta
+from hashlib import sha256
 
 from common.services.booking_service import BookingService
-from common.models.bookings import BookingStatus
-from common.models.rooms import Category
+from common.models.bookings import BookingStatus, Hold
+from common.models.rooms import Category, FreeRoom
+from common.services.allocation import ALLOCATION_ATTEMPTS, FirstFitStrategy
 from common.schemas.bookings import BookingRequest
-from common.utils.custom_exceptions import NotFoundException, NoAvailableRooms
+from common.utils.custom_exceptions import (
+    InvalidBookingState,
+    InvalidDates,
+    IdempotencyKeyReused,
+    RoomTaken,
+    NotFoundException,
+    NoAvailableRooms,
+)
 
 
 class TestBookingService(unittest.TestCase):
@@ -15,13 +24,11 @@ class TestBookingService(unittest.TestCase):
         self.booking_repo = MagicMock()
         self.user_repo = MagicMock()
         self.room_repo = MagicMock()
-        self.scheduler = MagicMock()
 
         self.service = BookingService(
             booking_repo=self.booking_repo,
             user_repo=self.user_repo,
             room_repo=self.room_repo,
-            schedule_service=self.scheduler
         )
 
         self.user = MagicMock()
@@ -35,21 +42,17 @@ class TestBookingService(unittest.TestCase):
             checkout=now + timedelta(days=2),
         )
 
-    @patch("common.services.booking_service.random.choice", return_value="room42")
-    def test_add_booking_success(self, _):
+    def test_add_booking_success(self):
         self.user_repo.get_by_id.return_value = self.user
         self.room_repo.get_category_price.return_value = "1500"
-        self.room_repo.get_available_rooms.return_value = ["room42"]
+        self.room_repo.get_free_rooms.return_value = [FreeRoom("room42")]
 
         self.service.add_booking(self.req, "user-1")
 
         self.booking_repo.add_booking.assert_called_once()
-        self.scheduler.schedule_checkout.assert_called_once_with(
-            booking_id=unittest.mock.ANY,
-            user_id="user-1",
-            room_id="room42",
-            checkout_time=self.req.checkout,
-        )
+        booking = self.booking_repo.add_booking.call_args.args[0]
+        self.assertEqual("room42", booking.room_id)
+        self.assertEqual("user-1", booking.user_id)
 
     def test_add_booking_user_not_found(self):
         self.user_repo.get_by_id.return_value = None
@@ -67,27 +70,264 @@ class TestBookingService(unittest.TestCase):
     def test_add_booking_no_available_rooms(self):
         self.user_repo.get_by_id.return_value = self.user
         self.room_repo.get_category_price.return_value = "1500"
-        self.room_repo.get_available_rooms.return_value = []
+        self.room_repo.get_free_rooms.return_value = []
 
         with self.assertRaises(NoAvailableRooms):
             self.service.add_booking(self.req, "user-1")
 
-    def test_add_booking_without_scheduler(self):
-        service = BookingService(
-            booking_repo=self.booking_repo,
-            user_repo=self.user_repo,
-            room_repo=self.room_repo,
-            schedule_service=None
-        )
+    def _request_hash(self):
+        return sha256(self.req.model_dump_json().encode()).hexdigest()
+
+    def test_add_booking_replays_a_repeated_key(self):
+        self.booking_repo.get_idempotency_record.return_value = {
+            "booking_id": "b-first",
+            "request_hash": self._request_hash(),
+        }
 
+        self.assertEqual("b-first", self.service.add_booking(self.req, "user-1", "key-1"))
+
+        self.booking_repo.get_idempotency_record.assert_called_once_with("user-1", "key-1")
+        self.user_repo.get_by_id.assert_not_called()
+        self.room_repo.get_free_rooms.assert_not_called()
+        self.booking_repo.add_booking.assert_not_called()
+
+    def test_add_booking_key_reused_for_another_request(self):
+        self.booking_repo.get_idempotency_record.return_value = {
+            "booking_id": "b-first",
+            "request_hash": "other",
+        }
+
+        with self.assertRaises(IdempotencyKeyReused):
+            self.service.add_booking(self.req, "user-1", "key-1")
+
+    def test_add_booking_stores_new_key(self):
+        self.booking_repo.get_idempotency_record.return_value = None
         self.user_repo.get_by_id.return_value = self.user
         self.room_repo.get_category_price.return_value = "1500"
-        self.room_repo.get_available_rooms.return_value = ["room1"]
+        self.room_repo.get_free_rooms.return_value = [FreeRoom("room42")]
+        self.booking_repo.add_booking.return_value = True
 
-        service.add_booking(self.req, "user-1")
+        booking_id = self.service.add_booking(self.req, "user-1", "key-1")
 
-        self.booking_repo.add_booking.assert_called_once()
-        self.scheduler.schedule_checkout.assert_not_called()
+        booking, key, request_hash = self.booking_repo.add_booking.call_args.args
+        self.assertEqual((booking_id, "key-1"), (booking.booking_id, key))
+        self.assertEqual(self._request_hash(), request_hash)
+
+    def test_add_booking_concurrent_retry_returns_the_winner(self):
+        self.booking_repo.get_idempotency_record.side_effect = [
+            None,
+            {"booking_id": "b-first", "request_hash": self._request_hash()},
+        ]
+        self.user_repo.get_by_id.return_value = self.user
+        self.room_repo.get_category_price.return_value = "1500"
+        self.room_repo.get_free_rooms.return_value = [FreeRoom("room42")]
+        self.booking_repo.add_booking.return_value = False
+
+        self.assertEqual("b-first", self.service.add_booking(self.req, "user-1", "key-1"))
+
+    def test_hold_room_reserves_an_allocated_room(self):
+        self.user_repo.get_by_id.return_value = self.user
+        self.room_repo.get_category_price.return_value = "1500"
+        self.room_repo.get_free_rooms.return_value = [FreeRoom("room7")]
+        self.booking_repo.add_hold.return_value = True
+
+        hold = self.service.hold_room(self.req, "user-1")
+
+        self.assertEqual("room7", hold.room_id)
+        self.assertEqual(1500.0, hold.price_per_night)
+        remaining = hold.expires_at - datetime.now(timezone.utc)
+        self.assertTrue(timedelta(minutes=9) < remaining <= timedelta(minutes=10))
+        self.booking_repo.add_hold.assert_called_once_with(hold)
+
+    def test_hold_room_slot_taken(self):
+        self.user_repo.get_by_id.return_value = self.user
+        self.room_repo.get_category_price.return_value = "1500"
+        self.room_repo.get_free_rooms.return_value = [FreeRoom("room7")]
+        self.booking_repo.add_hold.return_value = False
+
+        with self.assertRaises(NoAvailableRooms):
+            self.service.hold_room(self.req, "user-1")
+
+    def _hold(self, user_id="user-1", expires_in=timedelta(minutes=5)):
+        return Hold(
+            hold_id="h1",
+            user_id=user_id,
+            room_id="room7",
+            category=Category.DELUXE,
+            checkin=self.req.checkin,
+            checkout=self.req.checkout,
+            price_per_night=1200.0,
+            expires_at=datetime.now(timezone.utc) + expires_in,
+        )
+
+    def test_confirm_hold_books_at_the_held_price(self):
+        self.booking_repo.get_hold.return_value = self._hold()
+        self.user_repo.get_by_id.return_value = self.user
+        self.booking_repo.convert_hold.return_value = True
+
+        booking_id = self.service.confirm_hold("h1", "user-1")
+
+        hold, booking = self.booking_repo.convert_hold.call_args.args
+        self.assertEqual(booking_id, booking.booking_id)
+        self.assertEqual("room7", booking.room_id)
+        self.assertEqual(1200.0, booking.price_per_night)
+        self.assertEqual("test@example.com", booking.user_email)
+        self.room_repo.get_free_rooms.assert_not_called()
+
+    def test_confirm_hold_rejects_missing_foreign_or_expired_holds(self):
+        self.user_repo.get_by_id.return_value = self.user
+        for hold in (None, self._hold(user_id="other"), self._hold(expires_in=timedelta(seconds=-1))):
+            with self.subTest(hold=hold):
+                self.booking_repo.get_hold.return_value = hold
+                with self.assertRaises(NotFoundException):
+                    self.service.confirm_hold("h1", "user-1")
+        self.booking_repo.convert_hold.assert_not_called()
+
+    def test_confirm_hold_lost_race(self):
+        self.booking_repo.get_hold.return_value = self._hold()
+        self.user_repo.get_by_id.return_value = self.user
+        self.booking_repo.convert_hold.return_value = False
+
+        with self.assertRaises(NotFoundException):
+            self.service.confirm_hold("h1", "user-1")
+
+    def _booking(self, status=BookingStatus.UPCOMING):
+        booking = MagicMock()
+        booking.user_id = "user-1"
+        booking.status = status
+        booking.checkin = self.req.checkin
+        return booking
+
+    def test_cancel_booking(self):
+        booking = self._booking()
+        self.booking_repo.get_booking_by_id.return_value = booking
+        self.booking_repo.cancel_booking.return_value = True
+
+        result = self.service.cancel_booking("b1", "user-1")
+
+        self.booking_repo.cancel_booking.assert_called_once_with(booking)
+        self.assertEqual(BookingStatus.CANCELLED, result.status)
+
+    def test_cancel_booking_of_another_guest(self):
+        self.booking_repo.get_booking_by_id.return_value = self._booking()
+        self.booking_repo.cancel_booking.return_value = True
+
+        with self.assertRaises(NotFoundException):
+            self.service.cancel_booking("b1", "user-2")
+        self.service.cancel_booking("b1", "manager-1", is_staff=True)
+
+        self.booking_repo.cancel_booking.assert_called_once()
+
+    def test_cancel_booking_not_upcoming(self):
+        self.booking_repo.get_booking_by_id.return_value = self._booking(
+            BookingStatus.CHECKED_IN
+        )
+
+        with self.assertRaises(InvalidBookingState):
+            self.service.cancel_booking("b1", "user-1")
+        self.booking_repo.cancel_booking.assert_not_called()
+
+    def test_cancel_booking_after_checkin(self):
+        booking = self._booking()
+        booking.checkin = datetime.now(timezone.utc) - timedelta(hours=2)
+        self.booking_repo.get_booking_by_id.return_value = booking
+
+        with self.assertRaises(InvalidBookingState):
+            self.service.cancel_booking("b1", "user-1")
+        self.booking_repo.cancel_booking.assert_not_called()
+
+    def _stay(self):
+        booking = self._booking(BookingStatus.CHECKED_IN)
+        booking.room_id = "room7"
+        booking.checkin = self.req.checkin
+        booking.checkout = self.req.checkout
+        return booking
+
+    def test_extend_stay_checks_only_the_added_nights(self):
+        booking = self._stay()
+        old_checkout = booking.checkout
+        new_checkout = old_checkout + timedelta(days=2)
+        self.booking_repo.get_booking_by_id.return_value = booking
+        self.room_repo.is_room_free.return_value = True
+        self.booking_repo.extend_booking.return_value = True
+
+        result = self.service.extend_stay("b1", "user-1", new_checkout)
+
+        self.room_repo.is_room_free.assert_called_once_with("room7", old_checkout, new_checkout)
+        self.booking_repo.extend_booking.assert_called_once_with(booking, new_checkout)
+        self.room_repo.get_free_rooms.assert_not_called()
+        self.assertEqual(new_checkout, result.checkout)
+
+    def test_extend_stay_room_taken(self):
+        booking = self._stay()
+        self.booking_repo.get_booking_by_id.return_value = booking
+        self.room_repo.is_room_free.return_value = False
+
+        with self.assertRaises(NoAvailableRooms):
+            self.service.extend_stay("b1", "user-1", booking.checkout + timedelta(days=1))
+        self.booking_repo.extend_booking.assert_not_called()
+
+    def test_extend_stay_rejects_bad_checkouts(self):
+        booking = self._stay()
+        self.booking_repo.get_booking_by_id.return_value = booking
+
+        for new_checkout in (booking.checkout, booking.checkin + timedelta(days=31)):
+            with self.subTest(new_checkout=new_checkout):
+                with self.assertRaises(InvalidDates):
+                    self.service.extend_stay("b1", "user-1", new_checkout)
+
+    def test_extend_stay_of_finished_booking(self):
+        booking = self._stay()
+        booking.status = BookingStatus.CHECKED_OUT
+        self.booking_repo.get_booking_by_id.return_value = booking
+
+        with self.assertRaises(InvalidBookingState):
+            self.service.extend_stay("b1", "user-1", booking.checkout + timedelta(days=1))
+
+    def _current_stay(self):
+        booking = self._stay()
+        now = datetime.now(timezone.utc)
+        booking.status = BookingStatus.UPCOMING
+        booking.checkin = now - timedelta(days=1)
+        booking.checkout = now + timedelta(days=2)
+        return booking
+
+    def test_early_checkout_in_one_write(self):
+        booking = self._current_stay()
+        old_checkout = booking.checkout
+        self.booking_repo.get_booking_by_id.return_value = booking
+        self.booking_repo.shorten_booking.return_value = True
+
+        result = self.service.early_checkout("b1", "user-1")
+
+        new_checkout = self.booking_repo.shorten_booking.call_args.args[1]
+        self.assertTrue(booking.checkin < new_checkout < old_checkout)
+        # status, room and housekeeping go in shorten_booking's transaction
+        self.booking_repo.update_booking_status.assert_not_called()
+        self.assertEqual((new_checkout, BookingStatus.CHECKED_OUT), (result.checkout, result.status))
+
+    def test_early_checkout_outside_the_stay(self):
+        booking = self._current_stay()
+        booking.checkin += timedelta(days=2)
+        self.booking_repo.get_booking_by_id.return_value = booking
+
+        with self.assertRaises(InvalidBookingState):
+            self.service.early_checkout("b1", "user-1")
+        self.booking_repo.shorten_booking.assert_not_called()
+
+    def test_early_checkout_of_someone_elses_booking(self):
+        self.booking_repo.get_booking_by_id.return_value = self._current_stay()
+
+        with self.assertRaises(NotFoundException):
+            self.service.early_checkout("b1", "user-2")
+
+    def test_early_checkout_lost_race(self):
+        self.booking_repo.get_booking_by_id.return_value = self._current_stay()
+        self.booking_repo.shorten_booking.return_value = False
+
+        with self.assertRaises(InvalidBookingState):
+            self.service.early_checkout("b1", "user-1")
+        self.booking_repo.update_booking_status.assert_not_called()
 
     def test_update_booking_calls_repo(self):
         self.service.update_booking(
@@ -118,20 +358,126 @@ class TestBookingService(unittest.TestCase):
         with self.assertRaises(NotFoundException):
             self.service.get_user_bookings("missing-user")
 
-    @patch("common.services.booking_service.random.choice", return_value="room99")
-    def test_allocate_room_picks_room(self, _):
-        self.room_repo.get_available_rooms.return_value = ["room1", "room99"]
+    @patch("common.services.booking_service.encode_cursor", return_value="next")
+    @patch("common.services.booking_service.decode_cursor")
+    def test_get_user_bookings_page(self, mock_decode, mock_encode):
+        self.user_repo.get_by_id.return_value = self.user
+        mock_decode.return_value = {"pk": "USER#user-1", "sk": "BOOKING#b0"}
+        self.booking_repo.get_user_bookings_page.return_value = (
+            ["b1"],
+            {"pk": "USER#user-1", "sk": "BOOKING#b1"},
+        )
+
+        bookings, next_cursor = self.service.get_user_bookings_page(
+            "user-1", limit=1, cursor="abc"
+        )
+
+        mock_decode.assert_called_once_with("abc")
+        self.booking_repo.get_user_bookings_page.assert_called_once_with(
+            "user-1",
+            limit=1,
+            exclusive_start_key={"pk": "USER#user-1", "sk": "BOOKING#b0"},
+        )
+        self.assertEqual(["b1"], bookings)
+        self.assertEqual("next", next_cursor)
+
+    def test_get_user_bookings_page_last_page_has_no_cursor(self):
+        self.user_repo.get_by_id.return_value = self.user
+        self.booking_repo.get_user_bookings_page.return_value = (["b1"], None)
+
+        bookings, next_cursor = self.service.get_user_bookings_page("user-1", limit=5)
+
+        self.booking_repo.get_user_bookings_page.assert_called_once_with(
+            "user-1", limit=5, exclusive_start_key=None
+        )
+        self.assertIsNone(next_cursor)
+
+    def test_get_user_bookings_page_user_not_found(self):
+        self.user_repo.get_by_id.return_value = None
+
+        with self.assertRaises(NotFoundException):
+            self.service.get_user_bookings_page("missing-user", limit=5)
+
+    def test_allocate_room_best_fit_by_default(self):
+        checkin, checkout = self.req.checkin, self.req.checkout
+        self.room_repo.get_free_rooms.return_value = [
+            FreeRoom("open"),
+            FreeRoom(
+                "hole",
+                previous_checkout=checkin - timedelta(days=2),
+                next_checkin=checkout + timedelta(days=1),
+            ),
+            FreeRoom("flush", previous_checkout=checkin),
+        ]
+
+        rooms = self.service._candidate_rooms(Category.DELUXE, self.req)
+
+        self.assertEqual("hole", rooms[0])
+        kwargs = self.room_repo.get_free_rooms.call_args.kwargs
+        self.assertIsNone(kwargs["limit"])
+        self.assertEqual(timedelta(days=7), kwargs["lookbehind"])
+
+    def test_candidate_rooms_first_fit_reads_only_a_few_rooms(self):
+        self.service.allocation_strategy = FirstFitStrategy()
+        self.room_repo.get_free_rooms.return_value = [FreeRoom("room99")]
+
+        rooms = self.service._candidate_rooms(Category.DELUXE, self.req)
+
+        self.assertEqual(["room99"], rooms)
+        self.room_repo.get_free_rooms.assert_called_once_with(
+            Category.DELUXE,
+            self.req.checkin,
+            self.req.checkout,
+            limit=ALLOCATION_ATTEMPTS,
+            lookbehind=timedelta(0),
+        )
+
+    def test_candidate_rooms_are_capped(self):
+        self.room_repo.get_free_rooms.return_value = [FreeRoom(f"r{i}") for i in range(10)]
+
+        rooms = self.service._candidate_rooms(Category.DELUXE, self.req)
+
+        self.assertEqual(ALLOCATION_ATTEMPTS, len(rooms))
+
+    def test_candidate_rooms_no_rooms(self):
+        self.room_repo.get_free_rooms.return_value = []
 
-        room = self.service._allocate_room(Category.DELUXE, self.req)
+        with self.assertRaises(NoAvailableRooms):
+            self.service._candidate_rooms(Category.DELUXE, self.req)
+
+    def _bookable(self, *room_ids):
+        self.user_repo.get_by_id.return_value = self.user
+        self.room_repo.get_category_price.return_value = "1500"
+        self.room_repo.get_free_rooms.return_value = [FreeRoom(r) for r in room_ids]
+
+    def test_add_booking_moves_on_when_the_room_is_taken(self):
+        self._bookable("r1", "r2")
+        self.booking_repo.add_booking.side_effect = [RoomTaken("r"), True]
+
+        self.service.add_booking(self.req, "user-1")
 
-        self.assertEqual(room, "room99")
-        self.room_repo.get_available_rooms.assert_called_once()
+        tried = [c.args[0].room_id for c in self.booking_repo.add_booking.call_args_list]
+        self.assertEqual(2, len(tried))
+        self.assertEqual({"r1", "r2"}, set(tried))
 
-    def test_allocate_room_no_rooms(self):
-        self.room_repo.get_available_rooms.return_value = []
+    def test_add_booking_all_candidates_taken(self):
+        self._bookable("r1", "r2")
+        self.booking_repo.add_booking.side_effect = RoomTaken("r")
 
         with self.assertRaises(NoAvailableRooms):
-            self.service._allocate_room(Category.DELUXE, self.req)
+            self.service.add_booking(self.req, "user-1")
+        self.assertEqual(2, self.booking_repo.add_booking.call_count)
+
+    def test_hold_room_moves_on_when_the_room_is_taken(self):
+        self._bookable("r1", "r2")
+        self.booking_repo.add_hold.side_effect = [False, True]
+
+        hold = self.service.hold_room(self.req, "user-1")
+
+        self.assertEqual(2, self.booking_repo.add_hold.call_count)
+        self.assertEqual(
+            hold.room_id, self.booking_repo.add_hold.call_args.args[0].room_id
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import MagicMock
+
+from common.repository.outbox_repo import OutboxRepository
+from common.services.outbox_service import OutboxProcessor
+
+
+class TestOutboxProcessor(unittest.TestCase):
+    def setUp(self):
+        self.repo = MagicMock()
+        self.scheduler = MagicMock()
+        self.processor = OutboxProcessor(self.repo, self.scheduler)
+        self.entries = [
+            OutboxRepository.schedule_checkout_item(
+                f"b{i}", "u1", f"r{i}", "2026-03-03T11:00:00.000000Z"
+            )
+            for i in range(3)
+        ]
+
+    def test_process_schedules_and_removes_entries(self):
+        self.assertEqual([True, True, True], self.processor.process(self.entries))
+
+        self.assertEqual(3, self.scheduler.schedule_checkout.call_count)
+        self.scheduler.schedule_checkout.assert_any_call(
+            booking_id="b1",
+            user_id="u1",
+            room_id="r1",
+            checkout_time="2026-03-03T11:00:00.000000Z",
+        )
+        self.assertEqual(3, self.repo.delete.call_count)
+
+    def test_failed_entry_is_kept_for_retry(self):
+        def schedule(booking_id, **_):
+            if booking_id == "b1":
+                raise RuntimeError("throttled")
+
+        self.scheduler.schedule_checkout.side_effect = schedule
+
+        self.assertEqual([True, False, True], self.processor.process(self.entries))
+        deleted = [call.args[0]["booking_id"] for call in self.repo.delete.call_args_list]
+        self.assertNotIn("b1", deleted)
+
+    def test_cancel_entry_deletes_the_schedule(self):
+        entry = OutboxRepository.cancel_checkout_item("b1")
+
+        self.assertEqual([True], self.processor.process([entry]))
+
+        self.scheduler.cancel_checkout.assert_called_once_with("b1")
+        self.repo.delete.assert_called_once_with(entry)
+
+    def test_unknown_action_fails(self):
+        self.assertEqual([False], self.processor.process([{"sk": "x", "action": "NOPE"}]))
+
+    def test_drain_applies_one_batch(self):
+        self.repo.get_pending.return_value = self.entries
+
+        self.assertEqual(3, self.processor.drain(batch_size=10))
+        self.repo.get_pending.assert_called_once_with(limit=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+
+from common.services import rate_limiter
+from common.services.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.repo = MagicMock()
+        self.limiter = RateLimiter(self.repo, "login_failure")
+        self.p_time = patch.object(rate_limiter.time, "time", return_value=125.0)
+        self.mock_time = self.p_time.start()
+
+    def tearDown(self):
+        self.p_time.stop()
+
+    def test_takes_a_token_from_the_current_window(self):
+        self.repo.take.return_value = True
+
+        self.assertTrue(self.limiter.allow("u@test.com"))
+
+        # login_failure refills every 60s: 125s is in window 2, which ends at 180s
+        self.repo.take.assert_called_once_with("login_failure#u@test.com", 2, 5, 180)
+
+    def test_empty_bucket_is_rejected_locally_until_refill(self):
+        self.repo.take.return_value = False
+
+        self.assertFalse(self.limiter.allow("u@test.com"))
+        self.assertFalse(self.limiter.allow("u@test.com"))
+        self.assertEqual(1, self.repo.take.call_count)
+
+        self.mock_time.return_value = 180.0
+        self.repo.take.return_value = True
+        self.assertTrue(self.limiter.allow("u@test.com"))
+        self.assertEqual(2, self.repo.take.call_count)
+
+    def test_keys_are_limited_separately(self):
+        self.repo.take.side_effect = [False, True]
+
+        self.assertFalse(self.limiter.allow("a@test.com"))
+        self.assertTrue(self.limiter.allow("b@test.com"))
+
+    def test_allows_when_the_table_errors(self):
+        self.repo.take.side_effect = ClientError(
+            {"Error": {"Code": "InternalServerError"}}, "UpdateItem"
+        )
+
+        self.assertTrue(self.limiter.allow("u@test.com"))
+
+    def test_expired_blocks_are_swept_when_full(self):
+        self.repo.take.return_value = False
+        self.limiter._blocked = {"stale": 60, "live": 240}
+
+        with patch.object(rate_limiter, "MAX_BLOCKED_KEYS", 2):
+            self.limiter.allow("u@test.com")
+
+        self.assertEqual({"live": 240, "u@test.com": 180}, self.limiter._blocked)
+
+    def test_exhausted_reads_without_counting(self):
+        self.repo.count.return_value = 4
+
+        self.assertFalse(self.limiter.exhausted("u@test.com"))
+
+        self.repo.count.assert_called_once_with("login_failure#u@test.com", 2)
+        self.repo.take.assert_not_called()
+
+    def test_exhausted_when_full_is_remembered_until_refill(self):
+        self.repo.count.return_value = 5
+
+        self.assertTrue(self.limiter.exhausted("u@test.com"))
+        self.assertTrue(self.limiter.exhausted("u@test.com"))
+        self.assertFalse(self.limiter.allow("u@test.com"))
+        self.assertEqual(1, self.repo.count.call_count)
+        self.repo.take.assert_not_called()
+
+    def test_exhausted_false_when_the_table_errors(self):
+        self.repo.count.side_effect = ClientError(
+            {"Error": {"Code": "InternalServerError"}}, "GetItem"
+        )
+
+        self.assertFalse(self.limiter.exhausted("u@test.com"))
+
+    def test_unknown_route(self):
+        with self.assertRaises(KeyError):
+            RateLimiter(self.repo, "nope")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,14 @@
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock
-from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+from datetime import date, datetime, timezone, timedelta
 
-from common.services.room_service import RoomService
-from common.models.rooms import Category, RoomStatus
-from common.utils.custom_exceptions import NoAvailableRooms, InvalidDates
+from common.services.room_service import RoomService, SEARCH_TTL_SECONDS
+from common.utils import cursor
+from common.models.rooms import Category, Room, RoomStatus
+from common.utils.custom_exceptions import NoAvailableRooms, InvalidDates, NotFoundException
 
 
 class TestRoomService(unittest.TestCase):
@@ -23,6 +27,198 @@ class TestRoomService(unittest.TestCase):
             RoomStatus.HOUSEKEEPING
         )
 
+    def test_add_rooms_reports_conflicts_and_repeated_ids(self):
+        rooms = [
+            Room(room_id="r1", category=Category.DELUXE),
+            Room(room_id="r2", category=Category.SUITE),
+            Room(room_id="r1", category=Category.SUITE),
+        ]
+        self.repo.add_rooms.return_value = (["r2"], [])
+
+        added, conflicts, failed = self.service.add_rooms(rooms)
+
+        sent = self.repo.add_rooms.call_args[0][0]
+        self.assertEqual(["r1", "r2"], [room.room_id for room in sent])
+        self.assertEqual(Category.DELUXE, sent[0].category)
+        self.assertEqual(["r1"], added)
+        self.assertEqual(["r2", "r1"], conflicts)
+        self.assertEqual([], failed)
+
+    def test_add_rooms_reports_failed_rooms_as_not_added(self):
+        rooms = [
+            Room(room_id="r1", category=Category.DELUXE),
+            Room(room_id="r2", category=Category.SUITE),
+        ]
+        self.repo.add_rooms.return_value = ([], ["r2"])
+
+        added, conflicts, failed = self.service.add_rooms(rooms)
+
+        self.assertEqual((["r1"], [], ["r2"]), (added, conflicts, failed))
+
+    def test_update_floor_status_resolves_rooms_by_floor(self):
+        self.repo.get_room_ids_by_floor.return_value = ["r1", "r2"]
+        self.repo.update_rooms_status.return_value = ["r1"]
+
+        updated = self.service.update_floor_status(
+            3, RoomStatus.HOUSEKEEPING, RoomStatus.AVAILABLE
+        )
+
+        self.assertEqual(["r1"], updated)
+        self.repo.get_room_ids_by_floor.assert_called_once_with(3)
+        self.repo.update_rooms_status.assert_called_once_with(
+            ["r1", "r2"], RoomStatus.HOUSEKEEPING, RoomStatus.AVAILABLE
+        )
+
+    def test_update_floor_status_unknown_floor(self):
+        self.repo.get_room_ids_by_floor.return_value = []
+
+        with self.assertRaises(NotFoundException):
+            self.service.update_floor_status(
+                9, RoomStatus.HOUSEKEEPING, RoomStatus.AVAILABLE
+            )
+
+    @patch.object(cursor, "CURSOR_SECRET", "testsecret")
+    def test_get_housekeeping_queue_round_trips_cursor(self):
+        self.repo.get_housekeeping_page.return_value = (["task"], {"pk": "HK#2026-03-02", "sk": "x"})
+
+        tasks, cursor = self.service.get_housekeeping_queue(date(2026, 3, 2), limit=5)
+        self.assertEqual(["task"], tasks)
+
+        self.repo.get_housekeeping_page.return_value = ([], None)
+        _, next_cursor = self.service.get_housekeeping_queue(
+            date(2026, 3, 2), limit=5, cursor=cursor
+        )
+
+        self.assertIsNone(next_cursor)
+        self.assertEqual(
+            {"pk": "HK#2026-03-02", "sk": "x"},
+            self.repo.get_housekeeping_page.call_args.kwargs["exclusive_start_key"],
+        )
+
+    def test_get_availability_queries_each_category(self):
+        checkin = datetime.now(timezone.utc) + timedelta(days=1)
+        checkout = checkin + timedelta(days=1)
+        self.repo.get_available_rooms.side_effect = (
+            lambda category, *_: ["r1"] if category == Category.DELUXE else []
+        )
+        self.repo.get_category_price.side_effect = lambda category: {
+            Category.DELUXE: 1500.0, Category.SUITE: 4000.0
+        }[category]
+
+        results = self.service.get_availability(
+            [Category.DELUXE, Category.SUITE], checkin, checkout
+        )
+
+        self.assertEqual([Category.DELUXE, Category.SUITE], [r.category for r in results])
+        self.assertEqual([["r1"], []], [r.room_ids for r in results])
+        self.assertEqual([1500.0, 4000.0], [r.price_per_night for r in results])
+
+    def test_get_availability_validates_dates_once(self):
+        checkin = datetime.now(timezone.utc) + timedelta(days=2)
+
+        with self.assertRaises(InvalidDates):
+            self.service.get_availability(list(Category), checkin, checkin)
+        self.repo.get_available_rooms.assert_not_called()
+
+    def _calendar_setup(self):
+        self.first_night = datetime.now(timezone.utc).date() + timedelta(days=1)
+        night = datetime(
+            self.first_night.year, self.first_night.month, self.first_night.day,
+            tzinfo=timezone.utc,
+        )
+        self.repo.get_in_service_room_ids.return_value = {"r1", "r2", "r3"}
+        self.repo.get_stays.return_value = [
+            ("r1", (night + timedelta(hours=14)).isoformat(),
+             (night + timedelta(days=2, hours=11)).isoformat()),
+            ("r9", (night + timedelta(hours=14)).isoformat(),
+             (night + timedelta(days=3, hours=11)).isoformat()),
+        ]
+
+    def test_get_calendar_counts_free_rooms_per_night(self):
+        self._calendar_setup()
+
+        calendar = self.service.get_calendar(Category.DELUXE, self.first_night, 3)
+
+        self.assertEqual([2, 2, 3], [night.free_rooms for night in calendar])
+        self.assertEqual(self.first_night, calendar[0].night)
+        self.repo.get_stays.assert_called_once()
+
+    def test_get_calendar_cached_per_night(self):
+        self._calendar_setup()
+
+        self.service.get_calendar(Category.DELUXE, self.first_night, 3)
+        cached = self.service.get_calendar(
+            Category.DELUXE, self.first_night + timedelta(days=1), 2
+        )
+
+        self.assertEqual([2, 3], [night.free_rooms for night in cached])
+        self.repo.get_stays.assert_called_once()
+
+    def test_get_calendar_refetches_uncached_nights(self):
+        self._calendar_setup()
+
+        self.service.get_calendar(Category.DELUXE, self.first_night, 2)
+        self.service.get_calendar(Category.DELUXE, self.first_night, 3)
+
+        self.assertEqual(2, self.repo.get_stays.call_count)
+
+    def test_get_calendar_rejects_past_start_and_long_horizon(self):
+        today = datetime.now(timezone.utc).date()
+        with self.assertRaises(InvalidDates):
+            self.service.get_calendar(Category.DELUXE, today - timedelta(days=1), 5)
+        with self.assertRaises(ValueError):
+            self.service.get_calendar(Category.DELUXE, today, 91)
+
+    def test_find_start_dates_requires_one_room_free_for_whole_stay(self):
+        start = datetime.now(timezone.utc).date() + timedelta(days=1)
+        base = datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
+
+        def stay(first, last_night):
+            return (
+                (base + timedelta(days=first, hours=14)).isoformat(),
+                (base + timedelta(days=last_night + 1, hours=11)).isoformat(),
+            )
+
+        self.repo.get_in_service_room_ids.return_value = {"r1", "r2", "r3"}
+        # r1 busy nights 0-1, r2 busy night 2; r3 always free
+        self.repo.get_stays.return_value = [
+            ("r1", *stay(0, 1)),
+            ("r2", *stay(2, 2)),
+        ]
+
+        options = self.service.find_start_dates(
+            Category.DELUXE, start, start + timedelta(days=3), nights=2
+        )
+
+        self.assertEqual(
+            [
+                (start + timedelta(days=3), 3),
+                (start, 2),
+                (start + timedelta(days=2), 2),
+                (start + timedelta(days=1), 1),
+            ],
+            [(option.checkin, option.free_rooms) for option in options],
+        )
+        self.assertEqual(start + timedelta(days=5), options[0].checkout)
+        self.repo.get_stays.assert_called_once()
+
+    def test_find_start_dates_limit_and_validation(self):
+        start = datetime.now(timezone.utc).date() + timedelta(days=1)
+        self.repo.get_in_service_room_ids.return_value = {"r1"}
+        self.repo.get_stays.return_value = []
+
+        options = self.service.find_start_dates(
+            Category.DELUXE, start, start + timedelta(days=9), nights=3, limit=2
+        )
+        self.assertEqual([start, start + timedelta(days=1)], [o.checkin for o in options])
+
+        with self.assertRaises(InvalidDates):
+            self.service.find_start_dates(Category.DELUXE, start, start - timedelta(days=1), 3)
+        with self.assertRaises(ValueError):
+            self.service.find_start_dates(Category.DELUXE, start, start, 31)
+        with self.assertRaises(ValueError):
+            self.service.find_start_dates(Category.DELUXE, start, start + timedelta(days=90), 3)
+
     def test_get_available_rooms_success(self):
         checkin = datetime.now(timezone.utc) + timedelta(days=1)
         checkout = checkin + timedelta(days=1)
@@ -39,6 +235,67 @@ class TestRoomService(unittest.TestCase):
         self.repo.get_available_rooms.assert_called_once()
         self.assertEqual(result, fake_rooms)
 
+    def _stay(self):
+        checkin = datetime.now(timezone.utc) + timedelta(days=1)
+        return checkin, checkin + timedelta(days=1)
+
+    def test_concurrent_identical_searches_share_one_query(self):
+        checkin, checkout = self._stay()
+        started, release = threading.Event(), threading.Event()
+
+        def slow_query(*_):
+            started.set()
+            release.wait(5)
+            return ["room1"]
+
+        self.repo.get_available_rooms.side_effect = slow_query
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(self.service.get_available_rooms, Category.DELUXE, checkin, checkout)
+            started.wait(5)
+            followers = [
+                pool.submit(self.service.get_available_rooms, Category.DELUXE, checkin, checkout)
+                for _ in range(3)
+            ]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in [leader, *followers]]
+
+        self.assertEqual([["room1"]] * 4, results)
+        self.repo.get_available_rooms.assert_called_once()
+
+    def test_search_result_is_reused_only_briefly(self):
+        checkin, checkout = self._stay()
+        self.repo.get_available_rooms.return_value = ["room1"]
+
+        with patch("common.services.room_service.time.monotonic", return_value=100.0) as clock:
+            self.service.get_available_rooms(Category.DELUXE, checkin, checkout)
+            self.service.get_available_rooms(Category.DELUXE, checkin, checkout)
+            self.assertEqual(1, self.repo.get_available_rooms.call_count)
+
+            clock.return_value = 100.0 + SEARCH_TTL_SECONDS
+            self.service.get_available_rooms(Category.DELUXE, checkin, checkout)
+            self.assertEqual(2, self.repo.get_available_rooms.call_count)
+
+    def test_different_searches_are_not_coalesced(self):
+        checkin, checkout = self._stay()
+        self.repo.get_available_rooms.return_value = ["room1"]
+
+        self.service.get_available_rooms(Category.DELUXE, checkin, checkout)
+        self.service.get_available_rooms(Category.SUITE, checkin, checkout)
+        self.service.get_available_rooms(Category.DELUXE, checkin, checkout + timedelta(days=1))
+
+        self.assertEqual(3, self.repo.get_available_rooms.call_count)
+
+    def test_failed_search_is_not_reused(self):
+        checkin, checkout = self._stay()
+        self.repo.get_available_rooms.side_effect = [RuntimeError("throttled"), ["room1"]]
+
+        with self.assertRaises(RuntimeError):
+            self.service.get_available_rooms(Category.DELUXE, checkin, checkout)
+        self.assertEqual(
+            ["room1"], self.service.get_available_rooms(Category.DELUXE, checkin, checkout)
+        )
+
     def test_get_available_rooms_checkout_before_checkin(self):
         checkin = datetime.now(timezone.utc) + timedelta(days=2)
         checkout = checkin - timedelta(days=1)
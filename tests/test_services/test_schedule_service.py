@@ -15,8 +15,12 @@ class TestSchedulerService(unittest.TestCase):
         class ConflictException(Exception):
             pass
 
+        class ResourceNotFoundException(Exception):
+            pass
+
         self.mock_client.exceptions = MagicMock()
         self.mock_client.exceptions.ConflictException = ConflictException
+        self.mock_client.exceptions.ResourceNotFoundException = ResourceNotFoundException
 
         mock_boto_client.return_value = self.mock_client
 
@@ -107,6 +111,18 @@ class TestSchedulerService(unittest.TestCase):
                 checkout_time=self.checkout_time
             )
 
+    def test_cancel_checkout_deletes_schedule(self):
+        self.assertTrue(self.service.cancel_checkout("b1"))
+
+        self.mock_client.delete_schedule.assert_called_once_with(Name="checkout-b1")
+
+    def test_cancel_checkout_already_gone(self):
+        self.mock_client.delete_schedule.side_effect = (
+            self.mock_client.exceptions.ResourceNotFoundException()
+        )
+
+        self.assertFalse(self.service.cancel_checkout("b1"))
+
 
 if __name__ == "__main__":
     unittest.main()
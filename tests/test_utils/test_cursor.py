@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+
+from common.utils import cursor
+from common.utils.cursor import encode_cursor, decode_cursor, parse_limit
+from common.utils.constants import MAX_PAGE_SIZE
+from common.utils.custom_exceptions import InvalidCursor
+
+
+class TestCursor(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(cursor, "CURSOR_SECRET", "testsecret")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_roundtrip(self):
+        key = {"pk": "USER#u1", "sk": "BOOKING#b1"}
+        self.assertEqual(key, decode_cursor(encode_cursor(key)))
+
+    def test_cursor_is_url_safe(self):
+        token = encode_cursor({"pk": "USER#u1", "sk": "BOOKING#b1?/+"})
+        self.assertNotIn("+", token)
+        self.assertNotIn("/", token)
+        self.assertNotIn("=", token)
+
+    def test_tampered_payload_rejected(self):
+        token = encode_cursor({"pk": "USER#u1", "sk": "BOOKING#b1"})
+        forged = encode_cursor({"pk": "USER#u2", "sk": "BOOKING#b1"})
+        tampered = forged.split(".")[0] + "." + token.split(".")[1]
+        with self.assertRaises(InvalidCursor):
+            decode_cursor(tampered)
+
+    def test_other_secret_rejected(self):
+        token = encode_cursor({"pk": "USER#u1", "sk": "BOOKING#b1"})
+        with patch.object(cursor, "CURSOR_SECRET", "othersecret"):
+            with self.assertRaises(InvalidCursor):
+                decode_cursor(token)
+
+    def test_garbage_rejected(self):
+        for value in ("", "abc", "abc.def", "!!!.???"):
+            with self.assertRaises(InvalidCursor):
+                decode_cursor(value)
+
+    def test_missing_secret_raises(self):
+        with patch.object(cursor, "CURSOR_SECRET", None):
+            with self.assertRaises(RuntimeError):
+                encode_cursor({"pk": "USER#u1"})
+
+
+
+class TestParseLimit(unittest.TestCase):
+    def test_valid_limit(self):
+        self.assertEqual(10, parse_limit("10"))
+
+    def test_rejects_non_integers_and_out_of_range(self):
+        for value in ("abc", None, "0", str(MAX_PAGE_SIZE + 1)):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_limit(value)
+
+if __name__ == "__main__":
+    unittest.main()
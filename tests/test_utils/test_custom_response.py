@@ -0,0 +1,76 @@
+import json
+import unittest
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+
+from pydantic_core import PydanticSerializationError
+
+from common.models.bookings import Booking
+from common.models.rooms import Category
+from common.models.users import UserRole
+from common.utils.custom_response import APIResponse, send_custom_response
+
+
+class TestCustomResponse(unittest.TestCase):
+    def _pydantic_body(self, status_code, message, data=None):
+        return APIResponse(
+            status_code=status_code, message=message, data=data
+        ).model_dump_json(exclude_none=True)
+
+    def _booking(self):
+        return Booking(
+            booking_id="b1",
+            user_id="u1",
+            user_email="test@example.com",
+            room_id="r1",
+            category=Category.DELUXE,
+            checkin=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            checkout=datetime(2026, 1, 2, 5, 30, 0, 123, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+            price_per_night=1500.0,
+            booked_at=datetime(2025, 12, 31, 10, 0, 0, 250000, tzinfo=timezone.utc),
+        )
+
+    def test_body_without_data_matches_pydantic(self):
+        resp = send_custom_response(400, "Request body is required")
+        self.assertEqual(self._pydantic_body(400, "Request body is required"), resp["body"])
+        self.assertNotIn("data", json.loads(resp["body"]))
+
+    def test_body_with_string_data_matches_pydantic(self):
+        resp = send_custom_response(200, "login successful", "token")
+        self.assertEqual(self._pydantic_body(200, "login successful", "token"), resp["body"])
+
+    def test_body_with_nested_payload_matches_pydantic(self):
+        data = {
+            "count": 2,
+            "bookings": [self._booking(), self._booking()],
+            "price": Decimal("1500.50"),
+            "role": UserRole.ADMIN,
+            "optional": None,
+            "rooms": ["r1", "r2"],
+            "note": "ünïcode \"quoted\"",
+        }
+        resp = send_custom_response(200, "ok", data)
+        self.assertEqual(self._pydantic_body(200, "ok", data), resp["body"])
+
+    def test_body_with_single_dataclass_matches_pydantic(self):
+        booking = self._booking()
+        resp = send_custom_response(200, "ok", booking)
+        self.assertEqual(self._pydantic_body(200, "ok", booking), resp["body"])
+
+    def test_body_with_non_string_keys_matches_pydantic(self):
+        data = {1: "a", 2: ["b"]}
+        resp = send_custom_response(200, "ok", data)
+        self.assertEqual(self._pydantic_body(200, "ok", data), resp["body"])
+
+    def test_headers_are_json(self):
+        resp = send_custom_response(200, "ok")
+        self.assertEqual(200, resp["statusCode"])
+        self.assertEqual("application/json", resp["headers"]["Content-Type"])
+
+    def test_unsupported_type_raises(self):
+        with self.assertRaises(PydanticSerializationError):
+            send_custom_response(200, "ok", {"obj": object()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,12 @@
 import unittest
-from datetime import datetime, timezone
-from common.utils.datetime_normaliser import from_iso_string
+from datetime import datetime, timezone, timedelta
+from common.utils.datetime_normaliser import (
+    TIMESTAMP_LENGTH,
+    from_iso_string,
+    normalise_timestamp,
+    to_epoch_seconds,
+    to_timestamp,
+)
 
 class TestDatetimeNormaliser(unittest.TestCase):
     def test_from_iso_string_with_timezone(self):
@@ -22,5 +28,37 @@ class TestDatetimeNormaliser(unittest.TestCase):
         with self.assertRaises(ValueError):
             from_iso_string(iso)
 
+    def test_to_timestamp_is_fixed_width_utc(self):
+        self.assertEqual(
+            "2026-01-29T06:00:00.000000Z",
+            to_timestamp(datetime(2026, 1, 29, 6, tzinfo=timezone.utc))
+        )
+        self.assertEqual(
+            "2026-01-29T06:00:00.123456Z",
+            to_timestamp("2026-01-29T11:30:00.123456+05:30")
+        )
+
+    def test_to_timestamp_naive_raises(self):
+        with self.assertRaises(ValueError):
+            to_timestamp(datetime(2026, 1, 29))
+
+    def test_to_timestamp_string_order_matches_time_order(self):
+        values = [
+            datetime(2026, 1, 29, 6, 0, 0, 1, tzinfo=timezone.utc),
+            datetime(2026, 1, 29, 6, tzinfo=timezone.utc),
+            datetime(2026, 1, 29, 12, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        ]
+        encoded = [to_timestamp(v) for v in values]
+        self.assertTrue(all(len(e) == TIMESTAMP_LENGTH for e in encoded))
+        self.assertEqual(sorted(values), [from_iso_string(e) for e in sorted(encoded)])
+
+    def test_normalise_timestamp_re_encodes_legacy_values(self):
+        canonical = "2026-01-29T06:00:00.000000Z"
+        self.assertIs(canonical, normalise_timestamp(canonical))
+        self.assertEqual(canonical, normalise_timestamp("2026-01-29T06:00:00+00:00"))
+
+    def test_to_epoch_seconds(self):
+        self.assertEqual(0, to_epoch_seconds("1970-01-01T00:00:00.000000Z"))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from datetime import date, datetime, timezone
+
+from common.utils.occupancy import free_starts, night_instant, nightly_occupancy, stay_nights
+
+
+def dt(day, hour=0):
+    return datetime(2026, 3, day, hour, tzinfo=timezone.utc)
+
+
+class TestNightlyOccupancy(unittest.TestCase):
+    def test_night_instant_is_closing_midnight(self):
+        self.assertEqual(dt(2), night_instant(date(2026, 3, 1)))
+
+    def test_afternoon_to_morning_stay_takes_one_night(self):
+        occupancy = nightly_occupancy([(dt(1, 14), dt(2, 11))], date(2026, 3, 1), 3)
+        self.assertEqual([1, 0, 0], occupancy)
+
+    def test_overlapping_stays_are_summed(self):
+        stays = [
+            (dt(1, 14), dt(4, 11)),
+            (dt(2, 14), dt(3, 11)),
+            (dt(3, 14), dt(6, 11)),
+        ]
+        occupancy = nightly_occupancy(stays, date(2026, 3, 1), 5)
+        self.assertEqual([1, 2, 2, 1, 1], occupancy)
+
+    def test_stays_outside_horizon_are_clipped(self):
+        stays = [
+            (dt(1, 14), dt(10, 11)),
+            (dt(20, 14), dt(21, 11)),
+        ]
+        occupancy = nightly_occupancy(stays, date(2026, 3, 5), 3)
+        self.assertEqual([1, 1, 1], occupancy)
+
+    def test_boundaries_are_half_open(self):
+        # checkin at the closing midnight counts, checkout at it does not
+        stays = [(dt(2), dt(3)), (dt(1, 12), dt(2))]
+        occupancy = nightly_occupancy(stays, date(2026, 3, 1), 2)
+        self.assertEqual([1, 0], occupancy)
+
+
+
+class TestStayNights(unittest.TestCase):
+    def test_same_nights_as_nightly_occupancy(self):
+        checkin, checkout = dt(1, 14), dt(4, 11)
+        occupancy = nightly_occupancy([(checkin, checkout)], date(2026, 3, 1), 5)
+        self.assertEqual([1, 1, 1, 0, 0], occupancy)
+        self.assertEqual(
+            [date(2026, 3, 1), date(2026, 3, 2), date(2026, 3, 3)],
+            stay_nights(checkin, checkout),
+        )
+
+    def test_boundaries_are_half_open(self):
+        self.assertEqual([date(2026, 3, 1)], stay_nights(dt(2), dt(3)))
+        self.assertEqual([], stay_nights(dt(2, 1), dt(2, 23)))
+
+
+class TestFreeStarts(unittest.TestCase):
+    def test_matches_brute_force(self):
+        occupancy = [0, 1, 0, 0, 0, 2, 0, 0, 1, 0]
+        for nights in range(1, 6):
+            expected = [
+                not any(occupancy[s:s + nights])
+                for s in range(len(occupancy) - nights + 1)
+            ]
+            self.assertEqual(expected, free_starts(occupancy, nights))
+
+    def test_stay_longer_than_horizon(self):
+        self.assertEqual([], free_starts([0, 0], 3))
+
+
+if __name__ == "__main__":
+    unittest.main()